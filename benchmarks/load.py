@@ -0,0 +1,284 @@
+"""Endpoint load test against a database seeded from the bundled CSVs.
+
+Seeds a SQLite file from ``assets/trm.csv`` and ``assets/inflation.csv`` with the
+bulk loader, then drives every API route with concurrent requests through the
+ASGI app in-process (no network, no external services) and reports throughput
+and p50/p99 latency per route.
+
+Results are compared with the stored baselines: a route regresses when its p50
+or p99 latency grows, or its throughput drops, by more than the tolerance, and
+the run exits with status 1. The stored baseline is a reference recorded on the
+machine described in its ``machine`` field; a run on other hardware or with other
+settings is still compared, with a warning, so record a baseline where the
+comparison has to be strict.
+
+Usage:
+    python -m benchmarks.load [--requests 300] [--concurrency 16] [--tolerance 0.35]
+    python -m benchmarks.load --update-baseline
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+_BATCH_DATES = [f"{year}-{month:02d}-15" for year in range(1995, 2025) for month in (1, 4, 7, 10)]
+
+
+@dataclass
+class Scenario:
+    method: str
+    route: str  # OpenAPI path template, used to check every route is covered
+    path: str
+    params: dict = field(default_factory=dict)
+    json: dict | None = None
+    headers: dict = field(default_factory=dict)
+    label: str = ""
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}" + (f" [{self.label}]" if self.label else "")
+
+
+SCENARIOS = [
+    Scenario("GET", "/health", "/health"),
+    Scenario("GET", "/health/live", "/health/live"),
+    Scenario("GET", "/health/ready", "/health/ready"),
+    Scenario("GET", "/v1/trm", "/v1/trm", {"page": 40, "size": 100}),
+    Scenario("GET", "/v1/trm", "/v1/trm", {"pagination": "cursor", "size": 100}, label="cursor"),
+    Scenario(
+        "GET",
+        "/v1/trm/by-date-range",
+        "/v1/trm/by-date-range",
+        {"start_date": "2010-01-01", "end_date": "2020-12-31", "page": 3, "size": 100},
+    ),
+    Scenario(
+        "GET",
+        "/v1/trm/by-date-range",
+        "/v1/trm/by-date-range",
+        {"start_date": "1991-01-01", "end_date": "2030-12-31", "size": 100},
+        headers={"Accept": "application/vnd.banrepco.columnar"},
+        label="columnar",
+    ),
+    Scenario(
+        "GET",
+        "/v1/trm/aggregate",
+        "/v1/trm/aggregate",
+        {"start_date": "1992-01-01", "end_date": "2024-12-31", "period": "month", "stat": "ohlc"},
+    ),
+    Scenario("GET", "/v1/trm/by-date", "/v1/trm/by-date", {"specific_date": "2023-06-30", "as_of": True}),
+    Scenario("POST", "/v1/trm/batch", "/v1/trm/batch", json={"dates": _BATCH_DATES, "as_of": True}),
+    Scenario(
+        "POST",
+        "/v1/trm/convert",
+        "/v1/trm/convert",
+        json={
+            "amounts": [100.0] * len(_BATCH_DATES),
+            "dates": _BATCH_DATES,
+            "directions": ["usd_to_cop", "cop_to_usd"] * (len(_BATCH_DATES) // 2),
+        },
+    ),
+    Scenario("GET", "/v1/trm/export", "/v1/trm/export"),
+    Scenario("GET", "/v1/inflation", "/v1/inflation", {"page": 2, "size": 100}),
+    Scenario("GET", "/v1/inflation", "/v1/inflation", {"pagination": "cursor", "size": 100}, label="cursor"),
+    Scenario("GET", "/v1/inflation/{year}/{month}", "/v1/inflation/2015/6"),
+    Scenario(
+        "GET",
+        "/v1/inflation/date-range",
+        "/v1/inflation/date-range",
+        {"start_year": 1990, "start_month": 1, "end_year": 2020, "end_month": 12, "size": 100},
+    ),
+    Scenario(
+        "POST",
+        "/v1/inflation/batch",
+        "/v1/inflation/batch",
+        json={"periods": [{"year": year, "month": month} for year in range(1960, 2025) for month in (3, 9)]},
+    ),
+    Scenario("GET", "/v1/inflation/export", "/v1/inflation/export"),
+]
+
+
+@dataclass
+class RouteResult:
+    requests: int
+    rps: float
+    p50_ms: float
+    p99_ms: float
+
+
+def uncovered_routes(app) -> list[str]:
+    """Get the documented routes no scenario exercises."""
+    covered = {(scenario.method, scenario.route) for scenario in SCENARIOS}
+    documented = {
+        (method.upper(), path) for path, operations in app.openapi()["paths"].items() for method in operations
+    }
+    return sorted(f"{method} {path}" for method, path in documented - covered)
+
+
+def seeded_app(database_path: str):
+    """Build the API app with its sessions bound to a SQLite file seeded from the CSVs."""
+    # The app reads its configuration at import time; no remote database is involved
+    os.environ.setdefault("ENVIRONMENT", "testing")
+    os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+    os.environ.setdefault("DATABASE_AUTH_TOKEN", "local")
+
+    from fastapi_pagination.utils import disable_installed_extensions_check
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from src.db.scripts.bulk_load import bulk_load
+    from src.db.session import database_session
+    from src.main import app
+    from src.models.base import Base
+    from src.stores.inflation import inflation_store
+    from src.stores.trm import trm_store
+
+    engine = create_engine(f"sqlite:///{database_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with session_local() as db_session:
+        for dataset in ("trm", "inflation"):
+            print(f"Seeded {dataset}: {bulk_load(db_session, dataset, f'assets/{dataset}.csv')}")
+    # Series loaded earlier in this process belong to another database
+    trm_store.invalidate()
+    inflation_store.invalidate()
+
+    def get_db():
+        db_session = session_local()
+        try:
+            yield db_session
+        finally:
+            db_session.close()
+
+    app.dependency_overrides[database_session.get_db] = get_db
+    app.dependency_overrides[database_session.get_session_factory] = lambda: session_local
+    disable_installed_extensions_check()
+    return app
+
+
+async def run_scenario(client, scenario: Scenario, requests: int, concurrency: int) -> RouteResult:
+    """Send ``requests`` requests for a scenario from ``concurrency`` concurrent workers."""
+    latencies = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.request(
+                scenario.method, scenario.path, params=scenario.params, json=scenario.json, headers=scenario.headers
+            )
+            await response.aread()
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise RuntimeError(f"{scenario.name} answered {response.status_code}: {response.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return RouteResult(
+        requests=requests,
+        rps=round(requests / elapsed, 1),
+        p50_ms=round(quantiles[49] * 1000, 3),
+        p99_ms=round(quantiles[98] * 1000, 3),
+    )
+
+
+async def run_load(app, requests: int, concurrency: int) -> dict[str, RouteResult]:
+    """Run every scenario in turn, after one warm-up request each, and collect the results."""
+    import httpx
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for scenario in SCENARIOS:
+            await run_scenario(client, scenario, requests=1, concurrency=1)
+            results[scenario.name] = await run_scenario(client, scenario, requests, concurrency)
+    return results
+
+
+def regressions(results: dict[str, RouteResult], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Compare results with a baseline and describe every metric worse than the tolerance allows."""
+    found = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            if getattr(result, metric) > expected[metric] * (1 + tolerance):
+                found.append(f"{name}: {metric} {getattr(result, metric):.2f} > baseline {expected[metric]:.2f}")
+        if result.rps < expected["rps"] * (1 - tolerance):
+            found.append(f"{name}: rps {result.rps:.1f} < baseline {expected['rps']:.1f}")
+    return found
+
+
+def machine() -> dict[str, str | int | None]:
+    """Describe the host a run happens on, stored with a baseline to tell where it comes from."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300, help="Requests per route")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients per route")
+    parser.add_argument("--tolerance", type=float, default=0.35, help="Allowed relative regression (0.35 = 35%%)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = seeded_app(os.path.join(directory, "benchmark.db"))
+        missing = uncovered_routes(app)
+        if missing:
+            sys.exit(f"Routes without a load scenario: {', '.join(missing)}")
+        results = asyncio.run(run_load(app, args.requests, args.concurrency))
+
+    print(f"\n{'route':<62} {'rps':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for name, result in results.items():
+        print(f"{name:<62} {result.rps:>9.1f} {result.p50_ms:>9.2f} {result.p99_ms:>9.2f}")
+
+    settings = {"requests": args.requests, "concurrency": args.concurrency}
+    if args.update_baseline:
+        payload = {
+            "machine": machine(),
+            "settings": settings,
+            "routes": {name: asdict(result) for name, result in results.items()},
+        }
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to record one")
+        return
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("machine") != machine():
+        print(f"\nWarning: reference baseline recorded on {baseline.get('machine')}, not on this machine")
+    if baseline["settings"] != settings:
+        print(f"\nWarning: baseline was recorded with {baseline['settings']}, not {settings}")
+
+    found = regressions(results, baseline["routes"], args.tolerance)
+    if found:
+        print(f"\nRegressions beyond {args.tolerance:.0%}:")
+        print("\n".join(f"  {regression}" for regression in found))
+        sys.exit(1)
+    print(f"\nNo regression beyond {args.tolerance:.0%} of the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Per-page serialization cost of the series read routes.
+
+Compares the response-model path (``paginate`` building models that FastAPI
+validates, dumps and JSON-encodes again) with the pre-serialized path that
+formats rows straight from the in-memory snapshot.
+
+Usage:
+    python -m benchmarks.serialization [--rows 10000] [--size 100] [--repeat 2000]
+"""
+
+import argparse
+import json
+import math
+import timeit
+from datetime import date, timedelta
+
+from fastapi_pagination import Page, Params, paginate
+from fastapi_pagination.utils import disable_installed_extensions_check
+from pydantic import TypeAdapter
+
+from src.routes.responses import json_page_response
+from src.schemas.inflation import InflationData
+from src.schemas.trm import TRMData
+from src.serializers.json import inflation_items, trm_items
+from src.stores.base import SeriesView
+from src.stores.inflation import InflationStore
+from src.stores.trm import TRMStore
+
+
+def response_model_body(adapter: TypeAdapter, view: SeriesView, params: Params) -> bytes:
+    """Serialize a page the way FastAPI does for a ``response_model`` route."""
+    content = adapter.dump_python(adapter.validate_python(paginate(view, params)), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def measure(label: str, func, repeat: int) -> float:
+    seconds = min(timeit.repeat(func, number=repeat, repeat=5)) / repeat
+    print(f"  {label:<16} {seconds * 1e6:10.1f} us/page")
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="Records in each synthetic series")
+    parser.add_argument("--size", type=int, default=100, help="Page size")
+    parser.add_argument("--repeat", type=int, default=2_000, help="Pages serialized per measurement")
+    args = parser.parse_args()
+    disable_installed_extensions_check()
+
+    first = date(1991, 11, 27)
+    trm_series = TRMStore(ttl_seconds=math.inf).replace(
+        (first + timedelta(days=i), 4000 + math.sin(i / 30) * 500) for i in range(args.rows)
+    )
+    inflation_series = InflationStore(ttl_seconds=math.inf).replace(
+        (1956 + i // 12, i % 12 + 1, 5 + math.cos(i / 12) * 3, 3.0 if i % 3 else None) for i in range(args.rows // 12)
+    )
+    params = Params(page=2, size=args.size)
+
+    cases = [
+        ("trm", TypeAdapter(Page[TRMData]), SeriesView(trm_series, 0, len(trm_series), descending=True), trm_items),
+        (
+            "inflation",
+            TypeAdapter(Page[InflationData]),
+            SeriesView(inflation_series, 0, len(inflation_series), descending=True),
+            inflation_items,
+        ),
+    ]
+    for name, adapter, view, encode_items in cases:
+        assert json.loads(response_model_body(adapter, view, params)) == json.loads(
+            json_page_response(view, params, encode_items).body
+        )
+        print(f"{name} (page of {args.size}):")
+        before = measure("response model", lambda: response_model_body(adapter, view, params), args.repeat)  # noqa: B023
+        after = measure("pre-serialized", lambda: json_page_response(view, params, encode_items), args.repeat)  # noqa: B023
+        print(f"  speedup          {before / after:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
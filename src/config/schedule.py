@@ -0,0 +1,6 @@
+# Cadence of the ingestion jobs registered in src/jobs/scheduler.py (scheduler local time).
+# HTTP cache lifetimes are derived from it, so keep both in sync through these constants.
+TRM_JOB_TIME = "00:00"
+
+INFLATION_JOB_WEEKDAY = "friday"
+INFLATION_JOB_TIME = "00:00"
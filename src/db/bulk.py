@@ -0,0 +1,92 @@
+from collections.abc import Iterable
+from itertools import batched
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from src.models.base import Base
+
+BULK_CHUNK_SIZE = 1000
+
+
+def insert_missing(
+    db_session: Session,
+    model: type[Base],
+    rows: Iterable[dict],
+    conflict_columns: list[str],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> int:
+    """Insert rows in executemany chunks, skipping the ones whose key already exists.
+
+    Conflicts are resolved by the unique index over ``conflict_columns`` (``ON CONFLICT DO
+    NOTHING``), so reruns and duplicates within ``rows`` are no-ops. Nothing is committed:
+    the caller owns the transaction, so a whole load can be applied or rolled back at once.
+
+    Args:
+        db_session: Database session the statements run in
+        model: Mapped class of the target table (Python-side defaults such as ids are applied)
+        rows: Column values of every row, consumed lazily
+        conflict_columns: Columns of the unique index identifying a row
+        chunk_size: Rows sent per executemany round trip
+
+    Returns:
+        Number of rows actually inserted
+    """
+    statement = insert(model.__table__).on_conflict_do_nothing(index_elements=conflict_columns)
+    # Core execution on the session's connection: a plain executemany whose rowcount counts the inserts
+    connection = db_session.connection()
+    inserted = 0
+    for chunk in batched(rows, chunk_size, strict=False):
+        result = connection.execute(statement, list(chunk))
+        inserted += max(result.rowcount, 0)
+
+    return inserted
+
+
+def update_by_key(
+    db_session: Session,
+    model: type[Base],
+    rows: Iterable[dict],
+    key_columns: list[str],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> int:
+    """Update rows in executemany chunks, matching each one on its key columns.
+
+    Every row holds the key columns plus the columns to set, and all rows must set the
+    same columns. As with :func:`insert_missing`, nothing is committed.
+
+    Args:
+        db_session: Database session the statements run in
+        model: Mapped class of the target table
+        rows: Key and new column values of every row, consumed lazily
+        key_columns: Columns identifying a row
+        chunk_size: Rows sent per executemany round trip
+
+    Returns:
+        Number of rows actually updated
+    """
+    table = model.__table__
+    connection = db_session.connection()
+    statement = None
+    updated = 0
+    for chunk in batched(rows, chunk_size, strict=False):
+        if statement is None:
+            # Key values are bound as "key_<column>" so they don't clash with the SET parameters
+            value_columns = [column for column in chunk[0] if column not in key_columns]
+            statement = (
+                update(table)
+                .where(*(table.c[column] == bindparam(f"key_{column}") for column in key_columns))
+                .values({column: bindparam(column) for column in value_columns})
+            )
+        parameters = [
+            {
+                **{f"key_{column}": row[column] for column in key_columns},
+                **{column: row[column] for column in value_columns},
+            }
+            for row in chunk
+        ]
+        result = connection.execute(statement, parameters)
+        updated += max(result.rowcount, 0)
+
+    return updated
@@ -0,0 +1,11 @@
+from sqlalchemy import func
+
+
+def db_now():
+    """SQL expression for the Unix time (in seconds) of the database clock.
+
+    Every node reads the same clock, so times written by processes on hosts with
+    skewed clocks still agree.
+    """
+    # SQLite julianday counts days since 4714 BC
+    return (func.julianday("now") - 2440587.5) * 86400.0
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import os
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import NamedTuple
+
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from src.db.clock import db_now
+from src.db.executor import run_in_db_thread
+from src.db.replica import ReplicaSync, replica_sync
+from src.models.data_version import DataVersion
+from src.stores.base import SeriesStore
+from src.stores.inflation import inflation_store
+from src.stores.trm import trm_store
+
+logger = logging.getLogger(__name__)
+
+TRM_SERIES = "trm"
+INFLATION_SERIES = "inflation"
+
+# How often API workers check whether a series changed (0 disables the check, stores then expire by TTL)
+DATA_VERSION_POLL_INTERVAL_SECONDS = float(os.environ.get("DATA_VERSION_POLL_INTERVAL_SECONDS", "2") or 0)
+
+_data_version_table = DataVersion.__table__
+
+
+class DataStamp(NamedTuple):
+    """Version of a series and the time (UTC) it was last written, as stored with it."""
+
+    version: int
+    modified_at: datetime | None
+
+
+def _stamp(version: int, modified_at: int | None) -> DataStamp:
+    return DataStamp(version, None if modified_at is None else datetime.fromtimestamp(modified_at, UTC))
+
+
+def bump_data_version(db_session: Session, series: str) -> DataStamp:
+    """Increment the version of a series and stamp its modification time within the caller's transaction.
+
+    Call it in the transaction that writes the series, before its commit, so the new
+    version and time become visible together with the data.
+
+    Args:
+        db_session: Session of the writing transaction
+        series: Name of the series written to
+
+    Returns:
+        The version and modification time the write will be seen at once committed
+    """
+    now = cast(db_now(), Integer)
+    statement = insert(_data_version_table).values(series=series, version=1, modified_at=now)
+    statement = statement.on_conflict_do_update(
+        index_elements=["series"],
+        set_={
+            "version": _data_version_table.c.version + 1,
+            # Validators have a one second resolution: a write within the same second still moves the time
+            "modified_at": func.max(now, func.coalesce(_data_version_table.c.modified_at, 0) + 1),
+        },
+    )
+    statement = statement.returning(_data_version_table.c.version, _data_version_table.c.modified_at)
+    return _stamp(*db_session.execute(statement).one())
+
+
+def read_data_versions(db_session: Session) -> dict[str, int]:
+    """Get the current version of every series ever written (a single small query)."""
+    return dict(db_session.execute(select(_data_version_table.c.series, _data_version_table.c.version)).all())
+
+
+def read_data_stamp(db_session: Session, series: str) -> DataStamp:
+    """Get the current version and modification time of a series.
+
+    A series never written through a versioned path is at version 0, with no modification time.
+    """
+    row = db_session.execute(
+        select(_data_version_table.c.version, _data_version_table.c.modified_at).where(
+            _data_version_table.c.series == series
+        )
+    ).one_or_none()
+    return _stamp(*row) if row is not None else DataStamp(0, None)
+
+
+class DataVersionPoller:
+    """Tells the in-memory stores the latest version of their series.
+
+    A store with a recently polled version reloads only once that version differs
+    from the one its snapshot was loaded at, instead of on a TTL.
+
+    Versions are read from the primary. When a local replica serves the reads of
+    this process, it is synced as soon as a version moves, before the stores hear
+    of it, so their reload finds the rows that version covers.
+    """
+
+    def __init__(self, stores: dict[str, SeriesStore], replica: ReplicaSync = replica_sync):
+        self.stores = stores
+        self.replica = replica
+        self._versions: dict[str, int] | None = None
+
+    def poll(self, db_session: Session) -> dict[str, int]:
+        """Read the current versions and hand them to the stores.
+
+        Args:
+            db_session: Session bound to the primary
+
+        Returns:
+            Current version of every series
+        """
+        versions = read_data_versions(db_session)
+        if versions != self._versions:
+            # A failed sync raises before the versions are recorded, so the next poll retries it
+            self.replica.sync()
+            self._versions = versions
+        for series, store in self.stores.items():
+            store.note_version(versions.get(series, 0))
+        return versions
+
+    async def run_forever(self, session_factory: Callable[[], Session], interval_seconds: float) -> None:
+        """Poll through sessions on the primary every ``interval_seconds`` until cancelled.
+
+        Failures are logged and retried on the next poll.
+        """
+        while True:
+            db_session = session_factory()
+            try:
+                await run_in_db_thread(self.poll, db_session)
+            except Exception as e:
+                logger.warning(f"[data-version] Poll failed: {e}")
+            finally:
+                await run_in_db_thread(db_session.close)
+            await asyncio.sleep(interval_seconds)
+
+
+data_version_poller = DataVersionPoller({TRM_SERIES: trm_store, INFLATION_SERIES: inflation_store})
@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine
 
 from src.config.enums import Environment
+from src.db.pool import TimedQueuePool
 
 load_dotenv()
 
@@ -25,12 +26,39 @@ def get_connect_args() -> dict:
     if not auth_token:
         raise ValueError("DATABASE_AUTH_TOKEN is required.")
 
+    # Sessions are used from the database worker threads (see src/db/executor.py),
+    # so a pooled connection may be checked out by a different thread each time.
     return {
         "auth_token": auth_token,
-        "check_same_thread": True,
+        "check_same_thread": False,
     }
 
 
+def get_pool_options() -> dict:
+    """Get the connection pool configuration from the environment.
+
+    The pool holds one connection per database worker thread by default, so
+    offloaded calls don't wait for each other under concurrency.
+    """
+
+    pool_size = int(os.environ.get("DB_POOL_SIZE", os.environ.get("DB_THREAD_POOL_SIZE", "8")))
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": int(os.environ.get("DB_POOL_MAX_OVERFLOW", "4")),
+        "pool_timeout": float(os.environ.get("DB_POOL_TIMEOUT_SECONDS", "30")),
+        # Remote connections are dropped by the server after a while when idle
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE_SECONDS", "1800")),
+        "pool_pre_ping": os.environ.get("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+    }
+
+
+def get_replica_path() -> str | None:
+    """Get the path of the local embedded replica file, or None when replica mode is off."""
+
+    return os.environ.get("DATABASE_REPLICA_PATH") or None
+
+
 def create_sync_engine():
     """Create a synchronous SQLAlchemy engine."""
 
@@ -40,7 +68,35 @@ def create_sync_engine():
         return create_engine(
             url=get_database_url(),
             connect_args=get_connect_args(),
+            **get_pool_options(),
+        )
+
+
+def create_replica_engine():
+    """Create a synchronous SQLAlchemy engine over a local embedded replica of the primary.
+
+    The replica is a plain SQLite file kept in sync with the remote primary by
+    libSQL, so reads are served from local disk. It only moves forward when
+    synced (see src/db/replica.py). Returns None unless DATABASE_REPLICA_PATH is set.
+    """
+
+    environment = os.environ.get("ENVIRONMENT")
+    replica_path = get_replica_path()
+
+    if environment != Environment.TESTING.value and replica_path:
+        database_url = os.environ.get("DATABASE_URL")
+        if not database_url:
+            raise ValueError("DATABASE_URL is required.")
+
+        return create_engine(
+            url=f"sqlite+libsql:///{os.path.abspath(replica_path)}",
+            connect_args={**get_connect_args(), "sync_url": database_url},
+            **get_pool_options(),
         )
 
 
+# Writes, migrations and ingestion always go to the primary
 db_engine = create_sync_engine()
+# Reads go to the local replica when one is configured
+db_replica_engine = create_replica_engine()
+db_read_engine = db_replica_engine or db_engine
@@ -17,7 +17,9 @@ if config.config_file_name is not None:
 from src.models.base import Base
 # add your model's MetaData object here
 # for 'autogenerate' support
+from src.models.data_version import DataVersion  # noqa: E402, F401 - registers the table for autogenerate
 from src.models.inflation import Inflation
+from src.models.scheduler_lease import SchedulerLease  # noqa: E402, F401 - registers the table for autogenerate
 
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
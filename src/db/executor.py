@@ -0,0 +1,28 @@
+import asyncio
+import contextvars
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# The libSQL driver is synchronous, so blocking database calls are offloaded to a
+# bounded pool of worker threads instead of running on the event loop.
+DB_THREAD_POOL_SIZE = int(os.environ.get("DB_THREAD_POOL_SIZE", "8"))
+
+db_executor = ThreadPoolExecutor(max_workers=DB_THREAD_POOL_SIZE, thread_name_prefix="db")
+
+
+async def run_in_db_thread[T](func: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking database call on the database thread pool and await its result.
+
+    Args:
+        func: Callable doing the blocking work
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        Whatever ``func`` returns
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(db_executor, partial(context.run, func, *args, **kwargs))
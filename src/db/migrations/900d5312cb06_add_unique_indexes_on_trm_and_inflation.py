@@ -0,0 +1,36 @@
+"""add unique indexes on trm date and inflation period
+
+Revision ID: 900d5312cb06
+Revises: 6e56d4d9e63d
+Create Date: 2026-10-18 10:12:41.204518
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "900d5312cb06"
+down_revision: str | Sequence[str] | None = "6e56d4d9e63d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the first inserted row of every duplicated date/period so the unique indexes can be built
+    op.execute(sa.text("DELETE FROM trm WHERE rowid NOT IN (SELECT MIN(rowid) FROM trm GROUP BY date)"))
+    op.execute(
+        sa.text("DELETE FROM inflation WHERE rowid NOT IN (SELECT MIN(rowid) FROM inflation GROUP BY year, month)")
+    )
+
+    op.create_index("ix_trm_date", "trm", ["date"], unique=True)
+    op.create_index("ix_inflation_year_month", "inflation", ["year", "month"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_inflation_year_month", table_name="inflation")
+    op.drop_index("ix_trm_date", table_name="trm")
@@ -0,0 +1,33 @@
+"""create data version table
+
+Revision ID: d2a8f5c61e47
+Revises: b7c41e9a2f03
+Create Date: 2026-10-18 17:24:38.902153
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a8f5c61e47"
+down_revision: str | Sequence[str] | None = "b7c41e9a2f03"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "data_version",
+        sa.Column("series", sa.String(length=32), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("series"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("data_version")
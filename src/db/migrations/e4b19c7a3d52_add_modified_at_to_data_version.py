@@ -0,0 +1,31 @@
+"""add modified at to data version
+
+Revision ID: e4b19c7a3d52
+Revises: d2a8f5c61e47
+Create Date: 2026-10-18 19:41:06.218734
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b19c7a3d52"
+down_revision: str | Sequence[str] | None = "d2a8f5c61e47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("data_version", sa.Column("modified_at", sa.Integer(), nullable=True))
+    # Series written before the column existed count as modified now, the same instant for every node
+    op.execute("UPDATE data_version SET modified_at = CAST((julianday('now') - 2440587.5) * 86400 AS INTEGER)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("data_version") as batch_op:
+        batch_op.drop_column("modified_at")
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy import Connection, Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from src.db.executor import run_in_db_thread
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics:
+    """Cumulative histogram of the time spent waiting for a pooled connection.
+
+    ``bucket_counts[i]`` counts the checkouts that waited at most ``CHECKOUT_WAIT_BUCKETS[i]``
+    seconds (non-cumulative; the last slot holds the ones above every bound).
+    """
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(CHECKOUT_WAIT_BUCKETS) + 1)
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record the wait of one checkout."""
+        with self._lock:
+            self.bucket_counts[bisect_left(CHECKOUT_WAIT_BUCKETS, seconds)] += 1
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up after the pool timeout."""
+        with self._lock:
+            self.timeouts += 1
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that measures how long every checkout waits for a connection.
+
+    The wait includes opening a new connection when the pool grows, which over the
+    remote libSQL link is the TLS and auth handshake.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "TimedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.observe(time.perf_counter() - started)
+
+
+def _open_validated_connection(engine: Engine) -> Connection:
+    connection = engine.connect()
+    connection.exec_driver_sql("SELECT 1")
+    return connection
+
+
+async def warm_up_pool(engine: Engine, connections: int) -> None:
+    """Open and validate pooled connections up front so the first requests don't pay for the handshakes.
+
+    The connections are opened concurrently on the database threads and all held until
+    every one is validated, so the pool ends up with ``connections`` distinct idle connections.
+
+    Args:
+        engine: Engine whose pool is warmed up
+        connections: Number of connections to open
+
+    Raises:
+        Exception: The first error raised while opening or validating a connection
+    """
+    opened = await asyncio.gather(
+        *(run_in_db_thread(_open_validated_connection, engine) for _ in range(connections)),
+        return_exceptions=True,
+    )
+    for connection in opened:
+        if isinstance(connection, Connection):
+            connection.close()
+
+    errors = [result for result in opened if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
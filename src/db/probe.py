@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.db.executor import run_in_db_thread
+from src.schemas.health import DatabaseHealthStatus
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PROBE_INTERVAL_SECONDS = float(os.environ.get("HEALTH_PROBE_INTERVAL_SECONDS", "5"))
+HEALTH_PROBE_TIMEOUT_SECONDS = float(os.environ.get("HEALTH_PROBE_TIMEOUT_SECONDS", "2"))
+# A cached result older than this is not trusted and the next readiness check probes inline
+HEALTH_PROBE_MAX_AGE_SECONDS = float(
+    os.environ.get("HEALTH_PROBE_MAX_AGE_SECONDS", str(3 * HEALTH_PROBE_INTERVAL_SECONDS))
+)
+
+
+def _round_trip(session_factory: Callable[[], Session]) -> None:
+    # Opened, used and closed by the same database thread: a probe that timed out
+    # still owns its session until the query returns, and nothing closes it from outside
+    db_session = session_factory()
+    try:
+        db_session.execute(text("SELECT 1"))
+    finally:
+        db_session.close()
+
+
+class DatabaseProbe:
+    """Latest result of a ``SELECT 1`` round trip to the database.
+
+    A background task refreshes it on an interval, so health checks read the
+    cached status instead of each sending a query of their own.
+    """
+
+    def __init__(self, timeout_seconds: float = HEALTH_PROBE_TIMEOUT_SECONDS):
+        self.timeout_seconds = timeout_seconds
+        self.status: DatabaseHealthStatus | None = None
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def age_seconds(self) -> float | None:
+        """Seconds since the last probe, or None when the database was never probed."""
+        checked_at = self._checked_at
+        return None if checked_at is None else time.monotonic() - checked_at
+
+    def reset(self) -> None:
+        """Forget the last result."""
+        self.status = None
+        self._checked_at = None
+
+    async def probe(self, session_factory: Callable[[], Session]) -> DatabaseHealthStatus:
+        """Run one probe on a new session and cache its result.
+
+        Args:
+            session_factory: Creates the session the query is sent through
+
+        Returns:
+            Connectivity status with the round trip latency
+        """
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                run_in_db_thread(_round_trip, session_factory),
+                timeout=self.timeout_seconds,
+            )
+            error = None
+        except TimeoutError:
+            error = f"Database did not answer within {self.timeout_seconds:g}s"
+        except Exception as e:
+            error = str(e)
+
+        status = DatabaseHealthStatus(
+            connected=error is None,
+            error=error,
+            latency_ms=round((time.perf_counter() - started) * 1000, 3),
+            checked_at=datetime.now(UTC),
+        )
+        self.status, self._checked_at = status, time.monotonic()
+        return status
+
+    async def current(
+        self, session_factory: Callable[[], Session], max_age_seconds: float = HEALTH_PROBE_MAX_AGE_SECONDS
+    ):
+        """Get the cached status, probing on a session from ``session_factory`` first when it is missing or too old.
+
+        Concurrent callers finding it outdated share a single probe.
+        """
+        age = self.age_seconds()
+        if age is not None and age <= max_age_seconds:
+            return self.status
+
+        async with self._lock:
+            age = self.age_seconds()
+            if age is not None and age <= max_age_seconds:
+                return self.status
+            return await self.probe(session_factory)
+
+    async def run_forever(self, session_factory: Callable[[], Session], interval_seconds: float) -> None:
+        """Probe the database every ``interval_seconds`` until cancelled."""
+        while True:
+            status = await self.probe(session_factory)
+            if not status.connected:
+                logger.warning(f"[health] Database probe failed: {status.error}")
+            await asyncio.sleep(interval_seconds)
+
+
+database_probe = DatabaseProbe()
@@ -0,0 +1,72 @@
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from src.db.db_engine import db_replica_engine
+
+logger = logging.getLogger(__name__)
+
+# Reloads of the in-memory series pull from the primary first unless the replica was synced this recently
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get("DATABASE_REPLICA_MAX_LAG_SECONDS", "60"))
+
+
+class ReplicaSync:
+    """Pulls the primary's changes into the local embedded replica and tracks how far behind it is.
+
+    Syncs are serialized; callers that find one running wait for it instead of starting another.
+    """
+
+    def __init__(self, engine: Engine | None):
+        self.engine = engine
+        self._synced_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.engine is not None
+
+    def serves(self, db_session: Session) -> bool:
+        """Check whether a session reads from the replica."""
+        return self.engine is not None and db_session.get_bind() is self.engine
+
+    def sync(self) -> None:
+        """Pull the frames written to the primary since the last sync (no-op without a replica)."""
+        if self.engine is None:
+            return
+
+        with self._lock:
+            started = time.monotonic()
+            connection = self.engine.raw_connection()
+            try:
+                connection.dbapi_connection.sync()
+            finally:
+                connection.close()
+            self._synced_at = time.time()
+            logger.info(f"[replica] Synced from the primary in {time.monotonic() - started:.3f}s")
+
+    def sync_if_older_than(self, max_age_seconds: float) -> None:
+        """Sync unless the replica was synced within the last ``max_age_seconds``.
+
+        A failed sync is logged rather than raised: the replica keeps serving what it has.
+        """
+        staleness = self.staleness_seconds()
+        if not self.enabled or (staleness is not None and staleness <= max_age_seconds):
+            return
+        try:
+            self.sync()
+        except Exception:
+            logger.exception("[replica] Sync from the primary failed, serving the local copy")
+
+    def staleness_seconds(self) -> float | None:
+        """Seconds since the last successful sync, or None when there is no replica or it was never synced."""
+        synced_at = self._synced_at
+        if self.engine is None or synced_at is None:
+            return None
+        return max(0.0, time.time() - synced_at)
+
+
+replica_sync = ReplicaSync(db_replica_engine)
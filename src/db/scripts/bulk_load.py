@@ -0,0 +1,164 @@
+"""Load the TRM and inflation CSV datasets into the database.
+
+Rows are streamed from the CSV, validated and inserted in executemany chunks
+inside a single transaction. Dates and periods already in the database are
+skipped, so the load can be rerun safely.
+
+Usage:
+    python -m src.db.scripts.bulk_load trm [--file assets/trm.csv] [--chunk-size 1000]
+    python -m src.db.scripts.bulk_load inflation [--file assets/inflation.csv]
+"""
+
+import argparse
+import csv
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from src.db.bulk import BULK_CHUNK_SIZE, insert_missing
+from src.db.data_version import bump_data_version
+from src.db.session import database_session
+from src.models.inflation import Inflation
+from src.models.trm import TRM
+from src.schemas.inflation import InflationData
+from src.schemas.trm import TRMData
+
+CSV_DATE_FORMAT = "%Y/%m/%d"
+
+
+class InvalidRowError(ValueError):
+    """A CSV row that cannot be loaded."""
+
+    def __init__(self, path: str, line: int, reason: str):
+        super().__init__(f"{path}:{line}: {reason}")
+
+
+@dataclass
+class LoadReport:
+    read: int
+    inserted: int
+    seconds: float
+
+    @property
+    def skipped(self) -> int:
+        return self.read - self.inserted
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.read / self.seconds if self.seconds > 0 else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.read} rows read, {self.inserted} inserted, {self.skipped} already present "
+            f"in {self.seconds:.2f}s ({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+def _csv_rows(path: str) -> Iterator[tuple[int, dict[str, str]]]:
+    with open(path, newline="") as file:
+        # Line 1 is the header
+        yield from enumerate(csv.DictReader(file), start=2)
+
+
+def read_trm_csv(path: str) -> Iterator[dict]:
+    """Stream the validated rows of a TRM CSV (``date,value`` with YYYY/MM/DD dates).
+
+    Raises:
+        InvalidRowError: On the first row that is not a valid TRM record
+    """
+    for line, row in _csv_rows(path):
+        try:
+            trm_data = TRMData(date=datetime.strptime(row["date"], CSV_DATE_FORMAT).date(), value=row["value"])
+        except (KeyError, TypeError, ValueError, ValidationError) as e:
+            raise InvalidRowError(path, line, str(e)) from e
+        yield {"date": trm_data.date, "value": trm_data.value}
+
+
+def read_inflation_csv(path: str) -> Iterator[dict]:
+    """Stream the validated rows of an inflation CSV (``date,target,inflation rate``, one row per month).
+
+    Raises:
+        InvalidRowError: On the first row that is not a valid inflation record
+    """
+    for line, row in _csv_rows(path):
+        try:
+            period = datetime.strptime(row["date"], CSV_DATE_FORMAT)
+            inflation_data = InflationData(
+                year=period.year,
+                month=period.month,
+                annual_inflation_rate=row["inflation rate"],
+                target=row["target"] or None,
+            )
+        except (KeyError, TypeError, ValueError, ValidationError) as e:
+            raise InvalidRowError(path, line, str(e)) from e
+        yield inflation_data.model_dump()
+
+
+DATASETS = {
+    "trm": (TRM, read_trm_csv, ["date"], "assets/trm.csv"),
+    "inflation": (Inflation, read_inflation_csv, ["year", "month"], "assets/inflation.csv"),
+}
+
+
+def bulk_load(db_session: Session, dataset: str, path: str, chunk_size: int = BULK_CHUNK_SIZE) -> LoadReport:
+    """Load a CSV dataset in a single transaction, skipping rows that already exist.
+
+    Args:
+        db_session: Database session the load runs in
+        dataset: Dataset to load ('trm' or 'inflation')
+        path: CSV file to read
+        chunk_size: Rows sent per executemany round trip
+
+    Returns:
+        Counts and throughput of the load
+
+    Raises:
+        InvalidRowError: If a row is invalid, in which case nothing is written
+    """
+    model, read_csv, conflict_columns, _ = DATASETS[dataset]
+    read = 0
+
+    def counted(rows: Iterator[dict]) -> Iterator[dict]:
+        nonlocal read
+        for row in rows:
+            read += 1
+            yield row
+
+    started = time.perf_counter()
+    try:
+        inserted = insert_missing(db_session, model, counted(read_csv(path)), conflict_columns, chunk_size)
+        if inserted:
+            bump_data_version(db_session, dataset)
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+
+    return LoadReport(read=read, inserted=inserted, seconds=time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load the TRM or inflation CSV dataset into the database.")
+    parser.add_argument("dataset", choices=sorted(DATASETS), help="Dataset to load")
+    parser.add_argument("--file", help="CSV file to read (defaults to the one in assets/)")
+    parser.add_argument("--chunk-size", type=int, default=BULK_CHUNK_SIZE, help="Rows per executemany round trip")
+    args = parser.parse_args()
+
+    path = args.file or DATASETS[args.dataset][3]
+    db_session = database_session.write_session_local()
+    try:
+        report = bulk_load(db_session, args.dataset, path, args.chunk_size)
+    except (OSError, InvalidRowError) as e:
+        raise SystemExit(f"Error loading {args.dataset} data: {e}") from e
+    finally:
+        db_session.close()
+
+    print(f"{args.dataset}: {report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,30 @@
-from typing import Generator
+from collections.abc import Generator
 
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.db.db_engine import db_engine
+from src.db.db_engine import db_engine, db_read_engine
 
 
 class DatabaseSession:
     """Database session manager."""
 
     def __init__(self):
-        """Initialize the session maker with the engine."""
+        """Initialize the session makers with the read and write engines.
+
+        Without a local replica both are bound to the primary.
+        """
         self.session_local = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=db_read_engine,
+        )
+        self.write_session_local = sessionmaker(
             autocommit=False,
             autoflush=False,
             bind=db_engine,
         )
 
-    def get_db(self) -> Generator[Session, None, None]:
+    def get_db(self) -> Generator[Session]:
         """Get a database session.
 
         Yields:
@@ -32,6 +40,26 @@ class DatabaseSession:
         finally:
             db.close()
 
+    def get_session_factory(self) -> sessionmaker:
+        """Get the factory of read sessions, for callers that open and close sessions themselves.
+
+        Note:
+            This method is designed to be used as a dependency in FastAPI.
+        """
+        return self.session_local
+
+    def get_write_db(self) -> Generator[Session]:
+        """Get a database session bound to the primary, for ingestion writes.
+
+        Yields:
+            Session: A SQLAlchemy session instance.
+        """
+        db = self.write_session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
 
 # Create a single instance to be used throughout the application
 database_session = DatabaseSession()
@@ -0,0 +1,127 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+# Statements running longer than this are logged (empty or 0 disables the log)
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", "500") or 0)
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DB_DIR = os.path.join(_SRC_DIR, "db")
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+def _statement_source() -> str:
+    """Locate the application code (e.g. a use case method) that issued the running statement."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_SRC_DIR) and not filename.startswith(_DB_DIR):
+            module = os.path.relpath(filename, os.path.dirname(_SRC_DIR))
+            return f"{module}:{frame.f_lineno} in {frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class SlowQueryLog:
+    """Logs the statements of an engine that run longer than a threshold.
+
+    Every entry carries the statement, its parameters, the code that issued it and
+    its ``EXPLAIN QUERY PLAN``. The plan is captured the first time a distinct
+    statement is slow and reused afterwards, so a hot slow statement costs one
+    extra query, not one per execution.
+    """
+
+    def __init__(self, threshold_ms: float, max_plans: int = 256):
+        self.threshold_seconds = threshold_ms / 1000
+        self.max_plans = max_plans
+        self._plans: OrderedDict[str, str] = OrderedDict()
+        # Statements run on the database threads concurrently; the LRU order must stay consistent
+        self._plans_lock = threading.Lock()
+
+    def install(self, engine: Engine) -> None:
+        """Listen to the statements of an engine."""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+    def _handle_error(self, exception_context):
+        # A failed statement never reaches after_cursor_execute; drop its start time
+        started = exception_context.connection.info.get("slow_query_started") if exception_context.connection else None
+        if started:
+            started.pop()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("slow_query_started")
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        if elapsed < self.threshold_seconds:
+            return
+
+        # executemany runs the same statement for every parameter set; the first one is representative
+        sample_parameters = parameters[0] if executemany and parameters else parameters
+        parameters_repr = repr(sample_parameters)
+        if executemany and len(parameters) > 1:
+            parameters_repr += f" (+{len(parameters) - 1} more sets)"
+
+        plan = self.query_plan(conn, statement, sample_parameters)
+        logger.warning(
+            f"[slow-query] {elapsed * 1000:.1f}ms (threshold {self.threshold_seconds * 1000:g}ms) "
+            f"from {_statement_source()}: {' '.join(statement.split())} "
+            f"| parameters={parameters_repr} | plan: {plan}"
+        )
+
+    def query_plan(self, conn, statement: str, parameters) -> str:
+        """Get the cached ``EXPLAIN QUERY PLAN`` of a statement, capturing it on first use."""
+        with self._plans_lock:
+            plan = self._plans.get(statement)
+            if plan is not None:
+                self._plans.move_to_end(statement)
+                return plan
+
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            plan = "n/a"
+        else:
+            try:
+                # A raw DBAPI cursor, so the EXPLAIN itself is neither timed nor logged
+                cursor = conn.connection.dbapi_connection.cursor()
+                try:
+                    cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+                    plan = " | ".join(str(row[-1]) for row in cursor.fetchall())
+                finally:
+                    cursor.close()
+            except Exception as e:
+                plan = f"unavailable ({e})"
+
+        with self._plans_lock:
+            self._plans[statement] = plan
+            if len(self._plans) > self.max_plans:
+                self._plans.popitem(last=False)
+        return plan
+
+
+def install_slow_query_log(engine: Engine, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS) -> SlowQueryLog | None:
+    """Log the slow statements of an engine, unless the threshold is 0 (disabled).
+
+    Args:
+        engine: Engine to watch
+        threshold_ms: Duration above which a statement is logged
+
+    Returns:
+        The installed log, or None when disabled
+    """
+    if threshold_ms <= 0:
+        return None
+    slow_query_log = SlowQueryLog(threshold_ms)
+    slow_query_log.install(engine)
+    return slow_query_log
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Callable
+
+from sqlalchemy import case, delete, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from src.db.clock import db_now
+from src.db.executor import run_in_db_thread
+from src.models.scheduler_lease import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+# A leader that stops renewing (crash, partition) is replaced at most this long after its last renewal
+SCHEDULER_LEASE_TTL_SECONDS = float(os.environ.get("SCHEDULER_LEASE_TTL_SECONDS", "30"))
+
+_lease_table = SchedulerLease.__table__
+
+
+def default_holder() -> str:
+    """Identify this process among every node running the scheduler."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    """Leadership over a named singleton, held through a row of the ``scheduler_lease`` table.
+
+    The leader renews the lease every third of its TTL. Others try to take it over
+    once it expires, so a leader that dies is replaced within one TTL of its last
+    renewal. Acquisition and renewal are a single conditional upsert, so exactly one
+    node can win a free or expired lease.
+
+    A leader only considers itself in charge until the TTL elapses from the start of
+    its last successful renewal. If it cannot reach the database, it steps down before
+    another node is allowed to take over.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        name: str = "scheduler",
+        holder: str | None = None,
+        ttl_seconds: float = SCHEDULER_LEASE_TTL_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.name = name
+        self.holder = holder or default_holder()
+        self.ttl_seconds = ttl_seconds
+        self.renew_interval_seconds = ttl_seconds / 3
+        self._valid_until = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process holds an unexpired lease."""
+        return time.monotonic() < self._valid_until
+
+    def try_acquire(self) -> float:
+        """Acquire the lease when free or expired, or renew it when already held.
+
+        Database errors are logged and count as a failed attempt.
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        started = time.monotonic()
+        was_leader = self.is_leader
+        try:
+            with self.session_factory() as db_session:
+                acquired, remaining = self._upsert(db_session)
+                db_session.commit()
+        except Exception as e:
+            logger.warning(f"[leader] Lease {self.name!r} could not be renewed: {e}")
+            # Keep the current deadline: a leader steps down once it passes
+            return min(self.renew_interval_seconds, 1.0)
+
+        if acquired:
+            self._valid_until = started + self.ttl_seconds
+            if not was_leader:
+                logger.info(f"[leader] {self.holder} acquired lease {self.name!r}")
+            return self.renew_interval_seconds
+
+        self._valid_until = 0.0
+        if was_leader:
+            logger.warning(f"[leader] {self.holder} lost lease {self.name!r}")
+        # Try again right after the current holder's lease runs out
+        return min(max(remaining, 0.0) + 0.05, self.ttl_seconds)
+
+    def _upsert(self, db_session: Session) -> tuple[bool, float]:
+        now = db_now()
+        statement = insert(_lease_table).values(
+            name=self.name, holder=self.holder, acquired_at=now, expires_at=now + self.ttl_seconds
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "holder": statement.excluded.holder,
+                "acquired_at": case(
+                    (_lease_table.c.holder == statement.excluded.holder, _lease_table.c.acquired_at),
+                    else_=statement.excluded.acquired_at,
+                ),
+                "expires_at": statement.excluded.expires_at,
+            },
+            # Only the holder renews; anyone may take over an expired lease
+            where=(_lease_table.c.holder == statement.excluded.holder) | (_lease_table.c.expires_at <= now),
+        )
+        if db_session.execute(statement).rowcount == 1:
+            return True, self.ttl_seconds
+
+        remaining = db_session.execute(
+            select(_lease_table.c.expires_at - now).where(_lease_table.c.name == self.name)
+        ).scalar()
+        return False, remaining or 0.0
+
+    def release(self) -> None:
+        """Give the lease up so another node can take over without waiting for it to expire."""
+        self._valid_until = 0.0
+        try:
+            with self.session_factory() as db_session:
+                db_session.execute(
+                    delete(_lease_table).where(_lease_table.c.name == self.name, _lease_table.c.holder == self.holder)
+                )
+                db_session.commit()
+        except Exception as e:
+            logger.warning(f"[leader] Lease {self.name!r} could not be released: {e}")
+
+    async def maintain(self) -> None:
+        """Keep acquiring or renewing the lease until cancelled."""
+        while True:
+            await asyncio.sleep(await run_in_db_thread(self.try_acquire))
@@ -1,13 +1,24 @@
+import asyncio
+import inspect
 import logging
+import os
 import signal
 import sys
-import time
-from pathlib import Path
 
+import httpx
 import schedule
 
+from src.config.schedule import INFLATION_JOB_TIME, INFLATION_JOB_WEEKDAY, TRM_JOB_TIME
+from src.db.db_engine import db_engine
+from src.db.session import database_session
+from src.db.slow_query_log import install_slow_query_log
+from src.jobs.leader import LeaderLease
+from src.jobs.tasks.backfill_trm import backfill_trm_job
 from src.jobs.tasks.get_daily_trm import get_daily_trm_job
 from src.jobs.tasks.get_monthly_inflation import get_monthly_inflation_job
+from src.jobs.tasks.http_client import create_http_client
+from src.metrics.db import instrument_engine
+from src.metrics.jobs import SCHEDULER_LEADER, start_metrics_server, timed_job
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,48 +27,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-LOCK_FILE = Path("/tmp/banrepco_scheduler.lock")
-
-
-def acquire_lock() -> bool:
-    if LOCK_FILE.exists():
-        return False
-    LOCK_FILE.write_text(str(sys.executable))
-    return True
-
-
-def release_lock() -> None:
-    if LOCK_FILE.exists():
-        LOCK_FILE.unlink()
-
-
-def register_jobs() -> None:
-    schedule.every().day.at("00:00").do(get_daily_trm_job)
-    logger.info("Daily TRM job registered — scheduled daily at 00:00")
-
-    schedule.every().friday.at("00:00").do(get_monthly_inflation_job)
-    logger.info("Monthly inflation job registered — scheduled every Friday at 00:00")
+# Port of the scheduler's own /metrics endpoint (empty to disable)
+SCHEDULER_METRICS_PORT = os.environ.get("SCHEDULER_METRICS_PORT", "9100")
+
+
+def register_jobs(client: httpx.AsyncClient) -> None:
+    schedule.every().day.at(TRM_JOB_TIME).do(timed_job("daily_trm", get_daily_trm_job), client)
+    logger.info(f"Daily TRM job registered — scheduled daily at {TRM_JOB_TIME}")
+
+    getattr(schedule.every(), INFLATION_JOB_WEEKDAY).at(INFLATION_JOB_TIME).do(
+        timed_job("monthly_inflation", get_monthly_inflation_job), client
+    )
+    logger.info(
+        f"Monthly inflation job registered — scheduled every {INFLATION_JOB_WEEKDAY.capitalize()} "
+        f"at {INFLATION_JOB_TIME}"
+    )
+
+
+async def run_pending_jobs(scheduler: schedule.Scheduler = schedule.default_scheduler) -> None:
+    """Run every due job concurrently and wait for all of them.
+
+    Jobs are coroutine functions: ``Job.run()`` reschedules the job and returns the
+    coroutine, so jobs due together (e.g. both fetchers) wait on BanRep in parallel.
+    A failing job is logged without affecting the others.
+    """
+    due = sorted(job for job in scheduler.jobs if job.should_run)
+    if not due:
+        return
+
+    runs = [job.run() for job in due]
+    results = await asyncio.gather(*(run for run in runs if inspect.isawaitable(run)), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Scheduled job failed", exc_info=result)
+
+
+async def scheduler_loop(lease: LeaderLease) -> None:
+    """Run the due jobs while this node holds the leader lease, and stand by otherwise.
+
+    Every node keeps its jobs registered, so a standby that takes over runs the jobs
+    the former leader left due. A job already running when the lease is lost is
+    allowed to finish; ingestion is idempotent.
+    """
+    maintainer = asyncio.create_task(lease.maintain())
+    try:
+        async with create_http_client() as client:
+            register_jobs(client)
+            leading = False
+            while True:
+                if lease.is_leader != leading:
+                    leading = lease.is_leader
+                    SCHEDULER_LEADER.set(int(leading))
+                    if leading:
+                        logger.info(f"Leading as {lease.holder} — running scheduled jobs")
+                        await run_startup_jobs(client)
+                    else:
+                        logger.warning(f"{lease.holder} is no longer the leader — standing by")
+                if leading:
+                    await run_pending_jobs()
+                await asyncio.sleep(1)
+    finally:
+        maintainer.cancel()
+
+
+async def run_startup_jobs(client: httpx.AsyncClient) -> None:
+    try:
+        # Repair days missed while no scheduler was leading before resuming the daily fetch
+        await timed_job("trm_backfill", backfill_trm_job)(client)
+    except Exception:
+        logger.exception("TRM backfill failed; missing days are retried on the next takeover")
 
 
 def run_scheduler() -> None:
-    if not acquire_lock():
-        logger.error("Another scheduler instance is running. Exiting.")
-        sys.exit(1)
-    logger.info("Scheduler started — singleton lock acquired")
+    lease = LeaderLease(database_session.write_session_local)
+    logger.info(f"Scheduler started as {lease.holder} — waiting for the leader lease")
 
     def cleanup(*_):
         logger.info("Shutting down scheduler...")
-        release_lock()
+        lease.release()
         sys.exit(0)
 
     signal.signal(signal.SIGTERM, cleanup)
     signal.signal(signal.SIGINT, cleanup)
 
-    register_jobs()
+    if db_engine is not None:
+        instrument_engine(db_engine, "primary")
+        install_slow_query_log(db_engine)
+    if SCHEDULER_METRICS_PORT:
+        start_metrics_server(int(SCHEDULER_METRICS_PORT))
 
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    asyncio.run(scheduler_loop(lease))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,170 @@
+"""Repair gaps in the stored TRM series from the BanRep SDMX history.
+
+The TRM has a value for every calendar day (weekends and holidays repeat the last
+business day). Days missing between the start of the series and today are grouped
+into a few date ranges, each fetched with one SDMX range query, and the
+observations are inserted in a single transaction. Stored days are never modified.
+
+Usage:
+    python -m src.jobs.tasks.backfill_trm [--since 1991-11-27] [--until 2025-01-31] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import datetime
+import logging
+import os
+from dataclasses import dataclass
+
+import httpx
+from sqlalchemy.orm import Session
+
+from src.db.session import database_session
+from src.jobs.tasks import get_daily_trm as daily_trm
+from src.jobs.tasks.http_client import create_http_client, with_retries
+from src.schemas.trm import TRMData
+from src.use_cases.trm import TRMUseCase
+
+logger = logging.getLogger(__name__)
+
+# First day the TRM was published
+TRM_SERIES_START = datetime.date(1991, 11, 27)
+# SDMX dataflow holding the full daily TRM history
+TRM_HISTORY_DATAFLOW = os.environ.get("TRM_HISTORY_DATAFLOW", "ESTAT,DF_TRM_DAILY_HIST,1.0")
+# Gaps closer than this are fetched with a single range query (stored days in between are skipped on insert)
+TRM_BACKFILL_MERGE_DAYS = int(os.environ.get("TRM_BACKFILL_MERGE_DAYS", "31"))
+
+
+@dataclass
+class BackfillReport:
+    missing_days: int
+    requests: int
+    fetched: int
+    inserted: int
+
+    def __str__(self) -> str:
+        return (
+            f"{self.missing_days} missing days, {self.requests} range requests, "
+            f"{self.fetched} observations fetched, {self.inserted} inserted"
+        )
+
+
+def merge_date_ranges(
+    ranges: list[tuple[datetime.date, datetime.date]], max_gap_days: int = TRM_BACKFILL_MERGE_DAYS
+) -> list[tuple[datetime.date, datetime.date]]:
+    """Merge sorted date ranges separated by fewer than ``max_gap_days`` days, to save requests.
+
+    Args:
+        ranges: Inclusive (first, last) ranges in date order
+        max_gap_days: Largest number of days between two ranges that still get merged
+
+    Returns:
+        The merged ranges, in date order
+    """
+    merged: list[tuple[datetime.date, datetime.date]] = []
+    for first, last in ranges:
+        if merged and (first - merged[-1][1]).days <= max_gap_days:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return merged
+
+
+async def get_trm_range(
+    client: httpx.AsyncClient, start_date: datetime.date, end_date: datetime.date
+) -> list[tuple[datetime.date, float]]:
+    """Fetch the TRM observations of a date range with one SDMX range query.
+
+    Args:
+        client: Shared HTTP client
+        start_date: First day of the range
+        end_date: Last day of the range
+
+    Returns:
+        (date, value) of the published observations within the range
+    """
+    url = f"{daily_trm.BANREP_WEB_SERVICE_URL}/{TRM_HISTORY_DATAFLOW}/"
+    params = {"startPeriod": start_date.isoformat(), "endPeriod": end_date.isoformat()}
+
+    async def fetch() -> list[tuple[datetime.date, float]]:
+        response = await client.get(url, params=params, headers=daily_trm._HEADERS)
+        response.raise_for_status()
+        observations = daily_trm.parse_trm_observations(response, skip_missing=True)
+        return [(day, value) for day, value in observations if start_date <= day <= end_date]
+
+    return await with_retries("backfill_trm", fetch)
+
+
+async def backfill_trm(
+    client: httpx.AsyncClient,
+    db_session: Session,
+    since: datetime.date = TRM_SERIES_START,
+    until: datetime.date | None = None,
+    dry_run: bool = False,
+) -> BackfillReport:
+    """Fetch and insert the TRM of every day missing from the database.
+
+    Args:
+        client: Shared HTTP client
+        db_session: Session on the primary database
+        since: First day expected to be stored
+        until: Last day expected to be stored (defaults to today)
+        dry_run: Only report the missing days and the requests that would be sent
+
+    Returns:
+        What was missing, fetched and inserted
+    """
+    until = until or datetime.date.today()
+    use_case = TRMUseCase(db_session)
+
+    missing = await use_case.find_missing_date_ranges(since, until)
+    missing_days = sum((last - first).days + 1 for first, last in missing)
+    ranges = merge_date_ranges(missing)
+    if dry_run or not ranges:
+        for first, last in ranges:
+            logger.info(f"[backfill_trm] Would request {first}..{last}")
+        return BackfillReport(missing_days, requests=len(ranges), fetched=0, inserted=0)
+
+    records = []
+    for first, last in ranges:
+        observations = await get_trm_range(client, first, last)
+        logger.info(f"[backfill_trm] {first}..{last}: {len(observations)} observations")
+        records.extend(TRMData(date=day, value=value) for day, value in observations)
+
+    inserted = await use_case.insert_trm_batch(records)
+    return BackfillReport(missing_days, requests=len(ranges), fetched=len(records), inserted=inserted)
+
+
+async def run_backfill(client: httpx.AsyncClient, **options) -> BackfillReport:
+    """Run the backfill on a new session on the primary database, then sync the local replica."""
+    db = next(database_session.get_write_db())
+    try:
+        report = await backfill_trm(client, db, **options)
+    finally:
+        db.close()
+
+    logger.info(f"[backfill_trm] {report}")
+    return report
+
+
+async def backfill_trm_job(client: httpx.AsyncClient) -> None:
+    await run_backfill(client)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fetch the TRM of the days missing from the database.")
+    parser.add_argument("--since", type=datetime.date.fromisoformat, default=TRM_SERIES_START)
+    parser.add_argument("--until", type=datetime.date.fromisoformat, default=None, help="Defaults to today")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the ranges that would be requested")
+    args = parser.parse_args()
+
+    async def run() -> BackfillReport:
+        async with create_http_client() as client:
+            return await run_backfill(client, since=args.since, until=args.until, dry_run=args.dry_run)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s")
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
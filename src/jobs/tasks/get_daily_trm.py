@@ -1,12 +1,12 @@
-import asyncio
 import datetime
 import logging
 import os
 
-import requests
+import httpx
 import xmltodict
 
 from src.db.session import database_session
+from src.jobs.tasks.http_client import with_retries
 from src.schemas.trm import TRMData
 from src.use_cases.trm import TRMUseCase
 
@@ -24,60 +24,81 @@ _HEADERS = {
 }
 
 
-def get_daily_trm() -> tuple[datetime.date, float]:
+def _observation_date(raw_date: str) -> datetime.date:
+    # The latest-value dataflow answers YYYYMMDD, range queries ISO dates
+    date_format = "%Y%m%d" if "-" not in raw_date else "%Y-%m-%d"
+    return datetime.datetime.strptime(raw_date, date_format).date()
+
+
+def parse_trm_observations(response: httpx.Response, skip_missing: bool = False) -> list[tuple[datetime.date, float]]:
+    """Parse the observations of an SDMX generic data message.
+
+    Args:
+        response: Response of the SDMX service
+        skip_missing: Drop observations without a value instead of failing
+
+    Returns:
+        (date, value) of every observation, in document order
+
+    Raises:
+        ValueError: The response is not XML, or an observation has no value
+        KeyError: The message does not have the expected structure
+    """
+    content_type = response.headers.get("Content-Type", "")
+    if "xml" not in content_type.lower():
+        raise ValueError(f"Unexpected Content-Type: {content_type}")
+
+    parsed = xmltodict.parse(response.text, process_namespaces=False)
+    series = parsed["message:GenericData"]["message:DataSet"].get("generic:Series")
+    if series is None:
+        # No observation in the requested period
+        return []
+    observations = series.get("generic:Obs", [])
+    # xmltodict collapses a single element into a dict
+    if isinstance(observations, dict):
+        observations = [observations]
+
+    parsed_observations = []
+    for obs in observations:
+        raw_date = obs["generic:ObsDimension"]["@value"]
+        raw_value = obs.get("generic:ObsValue", {}).get("@value")
+        if raw_value is None:
+            if skip_missing:
+                continue
+            raise ValueError("TRM value is null")
+        parsed_observations.append((_observation_date(raw_date), float(raw_value)))
+    return parsed_observations
+
+
+async def get_daily_trm(client: httpx.AsyncClient) -> tuple[datetime.date, float]:
     url = f"{BANREP_WEB_SERVICE_URL}/ESTAT,DF_TRM_DAILY_LATEST,1.0/"
 
-    for attempt in range(1, 4):
-        try:
-            response = requests.get(url, headers=_HEADERS, allow_redirects=True)
-            response.raise_for_status()
+    async def fetch() -> tuple[datetime.date, float]:
+        response = await client.get(url, headers=_HEADERS)
+        response.raise_for_status()
 
-            logger.info(f"[get_daily_trm] Attempt {attempt}/3 — status={response.status_code}, body_preview={response.text[:300]}")
-            content_type = response.headers.get("Content-Type", "")
-            if "xml" not in content_type.lower():
-                raise ValueError(f"Unexpected Content-Type: {content_type}")
+        logger.info(f"[get_daily_trm] status={response.status_code}, body_preview={response.text[:300]}")
+        observations = parse_trm_observations(response)
+        if not observations:
+            raise ValueError("No TRM observation in the response")
+        trm_date, trm_value = observations[-1]
+        logger.info(f"[get_daily_trm] Fetched TRM: date={trm_date}, value={trm_value}")
+        return trm_date, trm_value
 
-            parsed = xmltodict.parse(response.text, process_namespaces=False)
-            obs = (
-                parsed["message:GenericData"]
-                ["message:DataSet"]
-                ["generic:Series"]
-                ["generic:Obs"]
-            )
-            raw_date = obs["generic:ObsDimension"]["@value"]
-            raw_value = obs["generic:ObsValue"]["@value"]
+    return await with_retries("get_daily_trm", fetch)
 
-            if raw_value is None:
-                raise ValueError("TRM value is null")
 
-            trm_date = datetime.datetime.strptime(raw_date, "%Y%m%d").date()
-            trm_value = float(raw_value)
-            logger.info(f"[get_daily_trm] Fetched TRM: date={trm_date}, value={trm_value}")
-            return trm_date, trm_value
-
-        except (requests.RequestException, ValueError, KeyError) as exc:
-            logger.warning(f"[get_daily_trm] Attempt {attempt}/3 failed: {exc}")
-            if attempt == 3:
-                logger.error("[get_daily_trm] All 3 attempts exhausted")
-                raise
-
-    raise RuntimeError("unreachable")
-
-
-def insert_trm_into_db(trm_date: datetime.date, trm_value: float) -> None:
+async def insert_trm_into_db(trm_date: datetime.date, trm_value: float) -> None:
     trm_data = TRMData(date=trm_date, value=trm_value)
 
-    async def _insert():
-        db = next(database_session.get_db())
-        try:
-            use_case = TRMUseCase(db)
-            await use_case.insert_trm_data(trm_data)
-        finally:
-            db.close()
-
-    asyncio.run(_insert())
+    db = next(database_session.get_write_db())
+    try:
+        use_case = TRMUseCase(db)
+        await use_case.insert_trm_data(trm_data)
+    finally:
+        db.close()
 
 
-def get_daily_trm_job() -> None:
-    trm_date, trm_value = get_daily_trm()
-    insert_trm_into_db(trm_date, trm_value)
+async def get_daily_trm_job(client: httpx.AsyncClient) -> None:
+    trm_date, trm_value = await get_daily_trm(client)
+    await insert_trm_into_db(trm_date, trm_value)
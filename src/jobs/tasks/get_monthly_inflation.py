@@ -1,11 +1,11 @@
-import asyncio
 import logging
 import os
 from datetime import datetime
 
-import requests
+import httpx
 
 from src.db.session import database_session
+from src.jobs.tasks.http_client import with_retries
 from src.schemas.inflation import InflationData
 from src.use_cases.inflation import InflationUseCase
 
@@ -31,56 +31,60 @@ _HEADERS = {
 }
 
 
-def get_monthly_inflation() -> dict:
-    try:
-        response = requests.get(url=INFLATION_WEB_SERVICE_URL, headers=_HEADERS)
+def parse_inflation_series(data: dict) -> list[InflationData]:
+    """Parse every month of the BanRep inflation payload.
+
+    ``SERIES[0]`` holds the target and ``SERIES[1]`` the annual inflation rate, as
+    ``[timestamp_ms, value]`` points. Months without a target keep it as None.
+
+    Raises:
+        KeyError, IndexError, TypeError, ValueError: The payload does not have the expected structure
+    """
+
+    def by_period(points: list) -> dict[tuple[int, int], float | None]:
+        values = {}
+        for timestamp, value in points:
+            dt_object = datetime.fromtimestamp(timestamp / 1000)
+            values[(dt_object.year, dt_object.month)] = value
+        return values
+
+    series = data["SERIES"]
+    targets = by_period(series[0]["data"])
+    rates = by_period(series[1]["data"])
+
+    return [
+        InflationData(year=year, month=month, annual_inflation_rate=rate, target=targets.get((year, month)))
+        for (year, month), rate in sorted(rates.items())
+        if rate is not None
+    ]
+
+
+async def get_inflation_series(client: httpx.AsyncClient) -> list[InflationData]:
+    async def fetch() -> list[InflationData]:
+        response = await client.get(INFLATION_WEB_SERVICE_URL, headers=_HEADERS)
         response.raise_for_status()
-        data = response.json()
-        last_month_target = data.get("SERIES", {})[0].get("data").pop()
-        last_month_inflation = data.get("SERIES", {})[1].get("data").pop()
-
-        target = last_month_target[1]
-        inflation = last_month_inflation[1]
-
-        inflation_date_timestamp = last_month_inflation[0]
-        dt_object = datetime.fromtimestamp(inflation_date_timestamp / 1000)
-
-        inflation_data = {
-            "year": dt_object.year,
-            "month": dt_object.month,
-            "target": target,
-            "inflation": inflation,
-        }
-
-        logger.info(f"[get_monthly_inflation] Fetched data: {inflation_data}")
-        return inflation_data
-    except requests.RequestException as exc:
-        logger.error(f"[get_monthly_inflation] Request failed: {exc}")
-        raise
-    except ValueError as exc:
-        logger.error(f"[get_monthly_inflation] JSON decoding failed: {exc}")
-        raise
-
-
-def insert_monthly_inflation_into_db(inflation_data: dict) -> None:
-    inflation_data_obj = InflationData(
-        year=inflation_data["year"],
-        month=inflation_data["month"],
-        target=inflation_data["target"],
-        annual_inflation_rate=inflation_data["inflation"],
-    )
-
-    async def _insert():
-        db = next(database_session.get_db())
-        try:
-            use_case = InflationUseCase(db)
-            await use_case.insert_inflation_data(inflation_data_obj)
-        finally:
-            db.close()
-
-    asyncio.run(_insert())
-
-
-def get_monthly_inflation_job():
-    inflation_data = get_monthly_inflation()
-    insert_monthly_inflation_into_db(inflation_data)
+        records = parse_inflation_series(response.json())
+        if not records:
+            raise ValueError("Empty inflation series")
+
+        logger.info(f"[get_inflation_series] Fetched {len(records)} months, latest: {records[-1]}")
+        return records
+
+    return await with_retries("get_inflation_series", fetch)
+
+
+async def sync_inflation_into_db(records: list[InflationData]) -> tuple[int, int]:
+    db = next(database_session.get_write_db())
+    try:
+        use_case = InflationUseCase(db)
+        inserted, updated = await use_case.sync_inflation_series(records)
+    finally:
+        db.close()
+
+    logger.info(f"[sync_inflation] {len(records)} months downloaded: {inserted} inserted, {updated} updated")
+    return inserted, updated
+
+
+async def get_monthly_inflation_job(client: httpx.AsyncClient) -> None:
+    records = await get_inflation_series(client)
+    await sync_inflation_into_db(records)
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import os
+import random
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+FETCH_CONNECT_TIMEOUT_SECONDS = float(os.environ.get("FETCH_CONNECT_TIMEOUT_SECONDS", "5"))
+FETCH_READ_TIMEOUT_SECONDS = float(os.environ.get("FETCH_READ_TIMEOUT_SECONDS", "30"))
+FETCH_MAX_ATTEMPTS = int(os.environ.get("FETCH_MAX_ATTEMPTS", "3"))
+# Retry n waits a random time up to min(base * 2 ** (n - 1), max) ("full jitter")
+FETCH_BACKOFF_BASE_SECONDS = float(os.environ.get("FETCH_BACKOFF_BASE_SECONDS", "1"))
+FETCH_BACKOFF_MAX_SECONDS = float(os.environ.get("FETCH_BACKOFF_MAX_SECONDS", "30"))
+
+# Client errors other than these are not retried: the same request would fail again
+_RETRYABLE_STATUS_CODES = {408, 429}
+
+
+def create_http_client(
+    connect_timeout: float = FETCH_CONNECT_TIMEOUT_SECONDS,
+    read_timeout: float = FETCH_READ_TIMEOUT_SECONDS,
+) -> httpx.AsyncClient:
+    """Create the client shared by the fetchers, so connections to BanRep are pooled and reused.
+
+    Args:
+        connect_timeout: Seconds to wait for a connection (and for a pooled one to free up)
+        read_timeout: Seconds to wait for each chunk of a response (and write of a request)
+
+    Returns:
+        An async client; close it with ``aclose()`` or use it as an async context manager
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout, pool=connect_timeout),
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        follow_redirects=True,
+    )
+
+
+def backoff_seconds(
+    attempt: int,
+    base_seconds: float = FETCH_BACKOFF_BASE_SECONDS,
+    max_seconds: float = FETCH_BACKOFF_MAX_SECONDS,
+) -> float:
+    """Get a random wait before retrying after failed attempt number ``attempt`` (1-based)."""
+    return random.uniform(0, min(base_seconds * 2 ** (attempt - 1), max_seconds))
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Tell whether a failed fetch may succeed when repeated."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        return status_code >= 500 or status_code in _RETRYABLE_STATUS_CODES
+    # Transport errors (timeouts, refused or dropped connections) and unexpected payloads
+    return isinstance(exc, httpx.TransportError | ValueError | KeyError | TypeError | IndexError)
+
+
+async def with_retries[T](
+    name: str,
+    fetch: Callable[[], Awaitable[T]],
+    attempts: int = FETCH_MAX_ATTEMPTS,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> T:
+    """Run a fetch, retrying retryable failures with exponential backoff and jitter.
+
+    Args:
+        name: Name used in the log messages
+        fetch: Coroutine function doing one request and parsing its response
+        attempts: Maximum number of attempts
+        sleep: Coroutine function used to wait between attempts
+
+    Returns:
+        Whatever ``fetch`` returns
+
+    Raises:
+        Exception: The error of the last attempt, or of the first non-retryable one
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return await fetch()
+        except Exception as exc:
+            if not is_retryable(exc):
+                logger.error(f"[{name}] Attempt {attempt}/{attempts} failed and won't be retried: {exc!r}")
+                raise
+            if attempt == attempts:
+                logger.error(f"[{name}] All {attempts} attempts exhausted: {exc!r}")
+                raise
+            delay = backoff_seconds(attempt)
+            logger.warning(f"[{name}] Attempt {attempt}/{attempts} failed: {exc!r}; retrying in {delay:.2f}s")
+            await sleep(delay)
+
+    raise RuntimeError("unreachable")
@@ -1,15 +1,80 @@
+import asyncio
+import contextlib
 import json
+import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi_pagination import add_pagination
+from fastapi_pagination.utils import disable_installed_extensions_check
 from pydantic import ValidationError
 
+from src.db.data_version import DATA_VERSION_POLL_INTERVAL_SECONDS, data_version_poller
+from src.db.db_engine import db_engine, db_replica_engine
+from src.db.pool import warm_up_pool
+from src.db.probe import HEALTH_PROBE_INTERVAL_SECONDS, database_probe
+from src.db.session import database_session
+from src.db.slow_query_log import install_slow_query_log
+from src.metrics.db import instrument_engine
+from src.metrics.http import MetricsMiddleware, register_router_prefix
 from src.routes import health as health_router
+from src.routes import metrics as metrics_router
 from src.routes.v1 import inflation as inflation_router
 from src.routes.v1 import trm as trm_router
+from src.use_cases.inflation import InflationUseCase
+from src.use_cases.trm import TRMUseCase
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open and validate the pooled connections before serving, so the first
+    # requests after a deploy don't each pay the TLS and auth handshake.
+    for engine in (db_engine, db_replica_engine):
+        if engine is None:
+            continue
+        try:
+            await warm_up_pool(engine, engine.pool.size())
+        except Exception:
+            logger.exception("Could not warm up the database connection pool at startup")
+
+    # Warm the in-memory series so the first requests don't hit the database.
+    # A failure here is not fatal: the stores load lazily on first read.
+    db = database_session.session_local()
+    try:
+        await TRMUseCase(db).refresh_store()
+        await InflationUseCase(db).refresh_store()
+    except Exception:
+        logger.exception("Could not preload the in-memory series at startup")
+    finally:
+        db.close()
+
+    # Health checks read the result of this probe instead of querying the database themselves
+    background_tasks = [
+        asyncio.create_task(database_probe.run_forever(database_session.session_local, HEALTH_PROBE_INTERVAL_SECONDS))
+    ]
+    # The in-memory series reload as soon as the scheduler writes to them, instead of on their TTL.
+    # Versions are polled on the primary, which also tells when the local replica must sync.
+    if DATA_VERSION_POLL_INTERVAL_SECONDS > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                data_version_poller.run_forever(
+                    database_session.write_session_local, DATA_VERSION_POLL_INTERVAL_SECONDS
+                )
+            )
+        )
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 # override the default validation error handler
@@ -23,10 +88,22 @@ async def validation_exception_handler(request, exc):
     return JSONResponse(response, status_code=422)
 
 
+# Collect request and database metrics, served at /metrics, and log slow statements
+app.add_middleware(MetricsMiddleware)
+for engine_name, engine in (("primary", db_engine), ("replica", db_replica_engine)):
+    if engine is not None:
+        instrument_engine(engine, engine_name)
+        install_slow_query_log(engine)
+
 # Add routes
 app.include_router(health_router.router)
+app.include_router(metrics_router.router)
 app.include_router(inflation_router.router, prefix="/v1", tags=["inflation"])
 app.include_router(trm_router.router, prefix="/v1", tags=["trm"])
+register_router_prefix(inflation_router.router, "/v1")
+register_router_prefix(trm_router.router, "/v1")
 
 # Add pagination support
 add_pagination(app)
+# Series are paginated from in-memory sequences, not through the SQLAlchemy extension
+disable_installed_extensions_check()
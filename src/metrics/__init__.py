@@ -0,0 +1 @@
+# src/metrics package
@@ -0,0 +1,118 @@
+import re
+import time
+from collections.abc import Iterable
+from itertools import accumulate
+
+from prometheus_client import Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily, Metric
+from prometheus_client.registry import Collector
+from prometheus_client.utils import floatToGoString
+from sqlalchemy import Engine, event
+
+from src.db.pool import CHECKOUT_WAIT_BUCKETS, TimedQueuePool
+from src.db.probe import database_probe
+from src.db.replica import replica_sync
+from src.metrics.registry import registry
+
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Time spent executing database statements, by engine, operation and table",
+    ["engine", "operation", "table"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    registry=registry,
+)
+
+_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|TABLE)\s+\"?(\w+)", re.IGNORECASE)
+
+# Engines whose statements and pool are instrumented, by name
+_engines: dict[str, Engine] = {}
+
+
+def statement_labels(statement: str) -> tuple[str, str]:
+    """Get the (operation, table) labels of a SQL statement, e.g. ('SELECT', 'trm').
+
+    Statements are reduced to these two labels so the number of series stays bounded.
+    """
+    words = statement.lstrip().split(None, 1)
+    operation = words[0].upper() if words else ""
+    match = _TABLE.search(statement)
+    return operation, match.group(1).lower() if match else ""
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Time every statement an engine executes and export its pool metrics.
+
+    Args:
+        engine: Engine to instrument
+        name: Value of the ``engine`` label (e.g. 'primary', 'replica')
+    """
+    if name in _engines:
+        return
+    _engines[name] = engine
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("metrics_started")
+        if not started:
+            return
+        operation, table = statement_labels(statement)
+        elapsed = time.perf_counter() - started.pop()
+        DB_STATEMENT_DURATION.labels(engine=name, operation=operation, table=table).observe(elapsed)
+
+    def handle_error(exception_context):
+        started = exception_context.connection.info.get("metrics_started") if exception_context.connection else None
+        if started:
+            started.pop()
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
+
+
+class DatabaseCollector(Collector):
+    """Metrics read at scrape time from the pools, the replica and the health probe."""
+
+    def collect(self) -> Iterable[Metric]:
+        pools = [(name, engine.pool) for name, engine in _engines.items() if isinstance(engine.pool, TimedQueuePool)]
+
+        checkout_wait = HistogramMetricFamily(
+            "db_pool_checkout_wait_seconds",
+            "Time spent waiting for a pooled database connection (including opening new ones)",
+            labels=["engine"],
+        )
+        checkout_timeouts = CounterMetricFamily(
+            "db_pool_checkout_timeouts", "Checkouts that gave up after the pool timeout", labels=["engine"]
+        )
+        connections_in_use = GaugeMetricFamily(
+            "db_pool_connections_in_use", "Pooled database connections currently checked out", labels=["engine"]
+        )
+        bounds = [floatToGoString(bound) for bound in (*CHECKOUT_WAIT_BUCKETS, float("inf"))]
+        for name, pool in pools:
+            metrics = pool.metrics
+            cumulative = list(accumulate(metrics.bucket_counts))
+            checkout_wait.add_metric([name], list(zip(bounds, cumulative, strict=True)), metrics.wait_seconds_total)
+            checkout_timeouts.add_metric([name], metrics.timeouts)
+            connections_in_use.add_metric([name], pool.checkedout())
+        yield from (checkout_wait, checkout_timeouts, connections_in_use)
+
+        replica_lag = GaugeMetricFamily(
+            "db_replica_lag_seconds", "Seconds since the local database replica last synced from the primary"
+        )
+        staleness = replica_sync.staleness_seconds()
+        if staleness is not None:
+            replica_lag.add_metric([], staleness)
+        yield replica_lag
+
+        probe_latency = GaugeMetricFamily(
+            "db_health_probe_latency_seconds", "Round trip of the last background database health probe"
+        )
+        status = database_probe.status
+        if status is not None and status.latency_ms is not None:
+            probe_latency.add_metric([], status.latency_ms / 1000)
+        yield probe_latency
+
+
+registry.register(DatabaseCollector())
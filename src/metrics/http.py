@@ -0,0 +1,87 @@
+import time
+
+from fastapi import APIRouter
+from prometheus_client import Gauge, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.metrics.registry import registry
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve HTTP requests, until the last body byte is sent",
+    ["method", "route", "status"],
+    registry=registry,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    registry=registry,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Size of HTTP response bodies",
+    ["method", "route", "status"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000),
+    registry=registry,
+)
+
+
+# Prefix each router was included under, keyed by id() of the routes it declares (routes are unhashable)
+_include_prefixes: dict[int, str] = {}
+
+
+def register_router_prefix(router: APIRouter, prefix: str) -> None:
+    """Remember the prefix a router is included in the app under, for its route templates.
+
+    Depending on the FastAPI version, a request reports either a copy of the route
+    carrying the full path or the router's own route, whose path lacks the prefix.
+    """
+    for route in router.routes:
+        _include_prefixes[id(route)] = prefix
+
+
+def route_template(scope: Scope) -> str:
+    """Get the path template of the route that served a request, e.g. ``/v1/inflation/{year}/{month}``."""
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None)
+    if path_format is None:
+        return "unmatched"
+    return _include_prefixes.get(id(route), "") + path_format
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, in-flight count and body size of every HTTP request.
+
+    Requests are labelled by route template (e.g. ``/v1/inflation/{year}/{month}``), not by
+    raw path, so the number of series stays bounded; unmatched paths share one label.
+    Streaming responses are measured until their last chunk.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            labels = {"method": scope["method"], "route": route_template(scope), "status": str(status)}
+            HTTP_REQUEST_DURATION.labels(**labels).observe(time.perf_counter() - started)
+            HTTP_RESPONSE_SIZE.labels(**labels).observe(size)
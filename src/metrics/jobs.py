@@ -0,0 +1,99 @@
+import contextlib
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+from wsgiref.simple_server import WSGIServer
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+from src.metrics.registry import registry
+
+logger = logging.getLogger(__name__)
+
+JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds",
+    "Duration of scheduled job runs",
+    ["job"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+    registry=registry,
+)
+JOB_RUNS = Counter(
+    "scheduler_job_runs",
+    "Scheduled job runs by outcome",
+    ["job", "outcome"],
+    registry=registry,
+)
+JOB_LAST_SUCCESS = Gauge(
+    "scheduler_job_last_success_timestamp_seconds",
+    "Unix time of the last successful run of each job",
+    ["job"],
+    registry=registry,
+)
+SCHEDULER_LEADER = Gauge(
+    "scheduler_leader",
+    "1 while this scheduler process holds the leader lease and runs the jobs, 0 on standby",
+    registry=registry,
+)
+
+
+@contextlib.contextmanager
+def _recorded_run(name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        JOB_RUNS.labels(job=name, outcome="failure").inc()
+        raise
+    else:
+        JOB_RUNS.labels(job=name, outcome="success").inc()
+        JOB_LAST_SUCCESS.labels(job=name).set_to_current_time()
+    finally:
+        JOB_DURATION.labels(job=name).observe(time.perf_counter() - started)
+
+
+def timed_job(name: str, job: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a scheduled job so its duration and outcome are recorded.
+
+    Exceptions are recorded as a failed run and re-raised unchanged. Coroutine
+    functions are wrapped in a coroutine function timing the awaited run.
+
+    Args:
+        name: Value of the ``job`` label
+        job: Job function
+
+    Returns:
+        The wrapped job
+    """
+    if inspect.iscoroutinefunction(job):
+
+        @functools.wraps(job)
+        async def run_async(*args, **kwargs) -> None:
+            with _recorded_run(name):
+                await job(*args, **kwargs)
+
+        return run_async
+
+    @functools.wraps(job)
+    def run(*args, **kwargs) -> None:
+        with _recorded_run(name):
+            job(*args, **kwargs)
+
+    return run
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> WSGIServer:
+    """Serve the registry at ``/metrics`` from a daemon thread, for processes without an ASGI app.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        host: Interface to bind
+
+    Returns:
+        The running server (``server.server_address`` holds the bound port)
+    """
+    server, _ = start_http_server(port, addr=host, registry=registry)
+    logger.info(f"Metrics served at http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -0,0 +1,7 @@
+from prometheus_client import CollectorRegistry, disable_created_metrics
+
+# Counters and histograms would otherwise export a `_created` timestamp series each
+disable_created_metrics()
+
+# Metrics of this process, served at /metrics by the API and by the scheduler's exporter
+registry = CollectorRegistry()
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String
+
+from src.models.base import Base
+
+
+class DataVersion(Base):
+    """Counter bumped in the same transaction as every write to a series.
+
+    ``modified_at`` is the Unix time (whole seconds, database clock) of the latest bump.
+    """
+
+    __tablename__ = "data_version"
+
+    series = Column(String(32), primary_key=True)
+    version = Column(Integer, nullable=False)
+    modified_at = Column(Integer, nullable=True)
@@ -1,12 +1,13 @@
 import uuid
 
-from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy import Column, Float, Index, Integer, String
 
 from src.models.base import Base
 
 
 class Inflation(Base):
     __tablename__ = "inflation"
+    __table_args__ = (Index("ix_inflation_year_month", "year", "month", unique=True),)
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     year = Column(Integer, nullable=False)
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Float, String
+
+from src.models.base import Base
+
+
+class SchedulerLease(Base):
+    """Time-limited leadership of a singleton job runner, shared by all nodes through the database.
+
+    Times are Unix seconds read from the database clock, so nodes with skewed clocks agree on expiry.
+    """
+
+    __tablename__ = "scheduler_lease"
+
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(128), nullable=False)
+    acquired_at = Column(Float, nullable=False)
+    expires_at = Column(Float, nullable=False)
@@ -9,5 +9,5 @@ class TRM(Base):
     __tablename__ = "trm"
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    date = Column(Date, nullable=False)
+    date = Column(Date, nullable=False, unique=True, index=True)
     value = Column(Float, nullable=False)
@@ -0,0 +1,96 @@
+import hashlib
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import HTTPException, Request, Response
+
+_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+def seconds_until_next_run(at: str, weekday: str | None = None, now: datetime | None = None) -> int:
+    """Get the number of seconds until the next scheduled run of a job.
+
+    Args:
+        at: Local time of day the job runs at ('HH:MM')
+        weekday: Day of the week the job runs on, or None for a daily job
+        now: Current local time (defaults to now)
+
+    Returns:
+        Seconds until the next run, at least 1
+    """
+    now = now or datetime.now()
+    hour, minute = (int(part) for part in at.split(":"))
+    next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+    if weekday is None:
+        if next_run <= now:
+            next_run += timedelta(days=1)
+    else:
+        next_run += timedelta(days=(_WEEKDAYS.index(weekday) - now.weekday()) % 7)
+        if next_run <= now:
+            next_run += timedelta(days=7)
+
+    return max(1, int((next_run - now).total_seconds()))
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # If-None-Match uses the weak comparison function (RFC 9110, 13.1.2)
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return last_modified <= since
+
+
+def apply_conditional_headers(
+    request: Request,
+    response: Response,
+    data_version: str,
+    last_modified: datetime | None,
+    max_age: int,
+) -> None:
+    """Set the cache validators of a series response, answering 304 when the client copy is current.
+
+    The ETag is derived from the series data version and the request URL and Accept
+    header, so every representation of every page gets its own strong validator.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers are being prepared
+        data_version: Version (content hash) of the series the response is built from
+        last_modified: Time the content of the series last changed
+        max_age: Seconds the response may be cached for
+
+    Raises:
+        HTTPException: 304 Not Modified when the client copy is still current
+    """
+    fingerprint = "\n".join((data_version, request.url.path, str(request.url.query), request.headers.get("accept", "")))
+    headers = {
+        "ETag": f'"{hashlib.sha256(fingerprint.encode()).hexdigest()[:32]}"',
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        not_modified = (
+            if_modified_since is not None
+            and last_modified is not None
+            and _not_modified_since(if_modified_since, last_modified)
+        )
+
+    if not_modified:
+        raise HTTPException(status_code=304, headers=headers)
+
+    response.headers.update(headers)
@@ -1,9 +1,11 @@
-from datetime import datetime, timezone
+from collections.abc import Callable
+from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import text
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 
+from src.db.probe import database_probe
+from src.db.replica import replica_sync
 from src.db.session import database_session
 from src.schemas.health import DatabaseHealthStatus, HealthCheckResponse
 
@@ -13,30 +15,70 @@ router = APIRouter(tags=["health"])
 APP_VERSION = "0.1.0"
 
 
+def _health_response(db_status: DatabaseHealthStatus | None) -> HealthCheckResponse:
+    if db_status is None:
+        db_status = DatabaseHealthStatus(connected=False, error="Database not probed yet")
+
+    return HealthCheckResponse(
+        status="healthy" if db_status.connected else "unhealthy",
+        timestamp=datetime.now(UTC),
+        version=APP_VERSION,
+        database=db_status.model_copy(update={"replica_lag_seconds": replica_sync.staleness_seconds()}),
+    )
+
+
 @router.get("/health", response_model=HealthCheckResponse, status_code=200)
 async def health_check(
-    db_session: Session = Depends(database_session.get_db),
+    session_factory: Callable[[], Session] = Depends(database_session.get_session_factory),
 ) -> HealthCheckResponse:
     """
     Health check endpoint that verifies API and database connectivity.
 
+    The database status comes from the background probe (see /health/ready),
+    so this always answers 200 and reports the state in the body.
+
     Returns:
         HealthCheckResponse: Status of the API and database with timestamp and version.
     """
-    # Check database connectivity
-    db_status = DatabaseHealthStatus(connected=True, error=None)
-    overall_status = "healthy"
+    return _health_response(await database_probe.current(session_factory))
 
-    try:
-        # Execute a simple query to verify database connection
-        db_session.execute(text("SELECT 1"))
-    except Exception as e:
-        db_status = DatabaseHealthStatus(connected=False, error=str(e))
-        overall_status = "unhealthy"
 
-    return HealthCheckResponse(
-        status=overall_status,
-        timestamp=datetime.now(timezone.utc),
-        version=APP_VERSION,
-        database=db_status,
-    )
+@router.get("/health/live", response_model=HealthCheckResponse, status_code=200)
+async def liveness_check() -> HealthCheckResponse:
+    """
+    Liveness probe: answers as long as the process serves requests, without any I/O.
+
+    The database status is the last background probe result, for information only.
+
+    Returns:
+        HealthCheckResponse: Always healthy, with the last known database status.
+    """
+    response = _health_response(database_probe.status)
+    response.status = "healthy"
+    return response
+
+
+@router.get(
+    "/health/ready",
+    response_model=HealthCheckResponse,
+    status_code=200,
+    responses={503: {"model": HealthCheckResponse, "description": "Database unreachable"}},
+)
+async def readiness_check(
+    response: Response,
+    session_factory: Callable[[], Session] = Depends(database_session.get_session_factory),
+) -> HealthCheckResponse:
+    """
+    Readiness probe backed by the cached result of the background database probe.
+
+    The database is only queried here when the cached result is missing or older
+    than HEALTH_PROBE_MAX_AGE_SECONDS (e.g. before the background probe started).
+
+    Returns:
+        HealthCheckResponse: Status of the API and database, with a 503 status code when unhealthy.
+    """
+    health = _health_response(await database_probe.current(session_factory))
+    if not health.database.connected:
+        response.status_code = 503
+
+    return health
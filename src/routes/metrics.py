@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from src.metrics import db as db_metrics  # noqa: F401 - registers the database metrics
+from src.metrics.registry import registry
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Expose the process metrics in the Prometheus text format.
+
+    Returns:
+        Response: Every registered metric family
+    """
+    return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
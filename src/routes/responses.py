@@ -0,0 +1,75 @@
+import json
+from collections.abc import Callable
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi_pagination import Page
+from fastapi_pagination.bases import AbstractParams
+
+from src.serializers.columnar import MEDIA_TYPE as COLUMNAR_MEDIA_TYPE
+from src.stores.base import SeriesView
+
+# OpenAPI documentation of the content-negotiated binary representation
+COLUMNAR_RESPONSES = {200: {"content": {COLUMNAR_MEDIA_TYPE: {}}}}
+
+
+def accepts_columnar(request: Request) -> bool:
+    """Check whether the client asked for the columnar binary representation."""
+    accept = request.headers.get("accept", "")
+    return any(part.split(";")[0].strip() == COLUMNAR_MEDIA_TYPE for part in accept.split(","))
+
+
+def with_headers(direct: Response, response: Response) -> Response:
+    """Copy the headers set on the injected response (cache validators) onto a response returned directly.
+
+    FastAPI only merges them into the responses it builds itself.
+    """
+    for name, value in response.headers.items():
+        if name != "content-length":
+            direct.headers[name] = value
+    return direct
+
+
+def columnar_response(chunks: list[bytes | memoryview], total: int | None = None) -> StreamingResponse:
+    """Build a response that writes columnar buffers back to back without joining them.
+
+    Args:
+        chunks: Buffers produced by the columnar encoders
+        total: Total number of records across pages, when the payload is a single page
+
+    Returns:
+        Streaming response with an exact Content-Length
+    """
+    headers = {"Content-Length": str(sum(len(chunk) for chunk in chunks))}
+    if total is not None:
+        headers["X-Total-Count"] = str(total)
+    return StreamingResponse(iter(chunks), media_type=COLUMNAR_MEDIA_TYPE, headers=headers)
+
+
+def json_page_response(
+    view: SeriesView,
+    params: AbstractParams,
+    encode_items: Callable[..., str],
+) -> Response:
+    """Build the JSON body of a numbered page without going through the response model.
+
+    The page metadata still comes from fastapi-pagination, so the body is identical to
+    the one ``paginate`` would produce, but the items are formatted straight from the
+    snapshot arrays instead of being built, validated and dumped as models one by one.
+
+    Args:
+        view: Sorted window over the series being paginated
+        params: Pagination parameters
+        encode_items: Serializer of ``(series, lo, hi, descending)`` rows into a JSON array
+
+    Returns:
+        JSON response with the page
+    """
+    raw_params = params.to_raw_params()
+    lo, hi = view.position_range(raw_params.offset, raw_params.offset + raw_params.limit)
+    metadata = Page.create([], params, total=len(view)).model_dump(mode="json", exclude={"items"})
+
+    body = '{"items":' + encode_items(view.series, lo, hi, view.descending)
+    for name, value in metadata.items():
+        body += f",{json.dumps(name)}:{json.dumps(value)}"
+    return Response(content=(body + "}").encode(), media_type="application/json")
@@ -1,33 +1,87 @@
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page
-from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy.orm import Session
 
+from src.config.schedule import INFLATION_JOB_TIME, INFLATION_JOB_WEEKDAY
 from src.db.session import database_session
-from src.schemas.inflation import (InflationData, InflationDateRange,
-                                   InflationPaginateParams)
+from src.routes.caching import apply_conditional_headers, seconds_until_next_run
+from src.routes.responses import (
+    COLUMNAR_RESPONSES,
+    accepts_columnar,
+    columnar_response,
+    json_page_response,
+    with_headers,
+)
+from src.schemas.inflation import (
+    InflationBatchItem,
+    InflationBatchRequest,
+    InflationBatchResponse,
+    InflationData,
+    InflationDateRange,
+    InflationPaginateParams,
+)
+from src.schemas.pagination import CursorPage, decode_cursor, encode_cursor
+from src.serializers.columnar import encode_inflation
+from src.serializers.json import inflation_items
+from src.serializers.text import inflation_csv, inflation_ndjson
+from src.stores.inflation import FIRST_PERIOD, offset_period
 from src.use_cases.inflation import InflationUseCase
 
-router = APIRouter(prefix="/inflation", tags=["inflation"])
 
+async def inflation_cache_validators(
+    request: Request,
+    response: Response,
+    db_session: Session = Depends(database_session.get_db),
+) -> None:
+    """
+    Set ETag, Last-Modified and Cache-Control on inflation reads, answering 304 before any page is built.
+
+    Args:
+        request: Incoming request, checked for If-None-Match/If-Modified-Since
+        response: Response the validators are set on
+        db_session: Database session (injected by FastAPI)
+    """
+    if request.method not in ("GET", "HEAD"):
+        return
+
+    series = await InflationUseCase(db_session).get_series()
+    apply_conditional_headers(
+        request,
+        response,
+        data_version=series.digest,
+        last_modified=series.last_modified,
+        max_age=seconds_until_next_run(INFLATION_JOB_TIME, weekday=INFLATION_JOB_WEEKDAY),
+    )
 
-@router.get("", response_model=Page[InflationData])
+
+router = APIRouter(prefix="/inflation", tags=["inflation"], dependencies=[Depends(inflation_cache_validators)])
+
+
+@router.get("", response_model=Page[InflationData] | CursorPage[InflationData])
 async def get_inflation_data(
-    sort: Literal["asc", "desc"] = Query(
-        default="desc",
-        description="Sort order by year and month"
-    ),
+    response: Response,
+    sort: Literal["asc", "desc"] = Query(default="desc", description="Sort order by year and month"),
     params: InflationPaginateParams = Depends(),
-    db_session: Session = Depends(database_session.get_db)
-) -> Page[InflationData]:
+    pagination: Literal["page", "cursor"] = Query(
+        default="page", description="Numbered pages with totals, or keyset pages resumed through next_cursor"
+    ),
+    cursor: str | None = Query(
+        default=None, description="Cursor returned as next_cursor by the previous page (implies cursor pagination)"
+    ),
+    db_session: Session = Depends(database_session.get_db),
+) -> Page[InflationData] | CursorPage[InflationData]:
     """
     Retrieve inflation data with pagination, sorting, and date range filtering.
 
     Args:
+        response: Response carrying the cache validators
         sort: Sort order by year and month ('asc' or 'desc')
         params: Pagination parameters (handled automatically by fastapi-pagination)
+        pagination: Pagination mode ('page' or 'cursor')
+        cursor: Opaque cursor to resume a cursor-paginated listing
         db_session: Database session (injected by FastAPI)
 
     Returns:
@@ -35,17 +89,37 @@ async def get_inflation_data(
     """
 
     use_case = InflationUseCase(db_session)
-    query = await use_case.get_paginated_inflation_data(
+
+    if pagination == "cursor" or cursor is not None:
+        after = None
+        if cursor:
+            try:
+                offset = decode_cursor(cursor) - FIRST_PERIOD
+                # Only periods within the stored series can have ended a previous page
+                offsets = (await use_case.get_series()).offsets
+                if not offsets or not 0 <= offset <= offsets[-1]:
+                    raise ValueError(f"Invalid cursor: {cursor}")
+            except ValueError as e:
+                raise HTTPException(status_code=422, detail=str(e)) from e
+            after = offset_period(offset)
+
+        items, next_after = await use_case.get_inflation_data_by_cursor(
+            after=after,
+            size=params.size,
+            sort_order=sort,
+        )
+        next_cursor = encode_cursor(next_after[0] * 12 + next_after[1] - 1) if next_after else None
+        return CursorPage[InflationData](items=items, size=params.size, next_cursor=next_cursor)
+
+    inflation_view = await use_case.get_paginated_inflation_data(
         sort_order=sort,
     )
-    return paginate(query, params)
+    return with_headers(json_page_response(inflation_view, params, inflation_items), response)
 
 
 @router.get("/{year}/{month}", response_model=InflationData)
 async def get_inflation_data_by_date(
-    year: int,
-    month: int,
-    db_session: Session = Depends(database_session.get_db)
+    year: int, month: int, db_session: Session = Depends(database_session.get_db)
 ) -> InflationData:
     """
     Retrieve a specific inflation record by year and month.
@@ -65,28 +139,29 @@ async def get_inflation_data_by_date(
     result = await use_case.get_inflation_data_by_exact_date(year=year, month=month)
 
     if result is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No inflation data found for {year}/{month}"
-        )
+        raise HTTPException(status_code=404, detail=f"No inflation data found for {year}/{month}")
 
     return result
 
 
-@router.get("/date-range", response_model=Page[InflationData])
+@router.get("/date-range", response_model=Page[InflationData], responses=COLUMNAR_RESPONSES)
 async def get_inflation_data_by_date_range(
+    request: Request,
+    response: Response,
     date_range: InflationDateRange = Depends(),
     params: InflationPaginateParams = Depends(),
-    sort: Literal["asc", "desc"] = Query(
-        default="asc",
-        description="Sort order by year and month"
-    ),
-    db_session: Session = Depends(database_session.get_db)
+    sort: Literal["asc", "desc"] = Query(default="asc", description="Sort order by year and month"),
+    db_session: Session = Depends(database_session.get_db),
 ) -> Page[InflationData]:
     """
     Retrieve inflation data filtered by date range without pagination.
 
+    Clients sending ``Accept: application/vnd.banrepco.columnar`` get the page
+    in the columnar binary format, with the total count in ``X-Total-Count``.
+
     Args:
+        request: Incoming request, used for content negotiation
+        response: Response carrying the cache validators
         date_range: Date range parameters for filtering (year and month)
         params: Pagination parameters (handled automatically by fastapi-pagination)
         sort: Sort order by year and month ('asc' or 'desc')
@@ -96,9 +171,77 @@ async def get_inflation_data_by_date_range(
         List of inflation data records within the specified date range
     """
     use_case = InflationUseCase(db_session)
-    query = await use_case.get_inflation_data_by_date_range(
-        date_range=date_range,
-        sort_order=sort
+    inflation_view = await use_case.get_inflation_data_by_date_range(date_range=date_range, sort_order=sort)
+
+    if accepts_columnar(request):
+        raw_params = params.to_raw_params()
+        lo, hi = inflation_view.position_range(raw_params.offset, raw_params.offset + raw_params.limit)
+        columnar = columnar_response(
+            encode_inflation(inflation_view.series, lo, hi, inflation_view.descending),
+            total=len(inflation_view),
+        )
+        return with_headers(columnar, response)
+
+    return with_headers(json_page_response(inflation_view, params, inflation_items), response)
+
+
+@router.post("/batch", response_model=InflationBatchResponse)
+async def get_inflation_data_by_periods(
+    batch: InflationBatchRequest, db_session: Session = Depends(database_session.get_db)
+) -> InflationBatchResponse:
+    """
+    Retrieve inflation records for many (year, month) periods in a single request.
+
+    Args:
+        batch: The periods to get inflation data for
+        db_session: Database session (injected by FastAPI)
+
+    Returns:
+        One item per requested period, in input order, with null inflation for periods without data
+    """
+    use_case = InflationUseCase(db_session)
+    periods = [(period.year, period.month) for period in batch.periods]
+    results = await use_case.get_inflation_data_by_periods(periods)
+
+    return InflationBatchResponse(
+        items=[
+            InflationBatchItem(year=year, month=month, inflation=inflation)
+            for (year, month), inflation in zip(periods, results, strict=True)
+        ]
     )
 
-    return paginate(query, params)
+
+@router.get("/export", response_class=StreamingResponse, responses=COLUMNAR_RESPONSES)
+async def export_inflation_data(
+    request: Request,
+    response: Response,
+    format: Literal["ndjson", "csv"] = Query(default="ndjson", description="Output format"),
+    db_session: Session = Depends(database_session.get_db),
+) -> StreamingResponse:
+    """
+    Stream the whole inflation series, oldest first, in a single response.
+
+    ``Accept: application/vnd.banrepco.columnar`` takes precedence over ``format``.
+
+    Args:
+        request: Incoming request, used for content negotiation
+        response: Response carrying the cache validators
+        format: Output format ('ndjson' or 'csv')
+        db_session: Database session (injected by FastAPI)
+
+    Returns:
+        Streaming NDJSON or CSV download of every inflation record
+    """
+    use_case = InflationUseCase(db_session)
+    series = await use_case.get_series()
+
+    if accepts_columnar(request):
+        return with_headers(columnar_response(encode_inflation(series, 0, len(series))), response)
+    if format == "csv":
+        csv_response = StreamingResponse(
+            inflation_csv(series),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="inflation.csv"'},
+        )
+        return with_headers(csv_response, response)
+    return with_headers(StreamingResponse(inflation_ndjson(series), media_type="application/x-ndjson"), response)
@@ -1,58 +1,137 @@
+from datetime import date
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page
-from fastapi_pagination.ext.sqlalchemy import paginate
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
+from src.config.schedule import TRM_JOB_TIME
 from src.db.session import database_session
-from src.schemas.trm import (TRMByDate, TRMByDateRange, TRMData,
-                             TRMPaginateParams)
+from src.routes.caching import apply_conditional_headers, seconds_until_next_run
+from src.routes.responses import (
+    COLUMNAR_RESPONSES,
+    accepts_columnar,
+    columnar_response,
+    json_page_response,
+    with_headers,
+)
+from src.schemas.pagination import CursorPage, decode_cursor, encode_cursor
+from src.schemas.trm import (
+    TRMAggregateResponse,
+    TRMBatchItem,
+    TRMBatchRequest,
+    TRMBatchResponse,
+    TRMByDate,
+    TRMByDateRange,
+    TRMConversionRequest,
+    TRMConversionResponse,
+    TRMData,
+    TRMPaginateParams,
+)
+from src.serializers.columnar import encode_trm
+from src.serializers.json import trm_items
+from src.serializers.text import trm_csv, trm_ndjson
 from src.use_cases.trm import TRMUseCase
 
-router = APIRouter(prefix="/trm", tags=["trm"])
 
+async def trm_cache_validators(
+    request: Request,
+    response: Response,
+    db_session: Session = Depends(database_session.get_db),
+) -> None:
+    """
+    Set ETag, Last-Modified and Cache-Control on TRM reads, answering 304 before any page is built.
+
+    Args:
+        request: Incoming request, checked for If-None-Match/If-Modified-Since
+        response: Response the validators are set on
+        db_session: Database session (injected by FastAPI)
+    """
+    if request.method not in ("GET", "HEAD"):
+        return
+
+    series = await TRMUseCase(db_session).get_series()
+    apply_conditional_headers(
+        request,
+        response,
+        data_version=series.digest,
+        last_modified=series.last_modified,
+        max_age=seconds_until_next_run(TRM_JOB_TIME),
+    )
+
+
+router = APIRouter(prefix="/trm", tags=["trm"], dependencies=[Depends(trm_cache_validators)])
 
-@router.get("", response_model=Page[TRMData])
+
+@router.get("", response_model=Page[TRMData] | CursorPage[TRMData])
 async def get_trm_data(
-    sort: Literal["asc", "desc"] = Query(
-        default="desc", description="Sort order by date"
-    ),
+    response: Response,
+    sort: Literal["asc", "desc"] = Query(default="desc", description="Sort order by date"),
     params: TRMPaginateParams = Depends(),
+    pagination: Literal["page", "cursor"] = Query(
+        default="page", description="Numbered pages with totals, or keyset pages resumed through next_cursor"
+    ),
+    cursor: str | None = Query(
+        default=None, description="Cursor returned as next_cursor by the previous page (implies cursor pagination)"
+    ),
     db_session: Session = Depends(database_session.get_db),
-) -> Page[TRMData]:
+) -> Page[TRMData] | CursorPage[TRMData]:
     """
     Retrieve TRM data with pagination and sorting.
 
     Args:
+        response: Response carrying the cache validators
         sort: Sort order by date ('asc' or 'desc')
         params: Pagination parameters (handled automatically by fastapi-pagination)
+        pagination: Pagination mode ('page' or 'cursor')
+        cursor: Opaque cursor to resume a cursor-paginated listing
         db_session: Database session (injected by FastAPI)
 
     Returns:
         Paginated list of TRM data records with metadata
     """
     use_case = TRMUseCase(db_session)
-    query = await use_case.get_paginated_trm_data(
+
+    if pagination == "cursor" or cursor is not None:
+        try:
+            after = date.fromordinal(decode_cursor(cursor)) if cursor else None
+        except (ValueError, OverflowError) as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+
+        items, next_after = await use_case.get_trm_data_by_cursor(
+            after=after,
+            size=params.size,
+            sort_order=sort,
+        )
+        next_cursor = encode_cursor(next_after.toordinal()) if next_after else None
+        return CursorPage[TRMData](items=items, size=params.size, next_cursor=next_cursor)
+
+    trm_view = await use_case.get_paginated_trm_data(
         sort_order=sort,
     )
-    return paginate(query, params)
+    return with_headers(json_page_response(trm_view, params, trm_items), response)
 
 
-@router.get("/by-date-range", response_model=Page[TRMData])
+@router.get("/by-date-range", response_model=Page[TRMData], responses=COLUMNAR_RESPONSES)
 async def get_trm_by_date_range(
+    request: Request,
+    response: Response,
     date_range: TRMByDateRange = Depends(),
-    sort: Literal["asc", "desc"] = Query(
-        default="asc", description="Sort order by date"
-    ),
+    sort: Literal["asc", "desc"] = Query(default="asc", description="Sort order by date"),
     params: TRMPaginateParams = Depends(),
     db_session: Session = Depends(database_session.get_db),
 ) -> Page[TRMData]:
     """
     Retrieve TRM data within a date range with pagination and sorting.
 
+    Clients sending ``Accept: application/vnd.banrepco.columnar`` get the page
+    in the columnar binary format, with the total count in ``X-Total-Count``.
+
     Args:
+        request: Incoming request, used for content negotiation
+        response: Response carrying the cache validators
         date_range: Start and end dates for the range
         sort: Sort order by date ('asc' or 'desc')
         params: Pagination parameters
@@ -63,16 +142,52 @@ async def get_trm_by_date_range(
     """
     try:
         use_case = TRMUseCase(db_session)
-        query = await use_case.get_trm_by_date_range(
+        trm_view = await use_case.get_trm_by_date_range(
             start_date=date_range.start_date,
             end_date=date_range.end_date,
             sort_order=sort,
         )
-        return paginate(query, params)
+        if accepts_columnar(request):
+            raw_params = params.to_raw_params()
+            lo, hi = trm_view.position_range(raw_params.offset, raw_params.offset + raw_params.limit)
+            columnar = columnar_response(encode_trm(trm_view.series, lo, hi, trm_view.descending), total=len(trm_view))
+            return with_headers(columnar, response)
+
+        return with_headers(json_page_response(trm_view, params, trm_items), response)
     except ValidationError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
 
+@router.get("/aggregate", response_model=TRMAggregateResponse, response_model_exclude_none=True)
+async def get_trm_aggregates(
+    date_range: TRMByDateRange = Depends(),
+    period: Literal["month", "quarter", "year"] = Query(default="month", description="Calendar period to group by"),
+    stat: Literal["mean", "min", "max", "ohlc"] = Query(default="mean", description="Statistic to compute per period"),
+    db_session: Session = Depends(database_session.get_db),
+) -> TRMAggregateResponse:
+    """
+    Retrieve TRM statistics per month, quarter or year within a date range.
+
+    Args:
+        date_range: Start and end dates for the range
+        period: Calendar period to group by ('month', 'quarter' or 'year')
+        stat: Statistic to compute ('mean', 'min', 'max' or 'ohlc')
+        db_session: Database session (injected by FastAPI)
+
+    Returns:
+        One aggregate per period with TRM data, in chronological order
+    """
+    use_case = TRMUseCase(db_session)
+    items = await use_case.get_trm_aggregates(
+        start_date=date_range.start_date,
+        end_date=date_range.end_date,
+        period=period,
+        stat=stat,
+    )
+
+    return TRMAggregateResponse(period=period, stat=stat, items=items)
+
+
 @router.get("/by-date", response_model=TRMData)
 async def get_trm_by_date(
     query_date: TRMByDate = Depends(),
@@ -81,8 +196,12 @@ async def get_trm_by_date(
     """
     Retrieve TRM data for a specific date.
 
+    With as_of, the latest TRM on or before the date is returned instead of a 404
+    when the date itself has no TRM (e.g. dates after the last published one).
+
     Args:
         specific_date: The date to query TRM data for (format: YYYY-MM-DD)
+        as_of: Whether to fall back to the latest earlier TRM
         db_session: Database session (injected by FastAPI)
 
     Returns:
@@ -92,7 +211,7 @@ async def get_trm_by_date(
         HTTPException: If no TRM data is found for the specified date
     """
     use_case = TRMUseCase(db_session)
-    result = await use_case.get_trm_by_date(query_date.specific_date)
+    result = await use_case.get_trm_by_date(query_date.specific_date, as_of=query_date.as_of)
 
     if not result:
         raise HTTPException(
@@ -101,3 +220,90 @@ async def get_trm_by_date(
         )
 
     return result
+
+
+@router.post("/batch", response_model=TRMBatchResponse)
+async def get_trm_by_dates(
+    batch: TRMBatchRequest,
+    db_session: Session = Depends(database_session.get_db),
+) -> TRMBatchResponse:
+    """
+    Retrieve TRM data for many dates in a single request.
+
+    Args:
+        batch: The dates to query TRM data for
+        db_session: Database session (injected by FastAPI)
+
+    Returns:
+        One item per requested date, in input order, with a null TRM for dates without data
+    """
+    use_case = TRMUseCase(db_session)
+    results = await use_case.get_trm_by_dates(batch.dates, as_of=batch.as_of)
+
+    return TRMBatchResponse(
+        items=[
+            TRMBatchItem(requested_date=requested_date, trm=trm)
+            for requested_date, trm in zip(batch.dates, results, strict=True)
+        ]
+    )
+
+
+@router.post("/convert", response_model=TRMConversionResponse)
+async def convert_amounts(
+    conversion: TRMConversionRequest,
+    db_session: Session = Depends(database_session.get_db),
+) -> TRMConversionResponse:
+    """
+    Convert many amounts between USD and COP using the TRM applicable on each date.
+
+    Each amount uses the latest TRM on or before its date.
+
+    Args:
+        conversion: Parallel arrays of amounts, dates and directions ('usd_to_cop' or 'cop_to_usd')
+        db_session: Database session (injected by FastAPI)
+
+    Returns:
+        Parallel arrays of converted amounts, TRMs used and their dates (null where no TRM applies)
+    """
+    use_case = TRMUseCase(db_session)
+    return await use_case.convert_amounts(
+        amounts=conversion.amounts,
+        dates=conversion.dates,
+        directions=conversion.directions,
+    )
+
+
+@router.get("/export", response_class=StreamingResponse, responses=COLUMNAR_RESPONSES)
+async def export_trm_data(
+    request: Request,
+    response: Response,
+    format: Literal["ndjson", "csv"] = Query(default="ndjson", description="Output format"),
+    db_session: Session = Depends(database_session.get_db),
+) -> StreamingResponse:
+    """
+    Stream the whole TRM series, oldest first, in a single response.
+
+    ``Accept: application/vnd.banrepco.columnar`` takes precedence over ``format``.
+
+    Args:
+        request: Incoming request, used for content negotiation
+        response: Response carrying the cache validators
+        format: Output format ('ndjson' or 'csv')
+        db_session: Database session (injected by FastAPI)
+
+    Returns:
+        Streaming NDJSON or CSV download of every TRM record
+    """
+    use_case = TRMUseCase(db_session)
+    series = await use_case.get_series()
+
+    if accepts_columnar(request):
+        return with_headers(columnar_response(encode_trm(series, 0, len(series))), response)
+    if format == "csv":
+        csv_response = StreamingResponse(
+            trm_csv(series),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="trm.csv"'},
+        )
+        return with_headers(csv_response, response)
+    return with_headers(StreamingResponse(trm_ndjson(series), media_type="application/x-ndjson"), response)
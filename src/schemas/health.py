@@ -7,6 +7,9 @@ class DatabaseHealthStatus(BaseModel):
     """Database connectivity status."""
     connected: bool
     error: str | None = None
+    replica_lag_seconds: float | None = None  # Seconds since the local replica last synced, if one is used
+    latency_ms: float | None = None  # Round trip of the probe query
+    checked_at: datetime | None = None  # When the database was last probed
 
 
 class HealthCheckResponse(BaseModel):
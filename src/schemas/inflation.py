@@ -24,3 +24,24 @@ class InflationDateRange(BaseModel):
 class InflationPaginateParams(Params):
     page: int = Query(1, ge=1, description="Page number")
     size: int = Query(25, ge=1, le=100, description="Page size")
+
+
+class InflationPeriod(BaseModel):
+    year: int = Field(..., description="Year of the period", ge=1955, le=2100)
+    month: int = Field(..., description="Month of the period", ge=1, le=12)
+
+
+class InflationBatchRequest(BaseModel):
+    periods: list[InflationPeriod] = Field(
+        ..., min_length=1, max_length=5000, description="Periods to look inflation data up for"
+    )
+
+
+class InflationBatchItem(BaseModel):
+    year: int
+    month: int
+    inflation: InflationData | None = Field(None, description="Inflation data for the period, null when there is none")
+
+
+class InflationBatchResponse(BaseModel):
+    items: list[InflationBatchItem]
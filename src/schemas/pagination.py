@@ -0,0 +1,27 @@
+import base64
+import binascii
+
+from pydantic import BaseModel
+
+
+class CursorPage[T](BaseModel):
+    items: list[T]
+    size: int
+    next_cursor: str | None = None
+
+
+def encode_cursor(key: int) -> str:
+    """Encode a seek key into an opaque, URL-safe cursor."""
+    return base64.urlsafe_b64encode(str(key).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
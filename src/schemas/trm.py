@@ -1,8 +1,11 @@
 from datetime import date
+from typing import Literal
 
 from fastapi import Query
 from fastapi_pagination import Params
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+MAX_CONVERSION_ROWS = 50_000
 
 
 class TRMData(BaseModel):
@@ -15,6 +18,7 @@ class TRMData(BaseModel):
 
 class TRMByDate(BaseModel):
     specific_date: date = Query(description="Date to query for TRM data")
+    as_of: bool = Query(False, description="Fall back to the latest TRM on or before the date when it has none")
 
 
 class TRMByDateRange(BaseModel):
@@ -32,3 +36,60 @@ class TRMByDateRange(BaseModel):
 class TRMPaginateParams(Params):
     page: int = Query(1, ge=1, description="Page number")
     size: int = Query(25, ge=1, le=100, description="Page size")
+
+
+class TRMBatchRequest(BaseModel):
+    dates: list[date] = Field(..., min_length=1, max_length=5000, description="Dates to look TRM data up for")
+    as_of: bool = Field(False, description="Fall back to the latest TRM on or before each date when it has none")
+
+
+class TRMBatchItem(BaseModel):
+    requested_date: date
+    trm: TRMData | None = Field(
+        None, description="TRM data applicable to the requested date (its own date may differ with as_of), or null"
+    )
+
+
+class TRMBatchResponse(BaseModel):
+    items: list[TRMBatchItem]
+
+
+class TRMConversionRequest(BaseModel):
+    amounts: list[float] = Field(..., min_length=1, max_length=MAX_CONVERSION_ROWS, description="Amounts to convert")
+    dates: list[date] = Field(
+        ..., min_length=1, max_length=MAX_CONVERSION_ROWS, description="Date whose TRM applies to each amount"
+    )
+    directions: list[Literal["usd_to_cop", "cop_to_usd"]] = Field(
+        ..., min_length=1, max_length=MAX_CONVERSION_ROWS, description="Conversion direction of each amount"
+    )
+
+    @model_validator(mode="after")
+    def validate_same_length(self) -> "TRMConversionRequest":
+        if not len(self.amounts) == len(self.dates) == len(self.directions):
+            raise ValueError("amounts, dates and directions must have the same length.")
+        return self
+
+
+class TRMConversionResponse(BaseModel):
+    amounts: list[float | None] = Field(..., description="Converted amounts, null when no TRM applies")
+    rates: list[float | None] = Field(..., description="TRM used for each amount")
+    rate_dates: list[date | None] = Field(..., description="Date of the TRM used for each amount")
+
+
+class TRMAggregate(BaseModel):
+    period_start: date
+    period_end: date
+    count: int
+    mean: float | None = None
+    min: float | None = None
+    max: float | None = None
+    open: float | None = None
+    high: float | None = None
+    low: float | None = None
+    close: float | None = None
+
+
+class TRMAggregateResponse(BaseModel):
+    period: Literal["month", "quarter", "year"]
+    stat: Literal["mean", "min", "max", "ohlc"]
+    items: list[TRMAggregate]
@@ -0,0 +1,116 @@
+"""Compact columnar binary encoding of the TRM and inflation series.
+
+Layout (all little-endian)::
+
+    header   16 bytes   magic b"BRCS", version u8, kind u8, reserved u16, rows u32, reserved u32
+    keys     rows * int32   TRM: date ordinals (date.toordinal())
+                            inflation: month indexes (year * 12 + month - 1)
+    padding  4 bytes when rows is odd, so the float64 columns stay 8-byte aligned
+    values   rows * float64 TRM: value / inflation: annual_inflation_rate
+    targets  rows * float64 inflation only, NaN when the target is missing
+
+``decode`` is the reference decoder for clients.
+"""
+
+import math
+import struct
+import sys
+from array import array
+from datetime import date
+
+from src.stores.inflation import FIRST_PERIOD, InflationSeries
+from src.stores.trm import TRMSeries
+
+MEDIA_TYPE = "application/vnd.banrepco.columnar"
+
+MAGIC = b"BRCS"
+VERSION = 1
+KIND_TRM = 1
+KIND_INFLATION = 2
+
+_HEADER = struct.Struct("<4sBBHII")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _le(column: array | memoryview) -> memoryview:
+    """Get the little-endian bytes of a column, without copying on little-endian hosts."""
+    view = memoryview(column)
+    if not _LITTLE_ENDIAN:
+        swapped = array(view.format, view.tobytes())
+        swapped.byteswap()
+        view = memoryview(swapped)
+    return view.cast("B")
+
+
+def _encode(kind: int, keys: array | memoryview, *columns: array | memoryview) -> list[bytes | memoryview]:
+    rows = len(keys)
+    chunks: list[bytes | memoryview] = [_HEADER.pack(MAGIC, VERSION, kind, 0, rows, 0), _le(keys)]
+    if rows % 2:
+        chunks.append(b"\0" * 4)
+    chunks.extend(_le(column) for column in columns)
+    return chunks
+
+
+def encode_trm(series: TRMSeries, lo: int, hi: int, descending: bool = False) -> list[bytes | memoryview]:
+    """Encode TRM positions ``[lo, hi)`` of a snapshot.
+
+    Ascending windows are returned as memoryviews over the snapshot arrays (no copy
+    on little-endian hosts); descending ones are reversed copies.
+
+    Returns:
+        Buffers to be written out back to back
+    """
+    if descending:
+        return _encode(KIND_TRM, series.ordinals[lo:hi][::-1], series.values[lo:hi][::-1])
+    return _encode(KIND_TRM, memoryview(series.ordinals)[lo:hi], memoryview(series.values)[lo:hi])
+
+
+def encode_inflation(series: InflationSeries, lo: int, hi: int, descending: bool = False) -> list[bytes | memoryview]:
+    """Encode inflation records at positions ``[lo, hi)`` among the present records of a snapshot.
+
+    Returns:
+        Buffers to be written out back to back
+    """
+    offsets = series.offsets[lo:hi]
+    if descending:
+        offsets = offsets[::-1]
+    keys = array("i", (offset + FIRST_PERIOD for offset in offsets))
+    rates = array("d", (series.rates[offset] for offset in offsets))
+    targets = array("d", (series.targets[offset] for offset in offsets))
+    return _encode(KIND_INFLATION, keys, rates, targets)
+
+
+def decode(payload: bytes) -> tuple[int, list[tuple]]:
+    """Decode a columnar payload.
+
+    Args:
+        payload: Bytes produced by ``encode_trm`` or ``encode_inflation``
+
+    Returns:
+        The payload kind and its rows: ``(date, value)`` for TRM,
+        ``(year, month, annual_inflation_rate, target)`` for inflation
+
+    Raises:
+        ValueError: If the payload is not a supported columnar payload
+    """
+    if len(payload) < _HEADER.size:
+        raise ValueError("Truncated columnar payload.")
+    magic, version, kind, _, rows, _ = _HEADER.unpack_from(payload)
+    if magic != MAGIC or version != VERSION or kind not in (KIND_TRM, KIND_INFLATION):
+        raise ValueError("Unsupported columnar payload.")
+
+    keys_end = _HEADER.size + 4 * rows
+    values_start = keys_end + 4 * (rows % 2)
+    value_columns = 1 if kind == KIND_TRM else 2
+    if len(payload) != values_start + 8 * rows * value_columns:
+        raise ValueError("Columnar payload size does not match its header.")
+
+    keys = struct.unpack_from(f"<{rows}i", payload, _HEADER.size)
+    columns = [struct.unpack_from(f"<{rows}d", payload, values_start + 8 * rows * i) for i in range(value_columns)]
+
+    if kind == KIND_TRM:
+        return kind, [(date.fromordinal(key), value) for key, value in zip(keys, columns[0], strict=True)]
+    return kind, [
+        (key // 12, key % 12 + 1, rate, None if math.isnan(target) else target)
+        for key, rate, target in zip(keys, columns[0], columns[1], strict=True)
+    ]
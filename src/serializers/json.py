@@ -0,0 +1,37 @@
+import math
+from datetime import date
+
+from src.stores.inflation import InflationSeries, offset_period
+from src.stores.trm import TRMSeries
+
+# Rows are formatted straight from the snapshot arrays, which only ever hold values that
+# went through the ingestion schemas, so the response models do not validate them again.
+# ``repr`` of a float is its shortest round-tripping form, the same text Pydantic emits.
+
+
+def trm_row(series: TRMSeries, index: int) -> str:
+    """Format the TRM record at a series position as a JSON object."""
+    return f'{{"date":"{date.fromordinal(series.ordinals[index])}","value":{series.values[index]!r}}}'
+
+
+def inflation_row(series: InflationSeries, offset: int) -> str:
+    """Format the inflation record at a dense array offset as a JSON object."""
+    year, month = offset_period(offset)
+    target = series.targets[offset]
+    target_json = "null" if math.isnan(target) else repr(target)
+    return f'{{"year":{year},"month":{month},"annual_inflation_rate":{series.rates[offset]!r},"target":{target_json}}}'
+
+
+def _positions(lo: int, hi: int, descending: bool) -> range:
+    return range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+
+
+def trm_items(series: TRMSeries, lo: int, hi: int, descending: bool = False) -> str:
+    """Format TRM rows ``[lo, hi)`` as a JSON array, newest first when descending."""
+    return "[" + ",".join([trm_row(series, i) for i in _positions(lo, hi, descending)]) + "]"
+
+
+def inflation_items(series: InflationSeries, lo: int, hi: int, descending: bool = False) -> str:
+    """Format inflation rows ``[lo, hi)`` (positions among present records) as a JSON array."""
+    offsets = series.offsets
+    return "[" + ",".join([inflation_row(series, offsets[i]) for i in _positions(lo, hi, descending)]) + "]"
@@ -0,0 +1,51 @@
+import math
+from collections.abc import Iterator
+from datetime import date
+
+from src.serializers.json import inflation_row, trm_row
+from src.stores.inflation import InflationSeries, offset_period
+from src.stores.trm import TRMSeries
+
+CHUNK_ROWS = 1000
+
+
+def _chunks(lines: Iterator[str], header: str = "") -> Iterator[str]:
+    """Group text lines into chunks of CHUNK_ROWS so a stream never holds more than one chunk."""
+    chunk = [header] if header else []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= CHUNK_ROWS:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def trm_ndjson(series: TRMSeries, lo: int = 0, hi: int | None = None) -> Iterator[str]:
+    """Stream TRM rows ``[lo, hi)`` as newline-delimited JSON."""
+    hi = len(series) if hi is None else hi
+    return _chunks(trm_row(series, i) + "\n" for i in range(lo, hi))
+
+
+def trm_csv(series: TRMSeries, lo: int = 0, hi: int | None = None) -> Iterator[str]:
+    """Stream TRM rows ``[lo, hi)`` as CSV with a header line."""
+    hi = len(series) if hi is None else hi
+    ordinals, values = series.ordinals, series.values
+    lines = (f"{date.fromordinal(ordinals[i])},{values[i]!r}\n" for i in range(lo, hi))
+    return _chunks(lines, header="date,value\n")
+
+
+def inflation_ndjson(series: InflationSeries) -> Iterator[str]:
+    """Stream every inflation record as newline-delimited JSON."""
+    return _chunks(inflation_row(series, offset) + "\n" for offset in series.offsets)
+
+
+def inflation_csv(series: InflationSeries) -> Iterator[str]:
+    """Stream every inflation record as CSV with a header line (empty target when missing)."""
+
+    def line(offset: int) -> str:
+        year, month = offset_period(offset)
+        target = series.targets[offset]
+        return f"{year},{month},{series.rates[offset]!r},{'' if math.isnan(target) else repr(target)}\n"
+
+    return _chunks((line(offset) for offset in series.offsets), header="year,month,annual_inflation_rate,target\n")
@@ -0,0 +1,85 @@
+from array import array
+
+
+class RangeAggregates:
+    """Range statistics over a float64 series in O(1) per query.
+
+    ``prefix[i]`` holds the sum of the first ``i`` values, so any range mean is
+    two lookups. ``minimums[k][i]``/``maximums[k][i]`` hold the min/max of the
+    ``2**k`` values starting at ``i`` (sparse tables), so any range min/max is
+    the combination of two overlapping power-of-two windows.
+    """
+
+    def __init__(self, prefix: array, minimums: list[array], maximums: list[array]):
+        self.prefix = prefix
+        self.minimums = minimums
+        self.maximums = maximums
+
+    @classmethod
+    def build(cls, values: array) -> "RangeAggregates":
+        """Build the prefix sums and sparse tables of a whole series in O(n log n)."""
+        prefix = array("d", [0.0])
+        total = 0.0
+        for value in values:
+            total += value
+            prefix.append(total)
+
+        minimums = [array("d", values)]
+        maximums = [array("d", values)]
+        width = 1
+        while width * 2 <= len(values):
+            previous_min, previous_max = minimums[-1], maximums[-1]
+            count = len(values) - width * 2 + 1
+            minimums.append(array("d", (min(previous_min[i], previous_min[i + width]) for i in range(count))))
+            maximums.append(array("d", (max(previous_max[i], previous_max[i + width]) for i in range(count))))
+            width *= 2
+
+        return cls(prefix, minimums, maximums)
+
+    def appended(self, value: float) -> "RangeAggregates":
+        """Get the aggregates of the series extended by one value.
+
+        The prefix sums and every sparse-table level are copied (O(n log n) copying)
+        rather than mutated, so snapshots sharing them stay valid. Only the O(log n)
+        entries covering the new value are computed, instead of rebuilding the tables.
+        """
+        prefix = array("d", self.prefix)
+        prefix.append(prefix[-1] + value)
+        length = len(prefix) - 1
+
+        minimums = [array("d", level) for level in self.minimums]
+        maximums = [array("d", level) for level in self.maximums]
+        minimums[0].append(value)
+        maximums[0].append(value)
+
+        level, width = 1, 2
+        while width <= length:
+            if level == len(minimums):
+                minimums.append(array("d"))
+                maximums.append(array("d"))
+            # The only new window at this level is the one ending at the new value
+            start = length - width
+            half = width // 2
+            minimums[level].append(min(minimums[level - 1][start], minimums[level - 1][start + half]))
+            maximums[level].append(max(maximums[level - 1][start], maximums[level - 1][start + half]))
+            level, width = level + 1, width * 2
+
+        return RangeAggregates(prefix, minimums, maximums)
+
+    def _level(self, lo: int, hi: int) -> tuple[int, int]:
+        level = (hi - lo).bit_length() - 1
+        return level, hi - (1 << level)
+
+    def mean(self, lo: int, hi: int) -> float:
+        """Mean of the values in ``[lo, hi)`` (non-empty)."""
+        return (self.prefix[hi] - self.prefix[lo]) / (hi - lo)
+
+    def minimum(self, lo: int, hi: int) -> float:
+        """Minimum of the values in ``[lo, hi)`` (non-empty)."""
+        level, start = self._level(lo, hi)
+        return min(self.minimums[level][lo], self.minimums[level][start])
+
+    def maximum(self, lo: int, hi: int) -> float:
+        """Maximum of the values in ``[lo, hi)`` (non-empty)."""
+        level, start = self._level(lo, hi)
+        return max(self.maximums[level][lo], self.maximums[level][start])
@@ -0,0 +1,140 @@
+import threading
+import time
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+from typing import Protocol
+
+
+class Series(Protocol):
+    digest: str
+    last_modified: datetime | None
+
+    def __len__(self) -> int: ...
+
+    def last_day(self) -> date | None: ...
+
+    def row(self, index: int): ...
+
+
+class SeriesView(Sequence):
+    """Sorted window over a series snapshot, sliceable by fastapi-pagination."""
+
+    def __init__(self, series: Series, lo: int, hi: int, descending: bool = False):
+        self.series = series
+        self.lo = lo
+        self.hi = hi
+        self.descending = descending
+
+    def __len__(self) -> int:
+        return self.hi - self.lo
+
+    def position_range(self, start: int, stop: int) -> tuple[int, int]:
+        """Get the half-open ``[lo, hi)`` series positions backing ``view[start:stop]``."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        if self.descending:
+            return self.hi - stop, self.hi - start
+        return self.lo + start, self.lo + stop
+
+    def _position(self, index: int) -> int:
+        return self.hi - 1 - index if self.descending else self.lo + index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.series.row(self._position(i)) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Series view index out of range")
+        return self.series.row(self._position(index))
+
+
+class SeriesStore:
+    """Process-local holder for an immutable series snapshot.
+
+    Snapshots are swapped in as a whole, so readers always see a consistent
+    series. The store reports itself stale after it is invalidated and, while
+    the data version of the series is being polled (see ``note_version``), as
+    soon as that version moves past the one the snapshot was loaded at.
+    Without recent polls it falls back to expiring snapshots older than
+    ``ttl_seconds``. While one reader reloads a stale snapshot, the others keep
+    being served the current one.
+
+    Each snapshot is stamped (``last_modified``) with the modification time stored
+    with its data version, which every write, including a revision to an old record,
+    moves in the same transaction. Every process and restart therefore agrees on it.
+    Series never written through a versioned path fall back to the start of their
+    latest day.
+    """
+
+    def __init__(self, empty_series: Series, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._series = empty_series
+        self._loaded_at: float | None = None
+        self._loaded_version: int | None = None
+        self._latest_version: int | None = None
+        self._version_noted_at: float | None = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    @property
+    def series(self):
+        return self._series
+
+    def is_stale(self) -> bool:
+        """Check whether the snapshot has to be (re)loaded before being read."""
+        loaded_at = self._loaded_at
+        if loaded_at is None:
+            return True
+        now = time.monotonic()
+        noted_at = self._version_noted_at
+        if noted_at is not None and now - noted_at <= self.ttl_seconds and self._loaded_version is not None:
+            return self._latest_version != self._loaded_version
+        return now - loaded_at > self.ttl_seconds
+
+    def note_version(self, version: int) -> None:
+        """Record the current data version of the series, as just read from the database."""
+        with self._lock:
+            self._latest_version = version
+            self._version_noted_at = time.monotonic()
+
+    def is_loaded(self) -> bool:
+        """Check whether a snapshot has been loaded since the last invalidation."""
+        return self._loaded_at is not None
+
+    def claim_refresh(self) -> bool:
+        """Claim the reload of the snapshot.
+
+        Returns:
+            True when the caller must reload, False when another reload is already running
+        """
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+            return True
+
+    def release_refresh(self) -> None:
+        """Give up a claimed reload that could not complete."""
+        with self._lock:
+            self._refreshing = False
+
+    def invalidate(self) -> None:
+        """Force the next read to reload the series."""
+        with self._lock:
+            self._loaded_at = None
+            self._latest_version = None
+            self._version_noted_at = None
+
+    def _swap(self, series: Series, version: int | None = None, modified_at: datetime | None = None) -> None:
+        if modified_at is None and (day := series.last_day()) is not None:
+            modified_at = datetime(day.year, day.month, day.day, tzinfo=UTC)
+        series.last_modified = modified_at
+
+        with self._lock:
+            self._series = series
+            self._loaded_at = time.monotonic()
+            # In-place updates (e.g. an append after an insert) keep the version of the last full load
+            if version is not None:
+                self._loaded_version = version
+            self._refreshing = False
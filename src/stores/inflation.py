@@ -0,0 +1,138 @@
+import hashlib
+import math
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime
+from functools import cached_property
+
+from src.schemas.inflation import InflationData
+from src.stores.base import SeriesStore
+
+# First month of the published inflation series (1955-07)
+FIRST_PERIOD = 1955 * 12 + 6
+
+
+def period_offset(year: int, month: int) -> int:
+    """Get the dense array offset of a (year, month) period."""
+    return year * 12 + month - 1 - FIRST_PERIOD
+
+
+def offset_period(offset: int) -> tuple[int, int]:
+    """Get the (year, month) period stored at a dense array offset."""
+    year, month_index = divmod(offset + FIRST_PERIOD, 12)
+    return year, month_index + 1
+
+
+class InflationSeries:
+    """Immutable snapshot of the inflation series indexed by period.
+
+    Rates and targets live in float64 arrays with one slot per month since
+    1955-07, so an exact lookup is a single index. Missing months and missing
+    targets are stored as NaN. ``offsets`` keeps the sorted offsets that do
+    hold a record, which is what ranges and pages are walked over.
+    """
+
+    def __init__(
+        self,
+        rates: array | None = None,
+        targets: array | None = None,
+        offsets: array | None = None,
+    ):
+        self.rates = rates if rates is not None else array("d")
+        self.targets = targets if targets is not None else array("d")
+        self.offsets = offsets if offsets is not None else array("i")
+        # Time (UTC) the series was last written, set by the store when it swaps the snapshot in
+        self.last_modified: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def last_day(self) -> date | None:
+        """Get the first day of the latest period with a record, or None when the series is empty."""
+        return date(*offset_period(self.offsets[-1]), 1) if self.offsets else None
+
+    @cached_property
+    def digest(self) -> str:
+        """Content hash of the snapshot, used as the data version for HTTP validators."""
+        return hashlib.blake2b(self.rates.tobytes() + self.targets.tobytes(), digest_size=16).hexdigest()
+
+    def record(self, offset: int) -> InflationData:
+        """Build the inflation record stored at a dense array offset."""
+        year, month = offset_period(offset)
+        target = self.targets[offset]
+        return InflationData(
+            year=year,
+            month=month,
+            annual_inflation_rate=self.rates[offset],
+            target=None if math.isnan(target) else target,
+        )
+
+    def row(self, index: int) -> InflationData:
+        """Build the inflation record at the given position among present records."""
+        return self.record(self.offsets[index])
+
+    def find(self, year: int, month: int) -> int | None:
+        """Get the dense array offset of a period, or None when it has no record."""
+        if not 1 <= month <= 12:
+            return None
+        offset = period_offset(year, month)
+        if 0 <= offset < len(self.rates) and not math.isnan(self.rates[offset]):
+            return offset
+        return None
+
+    def index_range(
+        self,
+        start: tuple[int, int] | None = None,
+        end: tuple[int, int] | None = None,
+    ) -> tuple[int, int]:
+        """Get the half-open ``[lo, hi)`` positions covering an inclusive (year, month) range."""
+        lo = 0 if start is None else bisect_left(self.offsets, period_offset(*start))
+        hi = len(self.offsets) if end is None else bisect_right(self.offsets, period_offset(*end))
+        return lo, max(lo, hi)
+
+
+class InflationStore(SeriesStore):
+    """Process-local copy of the inflation series."""
+
+    def __init__(self, ttl_seconds: float):
+        super().__init__(InflationSeries(), ttl_seconds)
+
+    def replace(
+        self,
+        rows: Iterable[tuple[int, int, float, float | None]],
+        version: int | None = None,
+        modified_at: datetime | None = None,
+    ) -> InflationSeries:
+        """Build a new snapshot and swap it in atomically.
+
+        Args:
+            rows: ``(year, month, annual_inflation_rate, target)`` tuples, in any order
+            version: Data version of the series the rows were read at, if known
+            modified_at: Modification time stored with that version, if any
+
+        Returns:
+            The new snapshot
+        """
+        rates = array("d")
+        targets = array("d")
+        for year, month, annual_inflation_rate, target in rows:
+            offset = period_offset(year, month)
+            if offset < 0:
+                continue
+            if offset >= len(rates):
+                padding = offset + 1 - len(rates)
+                rates.extend([math.nan] * padding)
+                targets.extend([math.nan] * padding)
+            rates[offset] = annual_inflation_rate
+            targets[offset] = math.nan if target is None else target
+
+        offsets = array("i", (offset for offset, rate in enumerate(rates) if not math.isnan(rate)))
+        series = InflationSeries(rates, targets, offsets)
+        self._swap(series, version, modified_at)
+
+        return series
+
+
+inflation_store = InflationStore(ttl_seconds=float(os.environ.get("INFLATION_STORE_TTL_SECONDS", "300")))
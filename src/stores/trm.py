@@ -0,0 +1,155 @@
+import hashlib
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime
+from functools import cached_property
+
+from src.schemas.trm import TRMData
+from src.stores.aggregates import RangeAggregates
+from src.stores.base import SeriesStore
+
+
+class TRMSeries:
+    """Immutable snapshot of the TRM series sorted by date.
+
+    Dates are stored as proleptic Gregorian ordinals (``date.toordinal()``) in an
+    int32 array and values in a float64 array, so lookups are plain bisects.
+    """
+
+    def __init__(
+        self,
+        ordinals: array | None = None,
+        values: array | None = None,
+        aggregates: RangeAggregates | None = None,
+    ):
+        self.ordinals = ordinals if ordinals is not None else array("i")
+        self.values = values if values is not None else array("d")
+        self._aggregates = aggregates
+        # Time (UTC) the series was last written, set by the store when it swaps the snapshot in
+        self.last_modified: datetime | None = None
+
+    @property
+    def aggregates(self) -> RangeAggregates:
+        """Range statistics over the values, built on first use."""
+        if self._aggregates is None:
+            self._aggregates = RangeAggregates.build(self.values)
+        return self._aggregates
+
+    def appended(self, trm_date: date, value: float) -> "TRMSeries":
+        """Get a new snapshot with one more TRM after the latest date.
+
+        The arrays are copied, so this is O(n) (O(n log n) with built aggregates, whose
+        tables are copied too), but the aggregates only compute their new entries
+        instead of being rebuilt.
+        """
+        ordinals = array("i", self.ordinals)
+        ordinals.append(trm_date.toordinal())
+        values = array("d", self.values)
+        values.append(value)
+        aggregates = self._aggregates.appended(value) if self._aggregates is not None else None
+
+        return TRMSeries(ordinals, values, aggregates)
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def last_day(self) -> date | None:
+        """Get the latest date with a TRM, or None when the series is empty."""
+        return date.fromordinal(self.ordinals[-1]) if self.ordinals else None
+
+    @cached_property
+    def digest(self) -> str:
+        """Content hash of the snapshot, used as the data version for HTTP validators."""
+        return hashlib.blake2b(self.ordinals.tobytes() + self.values.tobytes(), digest_size=16).hexdigest()
+
+    def row(self, index: int) -> TRMData:
+        """Build the TRM record stored at the given position."""
+        return TRMData(date=date.fromordinal(self.ordinals[index]), value=self.values[index])
+
+    def find(self, specific_date: date) -> int | None:
+        """Get the position of an exact date, or None when it is missing."""
+        ordinal = specific_date.toordinal()
+        index = bisect_left(self.ordinals, ordinal)
+        if index < len(self.ordinals) and self.ordinals[index] == ordinal:
+            return index
+        return None
+
+    def find_as_of(self, specific_date: date) -> int | None:
+        """Get the position of the latest date on or before the given one, or None when there is none."""
+        index = bisect_right(self.ordinals, specific_date.toordinal()) - 1
+        return index if index >= 0 else None
+
+    def find_many_as_of(self, dates: Iterable[date]) -> array:
+        """Get, for each date, the position of the latest TRM on or before it (-1 when there is none).
+
+        Repeated dates are resolved once, which keeps batches of invoice dates cheap.
+        """
+        ordinals = self.ordinals
+        positions = array("i")
+        resolved: dict[date, int] = {}
+        for specific_date in dates:
+            position = resolved.get(specific_date)
+            if position is None:
+                position = resolved[specific_date] = bisect_right(ordinals, specific_date.toordinal()) - 1
+            positions.append(position)
+        return positions
+
+    def index_range(self, start_date: date | None = None, end_date: date | None = None) -> tuple[int, int]:
+        """Get the half-open ``[lo, hi)`` positions covering an inclusive date range."""
+        lo = 0 if start_date is None else bisect_left(self.ordinals, start_date.toordinal())
+        hi = len(self.ordinals) if end_date is None else bisect_right(self.ordinals, end_date.toordinal())
+        return lo, max(lo, hi)
+
+
+class TRMStore(SeriesStore):
+    """Process-local copy of the TRM series."""
+
+    def __init__(self, ttl_seconds: float):
+        super().__init__(TRMSeries(), ttl_seconds)
+
+    def replace(
+        self, rows: Iterable[tuple[date, float]], version: int | None = None, modified_at: datetime | None = None
+    ) -> TRMSeries:
+        """Build a new snapshot from date-sorted rows and swap it in.
+
+        Args:
+            rows: ``(date, value)`` pairs sorted by date
+            version: Data version of the series the rows were read at, if known
+            modified_at: Modification time stored with that version, if any
+
+        Returns:
+            The new snapshot
+        """
+        ordinals = array("i")
+        values = array("d")
+        for trm_date, value in rows:
+            ordinals.append(trm_date.toordinal())
+            values.append(value)
+
+        series = TRMSeries(ordinals, values)
+        self._swap(series, version, modified_at)
+
+        return series
+
+    def append(self, trm_date: date, value: float, modified_at: datetime | None = None) -> bool:
+        """Add a TRM past the end of the loaded series without reloading it.
+
+        Args:
+            trm_date: Date of the new TRM
+            value: Value of the new TRM
+            modified_at: Modification time stamped by the write of the new TRM
+
+        Returns:
+            False when the date does not come after the latest one, so the series must be reloaded instead
+        """
+        series = self.series
+        if series.ordinals and trm_date.toordinal() <= series.ordinals[-1]:
+            return False
+
+        self._swap(series.appended(trm_date, value), modified_at=modified_at)
+        return True
+
+
+trm_store = TRMStore(ttl_seconds=float(os.environ.get("TRM_STORE_TTL_SECONDS", "300")))
@@ -1,46 +1,115 @@
 from typing import Literal
 
-from sqlalchemy import asc, desc
 from sqlalchemy.orm import Query, Session
 
+from src.db.bulk import insert_missing, update_by_key
+from src.db.data_version import INFLATION_SERIES, bump_data_version, read_data_stamp
+from src.db.executor import run_in_db_thread
+from src.db.replica import REPLICA_MAX_LAG_SECONDS, replica_sync
 from src.models.inflation import Inflation
 from src.schemas.inflation import InflationData, InflationDateRange
+from src.stores.base import SeriesView
+from src.stores.inflation import InflationSeries, InflationStore, inflation_store, offset_period, period_offset
+
+STORE_LOAD_CHUNK_SIZE = 2000
 
 
 class InflationUseCase:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, store: InflationStore = inflation_store):
         self.db_session = db_session
+        self.store = store
+
+    async def refresh_store(self) -> InflationSeries:
+        """
+        Reload the in-memory inflation series from the database.
+
+        Returns:
+            The freshly loaded inflation series snapshot
+        """
+        query = self.db_session.query(Inflation).with_entities(
+            Inflation.year,
+            Inflation.month,
+            Inflation.annual_inflation_rate,
+            Inflation.target,
+        )
+        try:
+            if replica_sync.serves(self.db_session):
+                # The local replica only holds what it has pulled from the primary so far
+                await run_in_db_thread(replica_sync.sync_if_older_than, REPLICA_MAX_LAG_SECONDS)
+            # Rows are streamed in chunks straight into the store arrays
+            return await run_in_db_thread(self._reload_store, query)
+        except Exception:
+            self.store.release_refresh()
+            raise
+
+    def _reload_store(self, query: Query) -> InflationSeries:
+        # The version is read first, in the same transaction: rows committed in between
+        # only make the snapshot newer than its version, which costs one extra reload at worst
+        stamp = read_data_stamp(self.db_session, INFLATION_SERIES)
+        return self.store.replace(
+            query.yield_per(STORE_LOAD_CHUNK_SIZE), version=stamp.version, modified_at=stamp.modified_at
+        )
+
+    async def get_series(self) -> InflationSeries:
+        """
+        Get the in-memory inflation series, loading it first if it is missing or stale.
+
+        Returns:
+            The current inflation series snapshot
+        """
+        if not self.store.is_stale():
+            return self.store.series
+        # Keep serving the current snapshot while another request reloads it
+        if self.store.is_loaded() and not self.store.claim_refresh():
+            return self.store.series
+
+        return await self.refresh_store()
 
     async def get_paginated_inflation_data(
         self,
         sort_order: Literal["asc", "desc"] = "desc",
-    ) -> Query:
+    ) -> SeriesView:
         """
-        Get inflation data query with sorting and optional date range filtering.
+        Get inflation data with sorting.
 
         Args:
             sort_order: Sort order for year and month ('asc' or 'desc')
-            from_date: Optional start date as (year, month)
-            to_date: Optional end date as (year, month)
 
         Returns:
-            SQLAlchemy Query object ready for pagination
+            Sorted view over the inflation series, ready for pagination
         """
-        query = self.db_session.query(Inflation)
-        query = query.with_entities(
-            Inflation.year,
-            Inflation.month,
-            Inflation.annual_inflation_rate,
-            Inflation.target,
-        )
+        series = await self.get_series()
+        return SeriesView(series, 0, len(series), descending=sort_order == "desc")
+
+    async def get_inflation_data_by_cursor(
+        self,
+        after: tuple[int, int] | None,
+        size: int,
+        sort_order: Literal["asc", "desc"] = "desc",
+    ) -> tuple[list[InflationData], tuple[int, int] | None]:
+        """
+        Get a page of inflation data that starts right after a given period (keyset pagination).
+
+        Args:
+            after: (year, month) of the last record of the previous page, None for the first page
+            size: Maximum number of records to return
+            sort_order: Sort order for year and month ('asc' or 'desc')
+
+        Returns:
+            The page records and the (year, month) to resume from, None when there are no more records
+        """
+        series = await self.get_series()
 
-        # Apply sorting
-        if sort_order == "desc":
-            query = query.order_by(desc(Inflation.year), desc(Inflation.month))
+        if sort_order == "asc":
+            lo, hi = series.index_range(start=offset_period(period_offset(*after) + 1) if after else None)
         else:
-            query = query.order_by(asc(Inflation.year), asc(Inflation.month))
+            lo, hi = series.index_range(end=offset_period(period_offset(*after) - 1) if after else None)
+
+        inflation_view = SeriesView(series, lo, hi, descending=sort_order == "desc")
+        items = inflation_view[:size]
+        next_after = (items[-1].year, items[-1].month) if len(inflation_view) > size else None
 
-        return query
+        return items, next_after
 
     async def get_inflation_data_by_exact_date(self, year: int, month: int) -> InflationData | None:
         """
@@ -54,61 +123,49 @@ class InflationUseCase:
             The inflation record if found, None otherwise
         """
 
-        query = self.db_session.query(Inflation)
+        series = await self.get_series()
+        offset = series.find(year, month)
 
-        query = query.with_entities(
-            Inflation.year,
-            Inflation.month,
-            Inflation.annual_inflation_rate,
-            Inflation.target,
-        )
+        return series.record(offset) if offset is not None else None
+
+    async def get_inflation_data_by_periods(self, periods: list[tuple[int, int]]) -> list[InflationData | None]:
+        """
+        Get inflation records for many (year, month) periods at once.
+
+        Args:
+            periods: The (year, month) periods to search for
 
-        record = query.filter(Inflation.year == year, Inflation.month == month).first()
+        Returns:
+            The inflation record of each period, in input order, with None for periods without data
+        """
 
-        inflation = InflationData.model_validate(record) if record else None
+        series = await self.get_series()
+        offsets = (series.find(year, month) for year, month in periods)
 
-        return inflation
+        return [series.record(offset) if offset is not None else None for offset in offsets]
 
     async def get_inflation_data_by_date_range(
         self,
         date_range: InflationDateRange,
         sort_order: Literal["asc", "desc"] = "asc",
-    ) -> Query:
+    ) -> SeriesView:
         """
-        Get inflation data filtered by date range without pagination.
+        Get inflation data filtered by date range.
 
         Args:
             date_range: Date range parameters for filtering
             sort_order: Sort order for year and month ('asc' or 'desc')
 
         Returns:
-            List of inflation data records within the specified date range
+            Sorted view over the inflation records within the date range, ready for pagination
         """
-        query = self.db_session.query(Inflation)
-
-        query = query.with_entities(
-            Inflation.year,
-            Inflation.month,
-            Inflation.annual_inflation_rate,
-            Inflation.target,
-        )
-
-        # Apply date range filter
-        query = query.filter(
-            ((Inflation.year == date_range.start_year) & (Inflation.month >= date_range.start_month))
-            | (Inflation.year > date_range.start_year)
-        ).filter(
-            ((Inflation.year == date_range.end_year) & (Inflation.month <= date_range.end_month))
-            | (Inflation.year < date_range.end_year)
+        series = await self.get_series()
+        lo, hi = series.index_range(
+            (date_range.start_year, date_range.start_month),
+            (date_range.end_year, date_range.end_month),
         )
 
-        # Apply sorting
-        if sort_order == "desc":
-            query = query.order_by(desc(Inflation.year), desc(Inflation.month))
-        else:
-            query = query.order_by(asc(Inflation.year), asc(Inflation.month))
-
-        return query
+        return SeriesView(series, lo, hi, descending=sort_order == "desc")
 
     async def insert_inflation_data(self, inflation_data: InflationData) -> None:
         """
@@ -118,6 +175,12 @@ class InflationUseCase:
             inflation_data: The inflation data to insert
         """
 
+        inserted = await run_in_db_thread(self._insert_inflation_record, inflation_data)
+        # A series that was never loaded in this process is loaded on its first read
+        if inserted and self.store.is_loaded():
+            await self.refresh_store()
+
+    def _insert_inflation_record(self, inflation_data: InflationData) -> bool:
         inflation_existing_record = (
             self.db_session.query(Inflation)
             .filter(Inflation.year == inflation_data.year, Inflation.month == inflation_data.month)
@@ -125,7 +188,7 @@ class InflationUseCase:
         )
 
         if inflation_existing_record:
-            return
+            return False
 
         new_record = Inflation(
             year=inflation_data.year,
@@ -134,4 +197,53 @@ class InflationUseCase:
             target=inflation_data.target,
         )
         self.db_session.add(new_record)
+        bump_data_version(self.db_session, INFLATION_SERIES)
         self.db_session.commit()
+        return True
+
+    async def sync_inflation_series(self, records: list[InflationData]) -> tuple[int, int]:
+        """
+        Bring the stored inflation series in line with a full download of it.
+
+        The records are diffed in memory against the stored periods: new periods are
+        inserted and periods whose rate or target changed (revisions) are updated,
+        all in a single transaction. Stored periods absent from ``records`` are kept.
+
+        Args:
+            records: Every period of the downloaded series
+
+        Returns:
+            Number of inserted and of updated periods
+        """
+
+        inserted, updated = await run_in_db_thread(self._sync_inflation_records, records)
+        if (inserted or updated) and self.store.is_loaded():
+            await self.refresh_store()
+        return inserted, updated
+
+    def _sync_inflation_records(self, records: list[InflationData]) -> tuple[int, int]:
+        stored = {
+            (year, month): (rate, target)
+            for year, month, rate, target in self.db_session.query(Inflation).with_entities(
+                Inflation.year, Inflation.month, Inflation.annual_inflation_rate, Inflation.target
+            )
+        }
+        new_rows, changed_rows = [], []
+        for record in records:
+            row = record.model_dump()
+            current = stored.get((record.year, record.month))
+            if current is None:
+                new_rows.append(row)
+            elif current != (record.annual_inflation_rate, record.target):
+                changed_rows.append(row)
+
+        try:
+            inserted = insert_missing(self.db_session, Inflation, new_rows, conflict_columns=["year", "month"])
+            updated = update_by_key(self.db_session, Inflation, changed_rows, key_columns=["year", "month"])
+            if inserted or updated:
+                bump_data_version(self.db_session, INFLATION_SERIES)
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+        return inserted, updated
@@ -1,22 +1,82 @@
-from datetime import date
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
 from typing import Literal
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
+from src.db.bulk import insert_missing
+from src.db.data_version import TRM_SERIES, DataStamp, bump_data_version, read_data_stamp
+from src.db.executor import run_in_db_thread
+from src.db.replica import REPLICA_MAX_LAG_SECONDS, replica_sync
 from src.models.trm import TRM
-from src.schemas.trm import TRMData
+from src.schemas.trm import TRMAggregate, TRMConversionResponse, TRMData
+from src.stores.base import SeriesView
+from src.stores.trm import TRMSeries, TRMStore, trm_store
+
+STORE_LOAD_CHUNK_SIZE = 2000
+
+_PERIOD_MONTHS = {"month": 1, "quarter": 3, "year": 12}
+
+
+def _next_period_start(day: date, period: Literal["month", "quarter", "year"]) -> date:
+    """Get the first day of the calendar period following the one that contains a date."""
+    months = _PERIOD_MONTHS[period]
+    next_month_index = day.year * 12 + (day.month - 1) // months * months + months
+    return date(next_month_index // 12, next_month_index % 12 + 1, 1)
 
 
 class TRMUseCase:
     """Use case for TRM (Tasa Representativa del Mercado) operations."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, store: TRMStore = trm_store):
         self.db_session = db_session
+        self.store = store
+
+    async def refresh_store(self) -> TRMSeries:
+        """
+        Reload the in-memory TRM series from the database.
+
+        Returns:
+            The freshly loaded TRM series snapshot
+        """
+        query = self.db_session.query(TRM).with_entities(TRM.date, TRM.value).order_by(TRM.date.asc())
+        try:
+            if replica_sync.serves(self.db_session):
+                # The local replica only holds what it has pulled from the primary so far
+                await run_in_db_thread(replica_sync.sync_if_older_than, REPLICA_MAX_LAG_SECONDS)
+            # Rows are streamed in chunks straight into the store arrays
+            return await run_in_db_thread(self._reload_store, query)
+        except Exception:
+            self.store.release_refresh()
+            raise
+
+    def _reload_store(self, query: Query) -> TRMSeries:
+        # The version is read first, in the same transaction: rows committed in between
+        # only make the snapshot newer than its version, which costs one extra reload at worst
+        stamp = read_data_stamp(self.db_session, TRM_SERIES)
+        return self.store.replace(
+            query.yield_per(STORE_LOAD_CHUNK_SIZE), version=stamp.version, modified_at=stamp.modified_at
+        )
+
+    async def get_series(self) -> TRMSeries:
+        """
+        Get the in-memory TRM series, loading it first if it is missing or stale.
+
+        Returns:
+            The current TRM series snapshot
+        """
+        if not self.store.is_stale():
+            return self.store.series
+        # Keep serving the current snapshot while another request reloads it
+        if self.store.is_loaded() and not self.store.claim_refresh():
+            return self.store.series
+
+        return await self.refresh_store()
 
     async def get_paginated_trm_data(
         self,
         sort_order: Literal["asc", "desc"] = "desc",
-    ):
+    ) -> SeriesView:
         """
         Get paginated TRM data with optional sorting.
 
@@ -24,43 +84,182 @@ class TRMUseCase:
             sort_order: Sort order by date ('asc' or 'desc')
 
         Returns:
-            Query object for paginated TRM data
+            Sorted view over the TRM series, ready for pagination
         """
-        query = self.db_session.query(TRM)
-        query = query.with_entities(TRM.date, TRM.value)
+        series = await self.get_series()
+        return SeriesView(series, 0, len(series), descending=sort_order == "desc")
 
-        if sort_order == "asc":
-            query = query.order_by(TRM.date.asc())
-        else:
-            query = query.order_by(TRM.date.desc())
+    async def get_trm_data_by_cursor(
+        self,
+        after: date | None,
+        size: int,
+        sort_order: Literal["asc", "desc"] = "desc",
+    ) -> tuple[list[TRMData], date | None]:
+        """
+        Get a page of TRM data that starts right after a given date (keyset pagination).
 
-        return query
+        Args:
+            after: Date of the last record of the previous page, None for the first page
+            size: Maximum number of records to return
+            sort_order: Sort order by date ('asc' or 'desc')
 
-    async def get_trm_by_date(self, specific_date: date) -> TRMData | None:
+        Returns:
+            The page records and the date to resume from, None when there are no more records
+        """
+        series = await self.get_series()
+
+        # Seek on the ordinals themselves: stepping a day past the cursor overflows at date.min/date.max
+        lo, hi = 0, len(series)
+        if after is not None and sort_order == "asc":
+            lo = bisect_right(series.ordinals, after.toordinal())
+        elif after is not None:
+            hi = bisect_left(series.ordinals, after.toordinal())
+
+        trm_view = SeriesView(series, lo, hi, descending=sort_order == "desc")
+        items = trm_view[:size]
+        next_after = items[-1].date if len(trm_view) > size else None
+
+        return items, next_after
+
+    async def get_trm_by_date(self, specific_date: date, as_of: bool = False) -> TRMData | None:
         """
         Get TRM data for a specific date.
 
         Args:
             specific_date: The date to query for
+            as_of: Fall back to the latest TRM on or before the date when it has none
 
         Returns:
             TRM data for the specified date if found, None otherwise
         """
 
-        query = self.db_session.query(TRM)
-        query = query.with_entities(TRM.date, TRM.value)
-        record = query.filter(TRM.date == specific_date).first()
+        series = await self.get_series()
+        index = series.find_as_of(specific_date) if as_of else series.find(specific_date)
+
+        return series.row(index) if index is not None else None
+
+    async def get_trm_by_dates(self, dates: list[date], as_of: bool = False) -> list[TRMData | None]:
+        """
+        Get TRM data for many dates at once.
+
+        Args:
+            dates: The dates to query for
+            as_of: Fall back to the latest TRM on or before each date when it has none
+
+        Returns:
+            TRM data for each date, in input order, with None for dates without data
+        """
+
+        series = await self.get_series()
+        find = series.find_as_of if as_of else series.find
+        indexes = (find(specific_date) for specific_date in dates)
+
+        return [series.row(index) if index is not None else None for index in indexes]
+
+    async def convert_amounts(
+        self,
+        amounts: list[float],
+        dates: list[date],
+        directions: list[Literal["usd_to_cop", "cop_to_usd"]],
+    ) -> TRMConversionResponse:
+        """
+        Convert amounts between USD and COP with the TRM applicable on each date.
+
+        The applicable TRM is the latest one on or before each date (as-of resolution).
+
+        Args:
+            amounts: Amounts to convert
+            dates: Date of each amount
+            directions: Conversion direction of each amount
+
+        Returns:
+            Converted amounts with the TRM and TRM date used for each, None where no TRM applies
+        """
 
-        trm = TRMData.model_validate(record) if record else None
+        series = await self.get_series()
+        positions = series.find_many_as_of(dates)
+        values = series.values
+        ordinals = series.ordinals
 
-        return trm
+        converted: list[float | None] = []
+        rates: list[float | None] = []
+        rate_dates: list[date | None] = []
+        for amount, position, direction in zip(amounts, positions, directions, strict=True):
+            if position < 0:
+                converted.append(None)
+                rates.append(None)
+                rate_dates.append(None)
+                continue
+            rate = values[position]
+            converted.append(amount * rate if direction == "usd_to_cop" else amount / rate)
+            rates.append(rate)
+            rate_dates.append(date.fromordinal(ordinals[position]))
+
+        return TRMConversionResponse(amounts=converted, rates=rates, rate_dates=rate_dates)
+
+    async def get_trm_aggregates(
+        self,
+        start_date: date,
+        end_date: date,
+        period: Literal["month", "quarter", "year"],
+        stat: Literal["mean", "min", "max", "ohlc"],
+    ) -> list[TRMAggregate]:
+        """
+        Get TRM statistics per calendar period within a date range.
+
+        Each period costs two bisects plus O(1) lookups in the series prefix sums and
+        min/max sparse tables, whatever the number of days it spans.
+
+        Args:
+            start_date: Start date of the range
+            end_date: End date of the range
+            period: Calendar period to group by ('month', 'quarter' or 'year')
+            stat: Statistic to compute ('mean', 'min', 'max' or 'ohlc')
+
+        Returns:
+            One aggregate per period holding at least one TRM, in chronological order
+        """
+
+        series = await self.get_series()
+        if not len(series):
+            return []
+
+        aggregates = series.aggregates
+        start_date = max(start_date, date.fromordinal(series.ordinals[0]))
+        end_date = min(end_date, date.fromordinal(series.ordinals[-1]))
+
+        results = []
+        period_start = start_date
+        while period_start <= end_date:
+            next_period_start = _next_period_start(period_start, period)
+            period_end = min(next_period_start - timedelta(days=1), end_date)
+            lo, hi = series.index_range(period_start, period_end)
+
+            if hi > lo:
+                aggregate = TRMAggregate(period_start=period_start, period_end=period_end, count=hi - lo)
+                if stat == "mean":
+                    aggregate.mean = aggregates.mean(lo, hi)
+                elif stat == "min":
+                    aggregate.min = aggregates.minimum(lo, hi)
+                elif stat == "max":
+                    aggregate.max = aggregates.maximum(lo, hi)
+                else:
+                    aggregate.open = series.values[lo]
+                    aggregate.high = aggregates.maximum(lo, hi)
+                    aggregate.low = aggregates.minimum(lo, hi)
+                    aggregate.close = series.values[hi - 1]
+                results.append(aggregate)
+
+            period_start = next_period_start
+
+        return results
 
     async def get_trm_by_date_range(
         self,
         start_date: date,
         end_date: date,
         sort_order: Literal["asc", "desc"] = "desc"
-    ):
+    ) -> SeriesView:
         """
         Get TRM data for a specific date range.
 
@@ -70,23 +269,13 @@ class TRMUseCase:
             sort_order: Sort order by date ('asc' or 'desc')
 
         Returns:
-            Query object for TRM data within the date range
+            Sorted view over the TRM data within the date range, ready for pagination
         """
 
-        query = self.db_session.query(TRM)
-        query = query.with_entities(TRM.date, TRM.value)
-
-        query = query.filter(
-            TRM.date >= start_date,
-            TRM.date <= end_date
-        )
-
-        if sort_order == "asc":
-            query = query.order_by(TRM.date.asc())
-        else:
-            query = query.order_by(TRM.date.desc())
+        series = await self.get_series()
+        lo, hi = series.index_range(start_date, end_date)
 
-        return query
+        return SeriesView(series, lo, hi, descending=sort_order == "desc")
 
     async def insert_trm_data(self, trm_data: TRMData) -> None:
         """
@@ -96,10 +285,80 @@ class TRMUseCase:
             trm_data: The TRM data to insert
         """
 
+        stamp = await run_in_db_thread(self._insert_trm_record, trm_data)
+        # A series that was never loaded in this process is loaded on its first read
+        if stamp is None or not self.store.is_loaded():
+            return
+
+        if self.store.is_stale() or not self.store.append(trm_data.date, trm_data.value, stamp.modified_at):
+            await self.refresh_store()
+
+    def _insert_trm_record(self, trm_data: TRMData) -> DataStamp | None:
         trm_existing_record = self.db_session.query(TRM).filter(TRM.date == trm_data.date).first()
         if trm_existing_record:
-            return
+            return None
 
         new_trm_record = TRM(date=trm_data.date, value=trm_data.value)
         self.db_session.add(new_trm_record)
+        stamp = bump_data_version(self.db_session, TRM_SERIES)
         self.db_session.commit()
+        return stamp
+
+    async def find_missing_date_ranges(self, start_date: date, end_date: date) -> list[tuple[date, date]]:
+        """
+        Find the days without a TRM record within a date range.
+
+        Args:
+            start_date: First day expected to have a record
+            end_date: Last day expected to have a record
+
+        Returns:
+            Inclusive (first, last) ranges of consecutive missing days, in date order
+        """
+
+        return await run_in_db_thread(self._missing_date_ranges, start_date, end_date)
+
+    def _missing_date_ranges(self, start_date: date, end_date: date) -> list[tuple[date, date]]:
+        stored_dates = (
+            self.db_session.query(TRM.date)
+            .filter(TRM.date.between(start_date, end_date))
+            .order_by(TRM.date.asc())
+            .yield_per(STORE_LOAD_CHUNK_SIZE)
+        )
+        missing = []
+        expected = start_date
+        for (stored,) in stored_dates:
+            if stored > expected:
+                missing.append((expected, stored - timedelta(days=1)))
+            expected = stored + timedelta(days=1)
+        if expected <= end_date:
+            missing.append((expected, end_date))
+        return missing
+
+    async def insert_trm_batch(self, records: list[TRMData]) -> int:
+        """
+        Insert TRM records in a single transaction, skipping the dates already stored.
+
+        Args:
+            records: TRM data to insert
+
+        Returns:
+            Number of records actually inserted
+        """
+
+        inserted = await run_in_db_thread(self._insert_trm_batch, records)
+        if inserted and self.store.is_loaded():
+            await self.refresh_store()
+        return inserted
+
+    def _insert_trm_batch(self, records: list[TRMData]) -> int:
+        rows = ({"date": record.date, "value": record.value} for record in records)
+        try:
+            inserted = insert_missing(self.db_session, TRM, rows, conflict_columns=["date"])
+            if inserted:
+                bump_data_version(self.db_session, TRM_SERIES)
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+        return inserted
@@ -1,14 +1,20 @@
 import os
-from typing import Generator
+from collections.abc import Generator
+from functools import partial
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import StaticPool, create_engine
 from sqlalchemy.orm import Session
 
+from src.db.probe import database_probe
 from src.db.session import database_session
+from src.jobs.tasks import get_daily_trm, get_monthly_inflation, http_client
 from src.main import app
 from src.models.base import Base
+from src.stores.inflation import inflation_store
+from src.stores.trm import trm_store
+from tests.stub_banrep import StubBanRep
 
 
 @pytest.fixture(scope="function")
@@ -26,9 +32,30 @@ def db_session_test():
 
 
 @pytest.fixture(scope="function")
-def client(db_session_test: Session) -> Generator[TestClient, None, None]:
+def client(db_session_test: Session) -> Generator[TestClient]:
     def override_get_db():
         return db_session_test
+
     app.dependency_overrides[database_session.get_db] = override_get_db
+    # Health probes open and close their own sessions on the test database
+    session_factory = partial(Session, db_session_test.get_bind())
+    app.dependency_overrides[database_session.get_session_factory] = lambda: session_factory
+    trm_store.invalidate()
+    inflation_store.invalidate()
+    database_probe.reset()
     yield TestClient(app)
     app.dependency_overrides.clear()
+    trm_store.invalidate()
+    inflation_store.invalidate()
+    database_probe.reset()
+
+
+@pytest.fixture
+def stub(monkeypatch) -> Generator[StubBanRep]:
+    """Local stand-in for the BanRep services, with retries waiting only briefly."""
+    stub = StubBanRep()
+    monkeypatch.setattr(get_daily_trm, "BANREP_WEB_SERVICE_URL", f"{stub.url}/banrep")
+    monkeypatch.setattr(get_monthly_inflation, "INFLATION_WEB_SERVICE_URL", f"{stub.url}/inflation")
+    monkeypatch.setattr(http_client, "backoff_seconds", lambda attempt: 0.01)
+    yield stub
+    stub.close()
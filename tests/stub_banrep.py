@@ -0,0 +1,49 @@
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubBanRep:
+    """Local HTTP server answering each path from a queue of (status, content type, body, delay) replies.
+
+    The last reply of a queue is repeated once the others are used up.
+    """
+
+    def __init__(self):
+        self.replies = defaultdict(list)
+        self.hits = defaultdict(int)
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                stub.hits[path] += 1
+                stub.requests.append(self.path)
+                queue = stub.replies[path]
+                status, content_type, body, delay = queue.pop(0) if len(queue) > 1 else queue[0]
+                time.sleep(delay)
+                payload = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def reply(self, path, *replies):
+        self.replies[path] = [(*reply, 0.0)[:4] for reply in replies]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
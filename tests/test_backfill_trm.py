@@ -0,0 +1,120 @@
+import asyncio
+from datetime import date, timedelta
+
+from sqlalchemy.orm import Session
+
+from src.jobs.tasks.backfill_trm import TRM_HISTORY_DATAFLOW, backfill_trm, merge_date_ranges
+from src.jobs.tasks.http_client import create_http_client
+from src.models.trm import TRM
+from src.use_cases.trm import TRMUseCase
+
+HISTORY_PATH = f"/banrep/{TRM_HISTORY_DATAFLOW}/"
+
+
+def sdmx_message(observations: dict[date, float | None]) -> str:
+    obs = "".join(
+        f'<generic:Obs><generic:ObsDimension value="{day.isoformat()}"/>'
+        + (f'<generic:ObsValue value="{value}"/>' if value is not None else "")
+        + "</generic:Obs>"
+        for day, value in observations.items()
+    )
+    return (
+        '<message:GenericData xmlns:message="m" xmlns:generic="g"><message:DataSet>'
+        f"<generic:Series>{obs}</generic:Series></message:DataSet></message:GenericData>"
+    )
+
+
+def store_days(db_session: Session, first: date, last: date, skip: set[date]) -> None:
+    day = first
+    while day <= last:
+        if day not in skip:
+            db_session.add(TRM(date=day, value=4000.0))
+        day += timedelta(days=1)
+    db_session.commit()
+
+
+def test_find_missing_date_ranges(db_session_test: Session):
+    """Test interior gaps and the days after the last stored one are found."""
+    store_days(db_session_test, date(2024, 1, 1), date(2024, 1, 10), skip={date(2024, 1, 4), date(2024, 1, 5)})
+
+    missing = asyncio.run(TRMUseCase(db_session_test).find_missing_date_ranges(date(2023, 12, 30), date(2024, 1, 12)))
+
+    assert missing == [
+        (date(2023, 12, 30), date(2023, 12, 31)),
+        (date(2024, 1, 4), date(2024, 1, 5)),
+        (date(2024, 1, 11), date(2024, 1, 12)),
+    ]
+
+
+def test_merge_date_ranges():
+    """Test close gaps share one request and distant ones keep their own."""
+    ranges = [
+        (date(2024, 1, 4), date(2024, 1, 5)),
+        (date(2024, 1, 20), date(2024, 1, 20)),
+        (date(2024, 5, 1), date(2024, 5, 2)),
+    ]
+
+    assert merge_date_ranges(ranges, max_gap_days=31) == [
+        (date(2024, 1, 4), date(2024, 1, 20)),
+        (date(2024, 5, 1), date(2024, 5, 2)),
+    ]
+
+
+def test_backfill_fetches_only_missing_ranges(db_session_test: Session, stub):
+    """Test each distant gap is one range query and only missing days are inserted."""
+    skip = {date(2024, 1, 4), date(2024, 1, 5), date(2024, 5, 10)}
+    store_days(db_session_test, date(2024, 1, 1), date(2024, 6, 30), skip=skip)
+    stub.reply(
+        HISTORY_PATH,
+        (
+            200,
+            "application/xml",
+            sdmx_message(
+                {
+                    date(2024, 1, 4): 3950.5,
+                    date(2024, 1, 5): 3960.25,
+                    # Already stored: left untouched
+                    date(2024, 1, 6): 1.0,
+                    date(2024, 5, 10): None,
+                    date(2024, 5, 11): 3900.0,
+                }
+            ),
+        ),
+        (200, "application/xml", sdmx_message({date(2024, 5, 10): 3890.75})),
+    )
+
+    async def run():
+        async with create_http_client() as client:
+            return await backfill_trm(client, db_session_test, since=date(2024, 1, 1), until=date(2024, 6, 30))
+
+    report = asyncio.run(run())
+
+    assert (report.missing_days, report.requests, report.fetched, report.inserted) == (3, 2, 3, 3)
+    assert stub.requests == [
+        f"{HISTORY_PATH}?startPeriod=2024-01-04&endPeriod=2024-01-05",
+        f"{HISTORY_PATH}?startPeriod=2024-05-10&endPeriod=2024-05-10",
+    ]
+    values = dict(db_session_test.query(TRM.date, TRM.value).filter(TRM.date.in_(skip | {date(2024, 1, 6)})))
+    assert values == {
+        date(2024, 1, 4): 3950.5,
+        date(2024, 1, 5): 3960.25,
+        date(2024, 1, 6): 4000.0,
+        date(2024, 5, 10): 3890.75,
+    }
+
+
+def test_backfill_dry_run_sends_nothing(db_session_test: Session, stub):
+    """Test a dry run only reports the ranges."""
+    store_days(db_session_test, date(2024, 1, 1), date(2024, 1, 10), skip={date(2024, 1, 4)})
+
+    async def run():
+        async with create_http_client() as client:
+            return await backfill_trm(
+                client, db_session_test, since=date(2024, 1, 1), until=date(2024, 1, 12), dry_run=True
+            )
+
+    report = asyncio.run(run())
+
+    assert (report.missing_days, report.requests, report.inserted) == (3, 1, 0)
+    assert stub.requests == []
+    assert db_session_test.query(TRM).count() == 9
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from src.db.scripts.bulk_load import InvalidRowError, bulk_load
+from src.models.inflation import Inflation
+from src.models.trm import TRM
+
+
+def write_csv(tmp_path, name: str, content: str) -> str:
+    path = tmp_path / name
+    path.write_text(content)
+    return str(path)
+
+
+def test_bulk_load_trm_is_idempotent(db_session_test: Session, tmp_path):
+    """Test a rerun inserts nothing and duplicates within the file are skipped."""
+    path = write_csv(tmp_path, "trm.csv", "date,value\n2023/01/01,4850.5\n2023/01/02,4855.75\n2023/01/02,4855.75\n")
+
+    first = bulk_load(db_session_test, "trm", path, chunk_size=2)
+    assert (first.read, first.inserted, first.skipped) == (3, 2, 1)
+
+    second = bulk_load(db_session_test, "trm", path, chunk_size=2)
+    assert (second.read, second.inserted) == (3, 0)
+    assert db_session_test.query(TRM).count() == 2
+
+
+def test_bulk_load_inflation(db_session_test: Session, tmp_path):
+    """Test inflation rows are keyed by period and keep missing targets as NULL."""
+    db_session_test.add(Inflation(year=1955, month=7, annual_inflation_rate=-0.87, target=None))
+    db_session_test.commit()
+    path = write_csv(tmp_path, "inflation.csv", "date,target,inflation rate\n1955/07/31,,-0.87\n2023/01/31,3,13.25\n")
+
+    report = bulk_load(db_session_test, "inflation", path)
+
+    assert (report.read, report.inserted) == (2, 1)
+    rows = db_session_test.query(Inflation).order_by(Inflation.year).all()
+    assert [(row.year, row.month, row.annual_inflation_rate, row.target) for row in rows] == [
+        (1955, 7, -0.87, None),
+        (2023, 1, 13.25, 3.0),
+    ]
+
+
+def test_bulk_load_invalid_row_writes_nothing(db_session_test: Session, tmp_path):
+    """Test an invalid row aborts the load, rolling back the chunks already sent."""
+    path = write_csv(tmp_path, "trm.csv", "date,value\n2023/01/01,4850.5\n2023/01/02,4855.75\n2023-01-03,1\n")
+
+    with pytest.raises(InvalidRowError, match="trm.csv:4"):
+        bulk_load(db_session_test, "trm", path, chunk_size=1)
+
+    assert db_session_test.query(TRM).count() == 0
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from src.routes.caching import seconds_until_next_run
+
+
+def test_seconds_until_next_daily_run():
+    """Test a daily job cadence rolls over to the next day once the run time has passed."""
+    assert seconds_until_next_run("00:00", now=datetime(2024, 5, 10, 23, 0)) == 3600
+    assert seconds_until_next_run("00:00", now=datetime(2024, 5, 10, 0, 0)) == 86400
+
+
+def test_seconds_until_next_weekly_run():
+    """Test a weekly job cadence targets the next matching weekday."""
+    # 2024-05-08 is a Wednesday
+    assert seconds_until_next_run("00:00", weekday="friday", now=datetime(2024, 5, 8, 12, 0)) == 36 * 3600
+    # Right at the Friday run the next one is a week away
+    assert seconds_until_next_run("00:00", weekday="friday", now=datetime(2024, 5, 10, 0, 0)) == 7 * 86400
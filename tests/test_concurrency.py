@@ -0,0 +1,76 @@
+import asyncio
+import time
+from datetime import date
+
+import httpx
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db.session import database_session
+from src.main import app
+from src.models.base import Base
+from src.models.inflation import Inflation
+from src.models.trm import TRM
+from src.stores.inflation import inflation_store
+from src.stores.trm import trm_store
+
+DB_LATENCY = 0.3
+
+
+@pytest.fixture(scope="function")
+def slow_db(tmp_path):
+    """Seeded file database whose statements each block their thread like a remote libSQL round trip.
+
+    Yields:
+        Durations slept, one per statement executed by the requests
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'slow.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with session_local() as db_session:
+        db_session.add_all([TRM(date=date(2024, 1, day), value=4000.0 + day) for day in range(1, 4)])
+        db_session.add_all([Inflation(year=2024, month=month, annual_inflation_rate=8.0) for month in range(1, 4)])
+        db_session.commit()
+
+    delays = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def slow_down(*args):
+        delays.append(DB_LATENCY)
+        time.sleep(DB_LATENCY)
+
+    def get_db():
+        db_session = session_local()
+        try:
+            yield db_session
+        finally:
+            db_session.close()
+
+    app.dependency_overrides[database_session.get_db] = get_db
+    trm_store.invalidate()
+    inflation_store.invalidate()
+    yield delays
+    app.dependency_overrides.clear()
+    trm_store.invalidate()
+    inflation_store.invalidate()
+    engine.dispose()
+
+
+async def _fire_concurrent_requests(*paths: str) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*(client.get(path) for path in paths))
+
+
+def test_blocking_db_calls_do_not_serialize_requests(slow_db):
+    """Test requests waiting on the database overlap instead of queueing on the event loop."""
+    started = time.perf_counter()
+    responses = asyncio.run(_fire_concurrent_requests("/v1/trm", "/v1/inflation"))
+    elapsed = time.perf_counter() - started
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert [len(response.json()["items"]) for response in responses] == [3, 3]
+    # Each request loads its own series with the same statements, so overlapping takes
+    # about half the time the statements would take one after the other on the event loop
+    assert elapsed < sum(slow_db) * 0.75
@@ -0,0 +1,119 @@
+import asyncio
+from datetime import UTC, date, datetime
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.db.data_version import (
+    INFLATION_SERIES,
+    TRM_SERIES,
+    DataVersionPoller,
+    bump_data_version,
+    read_data_stamp,
+    read_data_versions,
+)
+from src.schemas.inflation import InflationData
+from src.schemas.trm import TRMData
+from src.stores.inflation import InflationStore
+from src.stores.trm import TRMStore
+from src.use_cases.inflation import InflationUseCase
+from src.use_cases.trm import TRMUseCase
+
+
+def test_version_is_bumped_with_the_write(db_session_test: Session):
+    """Test inserts bump their series version once, skipped duplicates don't, and a rollback undoes the bump."""
+    trm = TRMUseCase(db_session_test, store=TRMStore(ttl_seconds=300))
+    asyncio.run(trm.insert_trm_data(TRMData(date=date(2023, 1, 1), value=4850.5)))
+    asyncio.run(trm.insert_trm_data(TRMData(date=date(2023, 1, 1), value=4850.5)))
+    asyncio.run(trm.insert_trm_batch([TRMData(date=date(2023, 1, 2), value=4855.0)]))
+    asyncio.run(
+        InflationUseCase(db_session_test, store=InflationStore(ttl_seconds=300)).insert_inflation_data(
+            InflationData(year=2023, month=1, annual_inflation_rate=13.25, target=3.0)
+        )
+    )
+
+    bump_data_version(db_session_test, TRM_SERIES)
+    db_session_test.rollback()
+
+    assert read_data_versions(db_session_test) == {TRM_SERIES: 2, INFLATION_SERIES: 1}
+
+
+def test_store_reloads_only_when_the_polled_version_changes():
+    """Test a polled store ignores its TTL and goes stale exactly when the version moves."""
+    store = TRMStore(ttl_seconds=300)
+    store.replace([(date(2023, 1, 1), 4850.5)], version=3)
+
+    store.note_version(3)
+    assert not store.is_stale()
+    store.note_version(4)
+    assert store.is_stale()
+
+    store.replace([(date(2023, 1, 1), 4850.5), (date(2023, 1, 2), 4855.0)], version=4)
+    assert not store.is_stale()
+
+    expired = TRMStore(ttl_seconds=0)
+    expired.replace([], version=1)
+    expired.note_version(1)
+    # Polls older than the TTL are not trusted: back to expiring by age
+    assert expired.is_stale()
+
+
+def test_poll_picks_up_writes_from_another_process(db_session_test: Session):
+    """Test an API store refreshes after a poll sees the version bumped by the ingestion process."""
+    api_store = TRMStore(ttl_seconds=300)
+    api = TRMUseCase(db_session_test, store=api_store)
+    asyncio.run(api.refresh_store())
+    poller = DataVersionPoller({TRM_SERIES: api_store})
+    poller.poll(db_session_test)
+    assert not api_store.is_stale()
+
+    # The scheduler process writes through its own session and store
+    with Session(db_session_test.get_bind()) as scheduler_session:
+        scheduler = TRMUseCase(scheduler_session, store=TRMStore(ttl_seconds=300))
+        asyncio.run(scheduler.insert_trm_data(TRMData(date=date(2023, 1, 1), value=4850.5)))
+
+    statements = []
+    engine = db_session_test.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        assert poller.poll(db_session_test) == {TRM_SERIES: 1}
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    assert api_store.is_stale()
+    series = asyncio.run(api.get_series())
+    assert len(series) == 1
+    assert not api_store.is_stale()
+
+
+def test_last_modified_comes_from_the_stored_version(db_session_test: Session):
+    """Test every process loading a series stamps it with the time stored with its version, moved by each write."""
+    with Session(db_session_test.get_bind()) as scheduler_session:
+        scheduler = TRMUseCase(scheduler_session, store=TRMStore(ttl_seconds=300))
+        asyncio.run(scheduler.insert_trm_data(TRMData(date=date(2023, 1, 1), value=4850.5)))
+
+    # Two API processes (or one before and after a restart) loading the same data
+    first, second = (
+        asyncio.run(TRMUseCase(db_session_test, store=TRMStore(ttl_seconds=300)).refresh_store()) for _ in range(2)
+    )
+    stamp = read_data_stamp(db_session_test, TRM_SERIES)
+    assert first.last_modified == second.last_modified == stamp.modified_at
+    assert stamp.modified_at.microsecond == 0
+
+    # A write within the same second still moves the one-second resolution validator
+    moved = bump_data_version(db_session_test, TRM_SERIES)
+    db_session_test.commit()
+    assert moved.modified_at > stamp.modified_at
+
+
+def test_last_modified_falls_back_to_the_latest_day():
+    """Test a series without a stored version is stamped with the start of its latest day."""
+    store = TRMStore(ttl_seconds=300)
+    series = store.replace([(date(2023, 1, 1), 4850.5), (date(2023, 1, 2), 4855.0)])
+    assert series.last_modified == datetime(2023, 1, 2, tzinfo=UTC)
+    assert store.replace([]).last_modified is None
@@ -0,0 +1,103 @@
+import asyncio
+import datetime
+import json
+import time
+
+import httpx
+import pytest
+import schedule
+
+from src.jobs import scheduler as scheduler_module
+from src.jobs.tasks import get_daily_trm as trm_task
+from src.jobs.tasks import get_monthly_inflation as inflation_task
+from src.jobs.tasks.http_client import backoff_seconds, create_http_client
+
+TRM_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<message:GenericData xmlns:message="m" xmlns:generic="g">
+  <message:DataSet><generic:Series><generic:Obs>
+    <generic:ObsDimension value="20240105"/><generic:ObsValue value="3945.12"/>
+  </generic:Obs></generic:Series></message:DataSet>
+</message:GenericData>"""
+
+# Timestamps in milliseconds, 2024-02-15 12:00 UTC
+INFLATION_JSON = json.dumps({"SERIES": [{"data": [[1708000000000, 3.0]]}, {"data": [[1708000000000, 7.74]]}]})
+
+
+TRM_PATH = "/banrep/ESTAT,DF_TRM_DAILY_LATEST,1.0/"
+
+
+async def fetch_with(fetcher, **client_options):
+    async with create_http_client(**client_options) as client:
+        return await fetcher(client)
+
+
+def test_trm_fetch_retries_server_errors(stub):
+    """Test a 503 and an unexpected payload are retried until a valid reply arrives."""
+    stub.reply(
+        TRM_PATH,
+        (503, "text/plain", "busy"),
+        (200, "text/html", "<html>maintenance</html>"),
+        (200, "application/xml", TRM_XML),
+    )
+
+    trm_date, trm_value = asyncio.run(fetch_with(trm_task.get_daily_trm))
+
+    assert (trm_date.isoformat(), trm_value) == ("2024-01-05", 3945.12)
+    assert stub.hits[TRM_PATH] == 3
+
+
+def test_client_errors_are_not_retried(stub):
+    """Test a 404 fails on the first attempt."""
+    stub.reply("/inflation", (404, "text/plain", "not found"))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(fetch_with(inflation_task.get_inflation_series))
+    assert stub.hits["/inflation"] == 1
+
+
+def test_hung_endpoint_is_bounded_by_the_read_timeout(stub):
+    """Test an endpoint that never answers in time fails after the attempts instead of blocking."""
+    stub.reply(TRM_PATH, (200, "application/xml", TRM_XML, 1.0))
+
+    started = time.perf_counter()
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(fetch_with(trm_task.get_daily_trm, read_timeout=0.1))
+
+    assert stub.hits[TRM_PATH] == 3
+    assert time.perf_counter() - started < 1.5
+
+
+def test_due_fetchers_run_concurrently(stub):
+    """Test both fetchers due at the same time wait on the endpoints in parallel."""
+    stub.reply(TRM_PATH, (200, "application/xml", TRM_XML, 0.5))
+    stub.reply("/inflation", (200, "application/json", INFLATION_JSON, 0.5))
+    results = {}
+
+    async def trm_job(client):
+        results["trm"] = await trm_task.get_daily_trm(client)
+
+    async def inflation_job(client):
+        results["inflation"] = await inflation_task.get_inflation_series(client)
+
+    async def run_due():
+        scheduler = schedule.Scheduler()
+        async with create_http_client() as client:
+            for job in (trm_job, inflation_job):
+                scheduler.every().hour.do(job, client).next_run = datetime.datetime.now()
+            started = time.perf_counter()
+            await scheduler_module.run_pending_jobs(scheduler)
+            return time.perf_counter() - started
+
+    elapsed = asyncio.run(run_due())
+
+    assert results["trm"][1] == 3945.12
+    assert [(record.year, record.annual_inflation_rate) for record in results["inflation"]] == [(2024, 7.74)]
+    assert elapsed < 0.9
+
+
+def test_backoff_grows_exponentially_with_full_jitter():
+    """Test retry waits stay within the doubling, capped, window."""
+    for attempt, ceiling in ((1, 1.0), (2, 2.0), (3, 4.0), (10, 30.0)):
+        waits = [backoff_seconds(attempt, base_seconds=1.0, max_seconds=30.0) for _ in range(200)]
+        assert all(0 <= wait <= ceiling for wait in waits)
+        assert max(waits) > ceiling / 2
@@ -1,6 +1,17 @@
+import asyncio
+import threading
+import time
 from datetime import datetime
+from functools import partial
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.db.probe import DatabaseProbe
+from src.db.session import database_session
+from src.main import app
 
 
 def test_health_check_healthy(client: TestClient):
@@ -46,3 +57,128 @@ def test_health_check_version_matches(client: TestClient):
     response = client.get("/health")
     data = response.json()
     assert data["version"] == "0.1.0"
+
+
+def test_liveness_check_does_no_io(client: TestClient):
+    """Test liveness answers healthy without probing the database."""
+    app.dependency_overrides[database_session.get_db] = lambda: pytest.fail("liveness must not open a session")
+    app.dependency_overrides[database_session.get_session_factory] = lambda: pytest.fail("liveness must not probe")
+
+    response = client.get("/health/live")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["database"]["connected"] is False
+    assert data["database"]["checked_at"] is None
+
+
+def test_readiness_check_serves_cached_probe(client: TestClient, db_session_test: Session):
+    """Test readiness probes once, then serves the cached result with its latency."""
+    statements = []
+    engine = db_session_test.get_bind()
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    first = client.get("/health/ready").json()
+    second = client.get("/health/ready").json()
+    live = client.get("/health/live").json()
+
+    assert statements.count("SELECT 1") == 1
+    assert first["status"] == "healthy"
+    assert first["database"]["latency_ms"] >= 0
+    assert second["database"]["checked_at"] == first["database"]["checked_at"]
+    assert live["database"] == first["database"]
+
+
+def test_readiness_check_unhealthy_database(client: TestClient):
+    """Test readiness answers 503 with the error when the database is unreachable."""
+
+    class BrokenSession:
+        def execute(self, *args, **kwargs):
+            raise ConnectionError("database unreachable")
+
+        def close(self):
+            pass
+
+    app.dependency_overrides[database_session.get_session_factory] = lambda: BrokenSession
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+
+    data = response.json()
+    assert data["status"] == "unhealthy"
+    assert data["database"]["connected"] is False
+    assert data["database"]["error"] == "database unreachable"
+    assert data["database"]["latency_ms"] is not None
+
+
+def test_background_probe_refreshes_status(db_session_test: Session):
+    """Test the background probe keeps the cached status fresh."""
+    probe = DatabaseProbe()
+
+    async def run_briefly():
+        session_factory = partial(Session, db_session_test.get_bind())
+        task = asyncio.create_task(probe.run_forever(session_factory, interval_seconds=0.01))
+        await asyncio.sleep(0.05)
+        first_checked_at = probe.status.checked_at
+        await asyncio.sleep(0.05)
+        task.cancel()
+        return first_checked_at
+
+    first_checked_at = asyncio.run(run_briefly())
+    assert probe.status.connected is True
+    assert probe.status.checked_at > first_checked_at
+    assert probe.age_seconds() < 1
+
+
+def test_concurrent_probes_do_not_serialize_on_the_event_loop():
+    """Test concurrent probes waiting on the database overlap instead of queueing on the event loop."""
+    latency, calls = 0.3, 5
+
+    class SlowSession:
+        def execute(self, *args, **kwargs):
+            time.sleep(latency)
+
+        def close(self):
+            pass
+
+    # probe() sends its query on every call (no caching or single-flight)
+    probe = DatabaseProbe(timeout_seconds=latency * calls * 2)
+
+    async def probe_concurrently():
+        return await asyncio.gather(*(probe.probe(SlowSession) for _ in range(calls)))
+
+    started = time.perf_counter()
+    statuses = asyncio.run(probe_concurrently())
+    elapsed = time.perf_counter() - started
+
+    assert all(status.connected for status in statuses)
+    # Serialized on the event loop this would take calls * latency
+    assert elapsed < latency * calls / 2
+
+
+def test_timed_out_probe_closes_its_own_session():
+    """Test a probe outliving its timeout keeps its session until the query returns, then closes it itself."""
+    events = []
+
+    class SlowSession:
+        def execute(self, *args, **kwargs):
+            time.sleep(0.2)
+            events.append(("execute", threading.get_ident()))
+
+        def close(self):
+            events.append(("close", threading.get_ident()))
+
+    probe = DatabaseProbe(timeout_seconds=0.05)
+
+    async def probe_and_wait():
+        status = await probe.probe(SlowSession)
+        # Nothing has touched the session while its query is still running
+        assert events == []
+        await asyncio.sleep(0.3)
+        return status
+
+    status = asyncio.run(probe_and_wait())
+
+    assert not status.connected
+    assert [name for name, _ in events] == ["execute", "close"]
+    assert events[0][1] == events[1][1]
@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from src.jobs.tasks.get_monthly_inflation import parse_inflation_series
+from src.models.inflation import Inflation
+from src.schemas.inflation import InflationData
+from src.stores.inflation import InflationStore
+from src.use_cases.inflation import InflationUseCase
+
+
+def timestamp_ms(year: int, month: int) -> int:
+    return int(datetime(year, month, 1, 12).timestamp() * 1000)
+
+
+def test_parse_inflation_series_joins_rates_and_targets():
+    """Test every month is parsed, with the target of the same month or None."""
+    payload = {
+        "SERIES": [
+            {"data": [[timestamp_ms(2024, 1), 3.0], [timestamp_ms(2024, 2), 3.0]]},
+            {"data": [[timestamp_ms(2023, 12), 9.28], [timestamp_ms(2024, 1), 8.35], [timestamp_ms(2024, 2), 7.74]]},
+        ]
+    }
+
+    assert [(r.year, r.month, r.annual_inflation_rate, r.target) for r in parse_inflation_series(payload)] == [
+        (2023, 12, 9.28, None),
+        (2024, 1, 8.35, 3.0),
+        (2024, 2, 7.74, 3.0),
+    ]
+
+
+def test_sync_inserts_new_and_updates_revised_months(db_session_test: Session):
+    """Test the diff inserts missing months, updates revisions and leaves the rest untouched."""
+    db_session_test.add_all(
+        [
+            Inflation(year=2023, month=11, annual_inflation_rate=10.15, target=3.0),
+            Inflation(year=2023, month=12, annual_inflation_rate=9.30, target=3.0),
+            Inflation(year=2024, month=1, annual_inflation_rate=8.35, target=None),
+        ]
+    )
+    db_session_test.commit()
+    records = [
+        InflationData(year=2023, month=11, annual_inflation_rate=10.15, target=3.0),
+        # Revised rate, and a target published after the first load
+        InflationData(year=2023, month=12, annual_inflation_rate=9.28, target=3.0),
+        InflationData(year=2024, month=1, annual_inflation_rate=8.35, target=3.0),
+        InflationData(year=2024, month=2, annual_inflation_rate=7.74, target=3.0),
+        InflationData(year=2024, month=3, annual_inflation_rate=7.36, target=3.0),
+    ]
+
+    use_case = InflationUseCase(db_session_test, store=InflationStore(ttl_seconds=300))
+
+    assert asyncio.run(use_case.sync_inflation_series(records)) == (2, 2)
+    stored = db_session_test.query(Inflation.year, Inflation.month, Inflation.annual_inflation_rate, Inflation.target)
+    assert sorted(stored) == [(r.year, r.month, r.annual_inflation_rate, r.target) for r in records]
+
+    assert asyncio.run(use_case.sync_inflation_series(records)) == (0, 0)
+
+
+def test_sync_refreshes_only_a_loaded_store(db_session_test: Session):
+    """Test a process that never read the series (e.g. the scheduler) does not load it after a sync."""
+    records = [InflationData(year=2024, month=1, annual_inflation_rate=8.35, target=3.0)]
+    unloaded = InflationStore(ttl_seconds=300)
+    asyncio.run(InflationUseCase(db_session_test, store=unloaded).sync_inflation_series(records))
+    assert not unloaded.is_loaded()
+
+    loaded = InflationStore(ttl_seconds=300)
+    use_case = InflationUseCase(db_session_test, store=loaded)
+    asyncio.run(use_case.get_series())
+    records.append(InflationData(year=2024, month=2, annual_inflation_rate=7.74, target=3.0))
+    asyncio.run(use_case.sync_inflation_series(records))
+    assert len(loaded.series) == 2
@@ -0,0 +1,36 @@
+import asyncio
+
+from benchmarks.load import SCENARIOS, RouteResult, regressions, run_load, seeded_app, uncovered_routes
+from src.main import app
+from src.stores.inflation import inflation_store
+from src.stores.trm import trm_store
+
+
+def test_every_route_has_a_load_scenario():
+    """Test a route added without a load scenario is caught."""
+    assert uncovered_routes(app) == []
+
+
+def test_load_run_against_seeded_database(tmp_path):
+    """Test every scenario answers 200 against the database seeded from the bundled CSVs."""
+    try:
+        results = asyncio.run(run_load(seeded_app(str(tmp_path / "benchmark.db")), requests=2, concurrency=2))
+    finally:
+        app.dependency_overrides.clear()
+        trm_store.invalidate()
+        inflation_store.invalidate()
+
+    assert list(results) == [scenario.name for scenario in SCENARIOS]
+    assert all(result.requests == 2 and result.p99_ms >= result.p50_ms > 0 for result in results.values())
+
+
+def test_regressions_beyond_tolerance():
+    """Test latency growth and throughput drops are only reported beyond the tolerance."""
+    baseline = {"GET /v1/trm": {"requests": 100, "rps": 100.0, "p50_ms": 10.0, "p99_ms": 20.0}}
+
+    within = {"GET /v1/trm": RouteResult(requests=100, rps=80.0, p50_ms=12.0, p99_ms=26.0)}
+    assert regressions(within, baseline, tolerance=0.35) == []
+
+    beyond = {"GET /v1/trm": RouteResult(requests=100, rps=50.0, p50_ms=14.0, p99_ms=20.0)}
+    found = regressions(beyond, baseline, tolerance=0.35)
+    assert [regression.split(":")[1].split()[0] for regression in found] == ["p50_ms", "rps"]
@@ -0,0 +1,93 @@
+import urllib.request
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.db.pool import TimedQueuePool
+from src.metrics.db import instrument_engine, statement_labels
+from src.metrics.jobs import start_metrics_server, timed_job
+from src.metrics.registry import registry
+from src.models.trm import TRM
+
+
+@pytest.mark.parametrize(
+    ("statement", "labels"),
+    [
+        ("SELECT trm.date, trm.value FROM trm ORDER BY trm.date", ("SELECT", "trm")),
+        ('INSERT INTO "inflation" (id, year) VALUES (?, ?)', ("INSERT", "inflation")),
+        ("  update trm SET value=? WHERE trm.id = ?", ("UPDATE", "trm")),
+        ("SELECT 1", ("SELECT", "")),
+    ],
+)
+def test_statement_labels(statement: str, labels: tuple[str, str]):
+    """Test statements are reduced to bounded (operation, table) labels."""
+    assert statement_labels(statement) == labels
+
+
+def test_metrics_endpoint_reports_requests(client: TestClient, db_session_test: Session):
+    """Test requests are recorded by route template with their size, and statements by table."""
+    instrument_engine(db_session_test.get_bind(), "test")
+    db_session_test.add(TRM(date=date(2023, 1, 1), value=4850.50))
+    db_session_test.commit()
+    select_labels = {"engine": "test", "operation": "SELECT", "table": "trm"}
+    selects_before = registry.get_sample_value("db_statement_duration_seconds_count", select_labels) or 0
+
+    client.get("/v1/trm/by-date", params={"specific_date": "2023-01-01"})
+    client.get("/v1/inflation/2023/1")
+    client.get("/v1/trm/no-such-route/42")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE_LATEST
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/v1/trm/by-date",status="200"}' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/v1/inflation/{year}/{month}",status="404"}' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="unmatched",status="404"}' in body
+    assert 'http_response_size_bytes_sum{method="GET",route="/v1/trm/by-date",status="200"}' in body
+    assert "http_requests_in_flight 1.0" in body  # the scrape itself
+    assert registry.get_sample_value("db_statement_duration_seconds_count", select_labels) > selects_before
+
+
+def test_timed_job_records_outcomes():
+    """Test job runs are counted by outcome and timed, and failures still raise."""
+
+    def failing_job():
+        raise RuntimeError("upstream down")
+
+    timed_job("test_job", lambda: None)()
+    with pytest.raises(RuntimeError):
+        timed_job("test_job", failing_job)()
+
+    assert registry.get_sample_value("scheduler_job_runs_total", {"job": "test_job", "outcome": "success"}) == 1
+    assert registry.get_sample_value("scheduler_job_runs_total", {"job": "test_job", "outcome": "failure"}) == 1
+    assert registry.get_sample_value("scheduler_job_duration_seconds_count", {"job": "test_job"}) == 2
+
+
+def test_scheduler_metrics_server():
+    """Test the standalone exporter serves the registry over HTTP."""
+    server = start_metrics_server(0, host="127.0.0.1")
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+            body = response.read().decode()
+        assert "# TYPE scheduler_job_runs_total counter" in body
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_metrics_are_exported(tmp_path):
+    """Test the checkout wait histogram of a timed pool is rendered per engine."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=1)
+    instrument_engine(engine, "pooled")
+    with engine.connect() as connection:
+        connection.exec_driver_sql("SELECT 1")
+        body = generate_latest(registry).decode()
+
+    assert 'db_pool_checkout_wait_seconds_count{engine="pooled"} 1.0' in body
+    assert 'db_pool_connections_in_use{engine="pooled"} 1.0' in body
+    assert 'db_pool_checkout_timeouts_total{engine="pooled"} 0.0' in body
+    engine.dispose()
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.db.db_engine import get_pool_options
+from src.db.pool import CHECKOUT_WAIT_BUCKETS, TimedQueuePool, warm_up_pool
+
+
+@pytest.fixture(scope="function")
+def pooled_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=TimedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_options_from_environment(monkeypatch):
+    """Test the pool defaults to one connection per database thread and honours overrides."""
+    monkeypatch.delenv("DB_POOL_SIZE", raising=False)
+    monkeypatch.setenv("DB_THREAD_POOL_SIZE", "6")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    monkeypatch.setenv("DB_POOL_RECYCLE_SECONDS", "600")
+
+    options = get_pool_options()
+
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 6
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is False
+
+
+def test_checkout_wait_is_measured(pooled_engine):
+    """Test a checkout blocked on an exhausted pool records its wait."""
+    held = [pooled_engine.connect(), pooled_engine.connect()]
+    releaser = threading.Timer(0.1, held[0].close)
+    releaser.start()
+
+    with pooled_engine.connect():
+        pass
+    releaser.join()
+    held[1].close()
+
+    metrics = pooled_engine.pool.metrics
+    assert metrics.checkouts == 3
+    assert 0.1 <= metrics.wait_seconds_max < 0.2
+    assert sum(metrics.bucket_counts) == 3
+    assert sum(metrics.bucket_counts[: CHECKOUT_WAIT_BUCKETS.index(0.05) + 1]) == 2
+
+
+def test_checkout_timeouts_are_counted(pooled_engine):
+    """Test checkouts giving up after the pool timeout are counted."""
+    held = [pooled_engine.connect(), pooled_engine.connect()]
+    started = time.perf_counter()
+
+    with pytest.raises(PoolTimeoutError):
+        pooled_engine.connect()
+
+    assert time.perf_counter() - started >= 0.2
+    assert pooled_engine.pool.metrics.timeouts == 1
+    for connection in held:
+        connection.close()
+
+
+def test_warm_up_opens_pool_connections(pooled_engine):
+    """Test the warm-up leaves the pool with validated idle connections."""
+    asyncio.run(warm_up_pool(pooled_engine, pooled_engine.pool.size()))
+
+    assert pooled_engine.pool.checkedin() == 2
+    assert pooled_engine.pool.metrics.timeouts == 0
+
+
+def test_metrics_survive_pool_recreation(pooled_engine):
+    """Test disposing the engine keeps accumulating into the same metrics."""
+    metrics = pooled_engine.pool.metrics
+    pooled_engine.dispose()
+
+    assert pooled_engine.pool.metrics is metrics
@@ -0,0 +1,113 @@
+import asyncio
+import sqlite3
+from datetime import date
+
+import pytest
+from sqlalchemy import StaticPool, create_engine
+from sqlalchemy.orm import Session
+
+from src.db.data_version import TRM_SERIES, DataVersionPoller, bump_data_version
+from src.db.replica import ReplicaSync
+from src.models.base import Base
+from src.models.trm import TRM
+from src.stores.trm import TRMStore
+from src.use_cases.trm import TRMUseCase
+
+
+class ReplicaConnection(sqlite3.Connection):
+    """SQLite connection standing in for a libSQL embedded replica connection."""
+
+    syncs = 0
+    fail = False
+
+    def sync(self):
+        if ReplicaConnection.fail:
+            raise ConnectionError("primary unreachable")
+        ReplicaConnection.syncs += 1
+
+
+@pytest.fixture(scope="function")
+def replica_engine():
+    ReplicaConnection.syncs = 0
+    ReplicaConnection.fail = False
+    engine = create_engine(
+        "sqlite://",
+        creator=lambda: sqlite3.connect(":memory:", factory=ReplicaConnection, check_same_thread=False),
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_replica_sync_disabled_without_replica(db_session_test: Session):
+    """Test the sync is a no-op and reports no lag when no replica is configured."""
+    replica = ReplicaSync(None)
+    replica.sync()
+
+    assert not replica.serves(db_session_test)
+    assert replica.staleness_seconds() is None
+
+
+def test_replica_sync_tracks_staleness(replica_engine):
+    """Test a sync pulls through the driver and resets the staleness metric."""
+    replica = ReplicaSync(replica_engine)
+    assert replica.staleness_seconds() is None
+
+    replica.sync()
+    assert ReplicaConnection.syncs == 1
+    assert 0 <= replica.staleness_seconds() < 5
+
+    replica.sync_if_older_than(60)
+    assert ReplicaConnection.syncs == 1
+
+
+def test_failed_sync_keeps_serving_replica(replica_engine):
+    """Test a failed opportunistic sync is swallowed while an explicit one raises."""
+    replica = ReplicaSync(replica_engine)
+    ReplicaConnection.fail = True
+
+    replica.sync_if_older_than(0)
+    assert replica.staleness_seconds() is None
+    with pytest.raises(ConnectionError):
+        replica.sync()
+
+
+def test_store_reload_syncs_replica_first(replica_engine, monkeypatch):
+    """Test reloading a series from a replica-bound session syncs the replica first."""
+    replica = ReplicaSync(replica_engine)
+    monkeypatch.setattr("src.use_cases.trm.replica_sync", replica)
+
+    with Session(replica_engine) as session:
+        session.add(TRM(date=date(2023, 1, 1), value=4850.50))
+        session.commit()
+        series = asyncio.run(TRMUseCase(session, store=TRMStore(ttl_seconds=300)).refresh_store())
+
+    assert len(series) == 1
+    assert ReplicaConnection.syncs == 1
+
+
+def test_poller_syncs_replica_when_a_version_moves(replica_engine, db_session_test: Session):
+    """Test the API poller syncs its replica only once a version read from the primary changes, retrying failures."""
+    replica = ReplicaSync(replica_engine)
+    store = TRMStore(ttl_seconds=300)
+    store.replace([], version=0)
+    poller = DataVersionPoller({TRM_SERIES: store}, replica=replica)
+
+    poller.poll(db_session_test)
+    poller.poll(db_session_test)
+    assert ReplicaConnection.syncs == 1
+
+    # The scheduler writes to the primary and never syncs a replica itself
+    bump_data_version(db_session_test, TRM_SERIES)
+    db_session_test.commit()
+    ReplicaConnection.fail = True
+    with pytest.raises(ConnectionError):
+        poller.poll(db_session_test)
+    # The stores don't hear of a version the replica does not hold yet
+    assert not store.is_stale()
+
+    ReplicaConnection.fail = False
+    assert poller.poll(db_session_test) == {TRM_SERIES: 1}
+    assert ReplicaConnection.syncs == 2
+    assert store.is_stale()
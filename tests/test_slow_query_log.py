@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.db.slow_query_log import SlowQueryLog, install_slow_query_log
+from src.schemas.trm import TRMData
+from src.stores.trm import TRMStore
+from src.use_cases.trm import TRMUseCase
+
+
+def slow_query_records(caplog) -> list[str]:
+    return [record.getMessage() for record in caplog.records if record.getMessage().startswith("[slow-query]")]
+
+
+def test_slow_statements_are_logged_with_plan_and_source(db_session_test: Session, caplog):
+    """Test statements above the threshold are logged with parameters, caller and query plan."""
+    slow_query_log = SlowQueryLog(threshold_ms=0)
+    slow_query_log.install(db_session_test.get_bind())
+    use_case = TRMUseCase(db_session_test, store=TRMStore(ttl_seconds=300))
+
+    with caplog.at_level(logging.WARNING, logger="src.db.slow_query_log"):
+        asyncio.run(use_case.insert_trm_data(TRMData(date=date(2023, 1, 1), value=4850.50)))
+
+    records = slow_query_records(caplog)
+    existence_check = next(message for message in records if "WHERE trm.date = ?" in message)
+    assert "from src/use_cases/trm.py" in existence_check
+    assert "in TRMUseCase._insert_trm_record" in existence_check
+    assert "parameters=('2023-01-01'" in existence_check
+    assert "plan: SEARCH trm USING INDEX ix_trm_date (date=?)" in existence_check
+
+
+def test_query_plan_is_captured_once_per_statement(db_session_test: Session, caplog):
+    """Test a repeatedly slow statement reuses its first captured plan."""
+    slow_query_log = SlowQueryLog(threshold_ms=0)
+    slow_query_log.install(db_session_test.get_bind())
+    explains = []
+    original_query_plan = slow_query_log.query_plan
+
+    def counting_query_plan(conn, statement, parameters):
+        if statement not in slow_query_log._plans:
+            explains.append(statement)
+        return original_query_plan(conn, statement, parameters)
+
+    slow_query_log.query_plan = counting_query_plan
+    connection = db_session_test.connection()
+    with caplog.at_level(logging.WARNING, logger="src.db.slow_query_log"):
+        for day in (1, 2, 3):
+            connection.exec_driver_sql("SELECT value FROM trm WHERE date = ?", (f"2023-01-0{day}",))
+
+    assert len(slow_query_records(caplog)) == 3
+    assert explains == ["SELECT value FROM trm WHERE date = ?"]
+
+
+def test_failed_statements_do_not_leave_start_times(db_session_test: Session):
+    """Test a statement that raises drops its start time, so later statements are timed from their own."""
+    slow_query_log = SlowQueryLog(threshold_ms=60_000)
+    slow_query_log.install(db_session_test.get_bind())
+    connection = db_session_test.connection()
+
+    with pytest.raises(OperationalError):
+        connection.exec_driver_sql("SELECT value FROM missing_table")
+
+    assert connection.info["slow_query_started"] == []
+
+
+def test_fast_statements_are_not_logged(db_session_test: Session, caplog):
+    """Test statements under the threshold are not logged and a zero threshold disables the log."""
+    assert install_slow_query_log(db_session_test.get_bind(), threshold_ms=0) is None
+    install_slow_query_log(db_session_test.get_bind(), threshold_ms=60_000)
+
+    with caplog.at_level(logging.WARNING, logger="src.db.slow_query_log"):
+        db_session_test.connection().exec_driver_sql("SELECT 1")
+
+    assert slow_query_records(caplog) == []
@@ -1,8 +1,21 @@
+import asyncio
+import json
+
 import pytest
 from fastapi.testclient import TestClient
+from fastapi_pagination import Page, Params, paginate
 from sqlalchemy.orm import Session
 
 from src.models.inflation import Inflation
+from src.routes.responses import json_page_response
+from src.schemas.inflation import InflationData
+from src.schemas.pagination import encode_cursor
+from src.serializers import columnar
+from src.serializers.columnar import MEDIA_TYPE as COLUMNAR_MEDIA_TYPE
+from src.serializers.json import inflation_items
+from src.stores.base import SeriesView
+from src.stores.inflation import InflationStore
+from src.use_cases.inflation import InflationUseCase
 
 
 @pytest.fixture(scope="function")
@@ -82,6 +95,13 @@ def test_get_inflation_by_nonexistent_date(client: TestClient, sample_inflation_
     assert "No inflation data found" in response.json()["detail"]
 
 
+@pytest.mark.parametrize("period", ["2023/13", "2024/0", "2024/-10"])
+def test_get_inflation_by_out_of_range_month(client: TestClient, sample_inflation_data, period: str):
+    """Test an out-of-range month is not resolved to a period of a neighbouring year."""
+    response = client.get(f"/v1/inflation/{period}")
+    assert response.status_code == 404
+
+
 def test_invalid_date_range(client: TestClient, sample_inflation_data):
     """Test invalid date range parameters."""
     # Invalid month
@@ -103,3 +123,158 @@ def test_invalid_date_range(client: TestClient, sample_inflation_data):
     }
     response = client.get("/v1/inflation/date-range", params=params)
     assert response.status_code == 422
+
+
+def test_inflation_reads_served_from_memory(client: TestClient, sample_inflation_data, db_session_test: Session):
+    """Test inflation reads keep being answered from the in-memory series once loaded."""
+    response = client.get("/v1/inflation")
+    assert response.json()["total"] == 5
+
+    db_session_test.query(Inflation).delete()
+    db_session_test.commit()
+
+    response = client.get("/v1/inflation/2024/2")
+    assert response.status_code == 200
+    assert response.json()["annual_inflation_rate"] == 8.75
+
+
+def test_get_inflation_by_date_range_skips_missing_months(client: TestClient, sample_inflation_data):
+    """Test a range spanning months without records only returns stored months, in order."""
+    params = {"start_year": 2023, "start_month": 2, "end_year": 2024, "end_month": 1, "sort": "desc"}
+    response = client.get("/v1/inflation/date-range", params=params)
+    assert response.status_code == 200
+
+    items = response.json()["items"]
+    assert [(item["year"], item["month"]) for item in items] == [(2024, 1), (2023, 3), (2023, 2)]
+
+
+def test_insert_inflation_data_refreshes_store(client: TestClient, sample_inflation_data, db_session_test: Session):
+    """Test inserting an inflation record makes it visible to reads right away."""
+    assert client.get("/v1/inflation").json()["total"] == 5
+
+    new_record = InflationData(year=2024, month=3, annual_inflation_rate=7.36, target=None)
+    asyncio.run(InflationUseCase(db_session_test).insert_inflation_data(new_record))
+
+    response = client.get("/v1/inflation/2024/3")
+    assert response.status_code == 200
+    assert response.json() == {"year": 2024, "month": 3, "annual_inflation_rate": 7.36, "target": None}
+
+
+def test_cursor_pagination_walks_series(client: TestClient, sample_inflation_data):
+    """Test cursor pagination returns every record once and stops with no next_cursor."""
+    periods = []
+    params = {"pagination": "cursor", "size": 2}
+    while True:
+        response = client.get("/v1/inflation", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        periods.extend((item["year"], item["month"]) for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params["cursor"] = data["next_cursor"]
+
+    assert periods == [(2024, 2), (2024, 1), (2023, 3), (2023, 2), (2023, 1)]
+
+
+@pytest.mark.parametrize("key", [0, 1955 * 12 + 4, 2024 * 12 + 2, 10**12])
+def test_cursor_outside_the_series_is_rejected(client: TestClient, sample_inflation_data, key: int):
+    """Test a cursor decoding to a period before the series or after its last record gets a 422, like TRM cursors."""
+    response = client.get("/v1/inflation", params={"cursor": encode_cursor(key)})
+    assert response.status_code == 422
+    assert "Invalid cursor" in response.json()["detail"]
+
+
+def test_inflation_conditional_requests(client: TestClient, sample_inflation_data):
+    """Test inflation reads carry validators and answer 304 when they match."""
+    response = client.get("/v1/inflation/2023/1")
+    last_modified = response.headers["last-modified"]
+
+    response = client.get("/v1/inflation/2023/1", headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+
+    response = client.get("/v1/inflation/2023/1", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    response = client.get("/v1/inflation/2023/1", headers={"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    assert response.status_code == 200
+
+
+def test_revising_an_old_period_moves_last_modified(
+    client: TestClient, sample_inflation_data, db_session_test: Session
+):
+    """Test a revision to a month before the latest one invalidates If-Modified-Since validators too."""
+    last_modified = client.get("/v1/inflation").headers["last-modified"]
+    assert client.get("/v1/inflation", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    records = [
+        InflationData(year=2023, month=1, annual_inflation_rate=13.12, target=3.0),
+        InflationData(year=2023, month=2, annual_inflation_rate=13.28, target=3.0),
+        InflationData(year=2023, month=3, annual_inflation_rate=13.34, target=3.0),
+        InflationData(year=2024, month=1, annual_inflation_rate=9.25, target=3.0),
+        InflationData(year=2024, month=2, annual_inflation_rate=8.75, target=3.0),
+    ]
+    assert asyncio.run(InflationUseCase(db_session_test).sync_inflation_series(records)) == (0, 1)
+
+    response = client.get("/v1/inflation", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert response.headers["last-modified"] != last_modified
+    assert response.json()["items"][-1]["annual_inflation_rate"] == 13.12
+
+
+def test_get_inflation_batch(client: TestClient, sample_inflation_data):
+    """Test batch lookups keep input order and report misses explicitly."""
+    payload = {"periods": [{"year": 2024, "month": 2}, {"year": 2020, "month": 1}, {"year": 2023, "month": 1}]}
+    response = client.post("/v1/inflation/batch", json=payload)
+    assert response.status_code == 200
+
+    items = response.json()["items"]
+    assert [(item["year"], item["month"]) for item in items] == [(2024, 2), (2020, 1), (2023, 1)]
+    assert items[0]["inflation"]["annual_inflation_rate"] == 8.75
+    assert items[1]["inflation"] is None
+    assert items[2]["inflation"]["annual_inflation_rate"] == 13.25
+
+
+def test_export_inflation(client: TestClient, sample_inflation_data, db_session_test: Session):
+    """Test the NDJSON and CSV exports stream every record oldest first."""
+    db_session_test.add(Inflation(year=2024, month=3, annual_inflation_rate=7.36, target=None))
+    db_session_test.commit()
+
+    rows = [json.loads(line) for line in client.get("/v1/inflation/export").text.splitlines()]
+    assert len(rows) == 6
+    assert rows[0] == {"year": 2023, "month": 1, "annual_inflation_rate": 13.25, "target": 3.0}
+    assert rows[-1]["target"] is None
+
+    lines = client.get("/v1/inflation/export", params={"format": "csv"}).text.splitlines()
+    assert lines[0] == "year,month,annual_inflation_rate,target"
+    assert lines[-1] == "2024,3,7.36,"
+
+
+def test_inflation_columnar_matches_json(client: TestClient, sample_inflation_data, db_session_test: Session):
+    """Test columnar range pages and exports decode to the same records as their JSON counterparts."""
+    db_session_test.add(Inflation(year=2024, month=3, annual_inflation_rate=7.36, target=None))
+    db_session_test.commit()
+    fields = ("year", "month", "annual_inflation_rate", "target")
+
+    params = {"start_year": 2023, "start_month": 2, "end_year": 2024, "end_month": 12, "sort": "desc"}
+    json_page = client.get("/v1/inflation/date-range", params=params).json()
+    response = client.get("/v1/inflation/date-range", params=params, headers={"Accept": COLUMNAR_MEDIA_TYPE})
+    kind, rows = columnar.decode(response.content)
+    assert kind == columnar.KIND_INFLATION
+    assert [dict(zip(fields, row, strict=True)) for row in rows] == json_page["items"]
+
+    ndjson_rows = [json.loads(line) for line in client.get("/v1/inflation/export").text.splitlines()]
+    response = client.get("/v1/inflation/export", headers={"Accept": COLUMNAR_MEDIA_TYPE})
+    _, rows = columnar.decode(response.content)
+    assert [dict(zip(fields, row, strict=True)) for row in rows] == ndjson_rows
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_inflation_fast_page_matches_response_model(descending: bool):
+    """Test the pre-serialized page body equals the one the Page[InflationData] response model produces."""
+    store = InflationStore(ttl_seconds=300)
+    series = store.replace([(2023, month, 13.25 - month / 10, None if month % 2 else 3.0) for month in range(1, 11)])
+    view = SeriesView(series, 2, 9, descending=descending)
+    params = Params(page=2, size=4)
+
+    expected = Page[InflationData].model_validate(paginate(view, params)).model_dump(mode="json")
+    assert json.loads(json_page_response(view, params, inflation_items).body) == expected
@@ -1,10 +1,24 @@
+import asyncio
+import json
+from array import array
 from datetime import date
 
 import pytest
 from fastapi.testclient import TestClient
+from fastapi_pagination import Page, Params, paginate
 from sqlalchemy.orm import Session
 
 from src.models.trm import TRM
+from src.routes.responses import json_page_response
+from src.schemas.pagination import encode_cursor
+from src.schemas.trm import TRMData
+from src.serializers import columnar
+from src.serializers.columnar import MEDIA_TYPE as COLUMNAR_MEDIA_TYPE
+from src.serializers.json import trm_items
+from src.stores.aggregates import RangeAggregates
+from src.stores.base import SeriesView
+from src.stores.trm import TRMStore
+from src.use_cases.trm import TRMUseCase
 
 
 @pytest.fixture(scope="function")
@@ -138,3 +152,297 @@ def test_empty_date_range(client: TestClient, sample_trm_data):
     data = response.json()
     assert len(data["items"]) == 0
     assert data["total"] == 0
+
+
+def test_trm_reads_served_from_memory(client: TestClient, sample_trm_data, db_session_test: Session):
+    """Test TRM reads keep being answered from the in-memory series once loaded."""
+    response = client.get("/v1/trm")
+    assert response.json()["total"] == 5
+
+    db_session_test.query(TRM).delete()
+    db_session_test.commit()
+
+    response = client.get("/v1/trm/by-date", params={"specific_date": "2023-02-02"})
+    assert response.status_code == 200
+    assert response.json()["value"] == 4910.50
+
+
+def test_pagination_desc_pages_are_contiguous(client: TestClient, sample_trm_data):
+    """Test descending pages walk the series without gaps or overlaps."""
+    first = client.get("/v1/trm?page=1&size=2").json()["items"]
+    second = client.get("/v1/trm?page=2&size=2").json()["items"]
+    third = client.get("/v1/trm?page=3&size=2").json()["items"]
+
+    dates = [item["date"] for item in first + second + third]
+    assert dates == ["2023-02-02", "2023-02-01", "2023-01-03", "2023-01-02", "2023-01-01"]
+
+
+def test_insert_trm_data_refreshes_store(client: TestClient, sample_trm_data, db_session_test: Session):
+    """Test inserting a TRM record makes it visible to reads right away."""
+    assert client.get("/v1/trm").json()["total"] == 5
+
+    asyncio.run(TRMUseCase(db_session_test).insert_trm_data(TRMData(date=date(2023, 2, 3), value=4920.0)))
+
+    response = client.get("/v1/trm/by-date", params={"specific_date": "2023-02-03"})
+    assert response.status_code == 200
+    assert response.json()["value"] == 4920.0
+
+
+def test_cursor_pagination_walks_series(client: TestClient, sample_trm_data):
+    """Test cursor pagination returns every record once and stops with no next_cursor."""
+    dates = []
+    params = {"pagination": "cursor", "size": 2, "sort": "asc"}
+    while True:
+        response = client.get("/v1/trm", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert "total" not in data
+        dates.extend(item["date"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params["cursor"] = data["next_cursor"]
+
+    assert dates == ["2023-01-01", "2023-01-02", "2023-01-03", "2023-02-01", "2023-02-02"]
+
+
+def test_cursor_pagination_desc(client: TestClient, sample_trm_data):
+    """Test a cursor resumes right after the last record in descending order."""
+    first = client.get("/v1/trm", params={"pagination": "cursor", "size": 3}).json()
+    assert [item["date"] for item in first["items"]] == ["2023-02-02", "2023-02-01", "2023-01-03"]
+
+    second = client.get("/v1/trm", params={"cursor": first["next_cursor"], "size": 3}).json()
+    assert [item["date"] for item in second["items"]] == ["2023-01-02", "2023-01-01"]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.parametrize(("ordinal", "sort"), [(1, "desc"), (date.max.toordinal(), "asc")])
+def test_cursor_at_the_edge_of_the_calendar(client: TestClient, sample_trm_data, ordinal: int, sort: str):
+    """Test a cursor on date.min (descending) or date.max (ascending) ends the listing instead of failing."""
+    response = client.get("/v1/trm", params={"cursor": encode_cursor(ordinal), "sort": sort})
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+    assert response.json()["next_cursor"] is None
+
+
+def test_invalid_cursor(client: TestClient, sample_trm_data):
+    """Test a malformed cursor is rejected."""
+    response = client.get("/v1/trm", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 422
+
+
+def test_trm_responses_carry_cache_validators(client: TestClient, sample_trm_data):
+    """Test TRM reads expose ETag, Last-Modified and Cache-Control."""
+    response = client.get("/v1/trm")
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["last-modified"].endswith(" GMT")
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    other_page = client.get("/v1/trm?page=2&size=2")
+    assert other_page.headers["etag"] != response.headers["etag"]
+
+
+def test_trm_conditional_requests(client: TestClient, sample_trm_data, db_session_test: Session):
+    """Test matching validators get a 304 until a new TRM record is ingested."""
+    response = client.get("/v1/trm")
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+    response = client.get("/v1/trm", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client.get("/v1/trm", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    asyncio.run(TRMUseCase(db_session_test).insert_trm_data(TRMData(date=date(2023, 2, 3), value=4920.0)))
+
+    response = client.get("/v1/trm", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    response = client.get("/v1/trm", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+
+
+def test_get_trm_batch(client: TestClient, sample_trm_data):
+    """Test batch lookups keep input order and report misses explicitly."""
+    payload = {"dates": ["2023-02-01", "2020-01-01", "2023-01-01", "2023-02-01"]}
+    response = client.post("/v1/trm/batch", json=payload)
+    assert response.status_code == 200
+
+    items = response.json()["items"]
+    assert [item["requested_date"] for item in items] == payload["dates"]
+    assert items[0]["trm"] == {"date": "2023-02-01", "value": 4900.00}
+    assert items[1]["trm"] is None
+    assert items[2]["trm"]["value"] == 4850.50
+    assert items[3] == items[0]
+
+
+def test_get_trm_batch_validation(client: TestClient, sample_trm_data):
+    """Test empty or malformed batches are rejected."""
+    assert client.post("/v1/trm/batch", json={"dates": []}).status_code == 422
+    assert client.post("/v1/trm/batch", json={"dates": ["2023-13-01"]}).status_code == 422
+
+
+def test_get_trm_by_date_as_of(client: TestClient, sample_trm_data):
+    """Test as_of falls back to the latest TRM on or before the requested date."""
+    response = client.get("/v1/trm/by-date", params={"specific_date": "2023-01-20", "as_of": True})
+    assert response.status_code == 200
+    assert response.json() == {"date": "2023-01-03", "value": 4860.25}
+
+    response = client.get("/v1/trm/by-date", params={"specific_date": "2023-01-02", "as_of": True})
+    assert response.json()["date"] == "2023-01-02"
+
+    response = client.get("/v1/trm/by-date", params={"specific_date": "2022-12-31", "as_of": True})
+    assert response.status_code == 404
+
+
+def test_get_trm_batch_as_of(client: TestClient, sample_trm_data):
+    """Test as_of resolution in batch lookups."""
+    payload = {"dates": ["2023-03-15", "2023-01-20", "2022-12-31"], "as_of": True}
+    items = client.post("/v1/trm/batch", json=payload).json()["items"]
+
+    assert items[0]["trm"] == {"date": "2023-02-02", "value": 4910.50}
+    assert items[1]["trm"]["date"] == "2023-01-03"
+    assert items[2]["trm"] is None
+
+
+def test_convert_amounts(client: TestClient, sample_trm_data):
+    """Test conversions use the as-of TRM and keep the input order."""
+    payload = {
+        "amounts": [100.0, 4900.0, 10.0, 5.0],
+        "dates": ["2023-01-01", "2023-02-01", "2023-03-15", "2022-12-31"],
+        "directions": ["usd_to_cop", "cop_to_usd", "usd_to_cop", "usd_to_cop"],
+    }
+    response = client.post("/v1/trm/convert", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["amounts"] == [485050.0, 1.0, 49105.0, None]
+    assert data["rates"] == [4850.50, 4900.00, 4910.50, None]
+    assert data["rate_dates"] == ["2023-01-01", "2023-02-01", "2023-02-02", None]
+
+
+def test_convert_amounts_validation(client: TestClient, sample_trm_data):
+    """Test mismatched arrays and unknown directions are rejected."""
+    payload = {"amounts": [1.0, 2.0], "dates": ["2023-01-01"], "directions": ["usd_to_cop"]}
+    assert client.post("/v1/trm/convert", json=payload).status_code == 422
+
+    payload = {"amounts": [1.0], "dates": ["2023-01-01"], "directions": ["eur_to_cop"]}
+    assert client.post("/v1/trm/convert", json=payload).status_code == 422
+
+
+def test_get_trm_aggregates(client: TestClient, sample_trm_data):
+    """Test monthly mean and OHLC aggregates over a date range."""
+    params = {"start_date": "2023-01-02", "end_date": "2023-12-31", "period": "month", "stat": "mean"}
+    response = client.get("/v1/trm/aggregate", params=params)
+    assert response.status_code == 200
+
+    items = response.json()["items"]
+    assert items == [
+        {"period_start": "2023-01-02", "period_end": "2023-01-31", "count": 2, "mean": 4858.0},
+        {"period_start": "2023-02-01", "period_end": "2023-02-02", "count": 2, "mean": 4905.25},
+    ]
+
+    params.update(period="year", stat="ohlc", start_date="2023-01-01")
+    items = client.get("/v1/trm/aggregate", params=params).json()["items"]
+    assert items == [
+        {
+            "period_start": "2023-01-01",
+            "period_end": "2023-02-02",
+            "count": 5,
+            "open": 4850.50,
+            "high": 4910.50,
+            "low": 4850.50,
+            "close": 4910.50,
+        }
+    ]
+
+
+def test_range_aggregates_match_brute_force():
+    """Test prefix sums and sparse tables, built at once or appended to, agree with direct computation."""
+    values = [4000.0 + (i * 37) % 101 - (i % 7) * 3.5 for i in range(200)]
+    built = RangeAggregates.build(array("d", values))
+    appended = RangeAggregates.build(array("d", values[:1]))
+    for value in values[1:]:
+        appended = appended.appended(value)
+
+    for aggregates in (built, appended):
+        for lo in range(0, 200, 7):
+            for hi in range(lo + 1, 201, 11):
+                assert aggregates.minimum(lo, hi) == min(values[lo:hi])
+                assert aggregates.maximum(lo, hi) == max(values[lo:hi])
+                assert abs(aggregates.mean(lo, hi) - sum(values[lo:hi]) / (hi - lo)) < 1e-6
+
+
+def test_export_trm_ndjson(client: TestClient, sample_trm_data):
+    """Test the NDJSON export streams the whole series oldest first."""
+    response = client.get("/v1/trm/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 5
+    assert rows[0] == {"date": "2023-01-01", "value": 4850.50}
+    assert rows[-1] == {"date": "2023-02-02", "value": 4910.50}
+
+
+def test_export_trm_csv(client: TestClient, sample_trm_data):
+    """Test the CSV export has a header and one line per record."""
+    response = client.get("/v1/trm/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    lines = response.text.splitlines()
+    assert lines[0] == "date,value"
+    assert lines[1] == "2023-01-01,4850.5"
+    assert len(lines) == 6
+
+
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+def test_trm_range_columnar_matches_json(client: TestClient, sample_trm_data, sort: str):
+    """Test the columnar page decodes to the same records as the JSON page."""
+    params = {"start_date": "2023-01-01", "end_date": "2023-12-31", "sort": sort, "page": 2, "size": 2}
+    json_page = client.get("/v1/trm/by-date-range", params=params).json()
+    response = client.get("/v1/trm/by-date-range", params=params, headers={"Accept": COLUMNAR_MEDIA_TYPE})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+    assert response.headers["x-total-count"] == str(json_page["total"])
+
+    kind, rows = columnar.decode(response.content)
+    assert kind == columnar.KIND_TRM
+    assert [{"date": row_date.isoformat(), "value": value} for row_date, value in rows] == json_page["items"]
+
+
+def test_trm_export_columnar_matches_ndjson(client: TestClient, sample_trm_data):
+    """Test the columnar export decodes to the same records as the NDJSON export."""
+    ndjson_rows = [json.loads(line) for line in client.get("/v1/trm/export").text.splitlines()]
+    response = client.get("/v1/trm/export", headers={"Accept": COLUMNAR_MEDIA_TYPE})
+
+    _, rows = columnar.decode(response.content)
+    assert [{"date": row_date.isoformat(), "value": value} for row_date, value in rows] == ndjson_rows
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("page", [1, 2, 3])
+def test_trm_fast_page_matches_response_model(descending: bool, page: int):
+    """Test the pre-serialized page body equals the one the Page[TRMData] response model produces."""
+    store = TRMStore(ttl_seconds=300)
+    series = store.replace([(date(2023, 1, day), 4800 + day / 3) for day in range(1, 8)])
+    view = SeriesView(series, 1, 7, descending=descending)
+    params = Params(page=page, size=3)
+
+    expected = Page[TRMData].model_validate(paginate(view, params)).model_dump(mode="json")
+    assert json.loads(json_page_response(view, params, trm_items).body) == expected
+
+
+def test_trm_direct_responses_carry_cache_validators(client: TestClient, sample_trm_data):
+    """Test responses built outside the response model keep ETag and Cache-Control."""
+    columnar_headers = {"Accept": COLUMNAR_MEDIA_TYPE}
+    for path, headers in [("/v1/trm", {}), ("/v1/trm/export", {}), ("/v1/trm/export", columnar_headers)]:
+        response = client.get(path, headers=headers)
+        assert response.headers["etag"]
+        assert response.headers["cache-control"].startswith("public, max-age=")
+
+        cached = client.get(path, headers={**headers, "If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304